@@ -0,0 +1,203 @@
+"""Batch runs: several report jobs over shared inputs in a process pool."""
+
+import shutil
+import tempfile
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+import logging
+
+from .domain.models import ReportJob
+from .domain.services import WeeklyAggregate
+from .infrastructure.cache import ResultCache, TransformMemo
+from .infrastructure.csv import SharedFrame, SharedFrameHandle
+from .plugins import get_plugin
+from .plugins.base import BaseReportPlugin
+
+
+logger = logging.getLogger(__name__)
+
+
+def render_job(job: ReportJob, plugin: BaseReportPlugin, aggregates: Dict[str, WeeklyAggregate]) -> Path:
+    """Write a job's output from aggregates, week-replacing into its master workbook if set."""
+    return render_job_data(job, plugin, plugin.transform_aggregates(aggregates))
+
+
+def render_job_data(job: ReportJob, plugin: BaseReportPlugin, report_data: Dict[str, Any],
+                    validate: bool = False) -> Path:
+    """Write a job's output from ``transform_aggregates`` output.
+    
+    With ``validate``, the rendered report (before any week replacement) is
+    streamed once and checked against the plugin's skeleton and expected
+    layout; a failed check raises ``ValueError``.
+    """
+    output_path = Path(job.output)
+    output_path.parent.mkdir(parents=True, exist_ok=True)
+    
+    if job.existing_excel and job.replace_weeks:
+        work_dir = Path(tempfile.mkdtemp(prefix="report-job-"))
+        try:
+            generated = work_dir / f"{job.report_type}.xlsx"
+            plugin.generate_from_report_data(report_data, generated)
+            if validate:
+                _check_output(plugin, generated, report_data)
+            plugin.replace_weeks(generated, Path(job.existing_excel), job.replace_weeks, output_path)
+        finally:
+            shutil.rmtree(work_dir, ignore_errors=True)
+    else:
+        plugin.generate_from_report_data(report_data, output_path)
+        if validate:
+            _check_output(plugin, output_path, report_data)
+    return output_path
+
+
+def _check_output(plugin: BaseReportPlugin, path: Path, report_data: Dict[str, Any]) -> None:
+    """Raise if a rendered report fails validation."""
+    validation = plugin.validate_output(path, report_data)
+    if not validation.is_valid:
+        raise ValueError(f"Rendered {plugin.name} report failed validation: {validation.summary()}")
+
+
+class BatchRunner:
+    """Runs report jobs in parallel, parsing each distinct input only once.
+    
+    Every input is parsed in this process and its columns are copied into
+    shared memory (``SharedFrame``). Worker processes receive only the
+    handles and aggregate zero-copy views, so N reports over one export hold
+    about one copy of its data. Inputs are shared between jobs whose plugins
+    parse them the same way (equal ``input_fingerprint``).
+    
+    With a ``ResultCache``, jobs whose inputs, plugin and options match an
+    earlier run are restored from it and their inputs are not parsed at
+    all. With a ``TransformMemo``, jobs that render known report data into
+    another master workbook skip parsing too. ``force`` recomputes (and
+    re-caches) every job.
+    
+    With ``validate``, every rendered report is checked in its worker with
+    a streaming read-only pass (see ``BaseReportPlugin.validate_output``);
+    a job whose report fails is reported as failed and not cached.
+    """
+    
+    def __init__(self, jobs: Iterable[ReportJob], workers: Optional[int] = None,
+                 cache: Optional[ResultCache] = None, memo: Optional[TransformMemo] = None,
+                 force: bool = False, validate: bool = True):
+        """Initialize runner; ``workers`` defaults to one process per job."""
+        self.jobs = list(jobs)
+        self.workers = workers or len(self.jobs)
+        self.cache = cache
+        self.memo = memo
+        self.force = force
+        self.validate = validate
+        self.cached: List[str] = []
+        
+        for job in self.jobs:
+            plugin_class = get_plugin(job.report_type)
+            if plugin_class is None:
+                raise ValueError(f"Job '{job.name}': report type '{job.report_type}' not found")
+            if len(job.inputs) > 1 and not plugin_class().supports_multiple_files:
+                raise ValueError(f"Job '{job.name}': {job.report_type} supports a single input file")
+            for path in job.inputs:
+                if not Path(path).exists():
+                    raise FileNotFoundError(f"Job '{job.name}': input not found: {path}")
+    
+    def run(self) -> Dict[str, Optional[Exception]]:
+        """Run every job; returns each job's error, or None if it succeeded."""
+        self.cached = []
+        keys: Dict[str, str] = {}
+        if self.cache is not None:
+            for job in self.jobs:
+                keys[job.name] = self.job_key(job)
+                if not self.force and self.cache.restore(keys[job.name], {"output": Path(job.output)}):
+                    logger.info(f"Job '{job.name}' restored {job.output} from cache")
+                    self.cached.append(job.name)
+        pending = [job for job in self.jobs if job.name not in self.cached]
+        
+        # Jobs with memoized report data only render; the rest parse shared inputs
+        memo_keys: List[Optional[str]] = []
+        job_data: List[Optional[Dict[str, Any]]] = []
+        for job in pending:
+            key = self.memo.key(get_plugin(job.report_type)(), job.inputs) if self.memo is not None else None
+            memo_keys.append(key)
+            job_data.append(self.memo.load(key) if key is not None and not self.force else None)
+        
+        shared: Dict[Tuple[Path, str], SharedFrame] = {}
+        try:
+            job_handles = [self._share_inputs(job, shared) if data is None else {}
+                           for job, data in zip(pending, job_data)]
+            job_args = (pending, job_handles, job_data, [self.memo] * len(pending), memo_keys,
+                        [self.validate] * len(pending))
+            
+            if self.workers <= 1 or len(pending) <= 1:
+                results = [_run_job_safely(*args) for args in zip(*job_args)]
+            else:
+                with ProcessPoolExecutor(max_workers=min(self.workers, len(pending))) as pool:
+                    results = list(pool.map(_run_job_safely, *job_args))
+        finally:
+            for frame in shared.values():
+                frame.close()
+        
+        errors = {name: None for name in self.cached}
+        for job, error in zip(pending, results):
+            if error is None:
+                logger.info(f"Job '{job.name}' wrote {job.output}")
+                if self.cache is not None:
+                    self.cache.store(keys[job.name], {"output": Path(job.output)})
+            else:
+                logger.error(f"Job '{job.name}' failed: {error}")
+            errors[job.name] = error
+        return {job.name: errors[job.name] for job in self.jobs}
+    
+    def job_key(self, job: ReportJob) -> str:
+        """Result cache key of a job: its inputs, plugin and week replacement."""
+        plugin: BaseReportPlugin = get_plugin(job.report_type)()
+        existing = self.cache.file_digest(job.existing_excel) if job.replace_weeks else None
+        options = {"existing_excel": existing, "replace_weeks": list(job.replace_weeks)}
+        return self.cache.key(plugin, job.inputs, options)
+    
+    def _share_inputs(self, job: ReportJob,
+                      shared: Dict[Tuple[Path, str], SharedFrame]) -> Dict[str, SharedFrameHandle]:
+        """Parse (once) and share a job's inputs; returns handles keyed by file name."""
+        plugin: BaseReportPlugin = get_plugin(job.report_type)()
+        fingerprint = plugin.input_fingerprint()
+        handles = {}
+        for path in map(Path, job.inputs):
+            key = (path.resolve(), fingerprint)
+            if key not in shared:
+                columns = self._shared_columns(key[0], fingerprint)
+                shared[key] = SharedFrame.create(plugin.read_input(path), columns)
+            handles[path.name] = shared[key].handle
+        return handles
+    
+    def _shared_columns(self, path: Path, fingerprint: str) -> List[str]:
+        """Union of the columns every job reading ``path`` this way needs."""
+        columns: List[str] = []
+        for job in self.jobs:
+            plugin = get_plugin(job.report_type)()
+            if plugin.input_fingerprint() != fingerprint:
+                continue
+            if path in {Path(p).resolve() for p in job.inputs}:
+                columns.extend(c for c in plugin.input_columns if c not in columns)
+        return columns
+
+
+def _run_job_safely(job: ReportJob, handles: Dict[str, SharedFrameHandle],
+                    report_data: Optional[Dict[str, Any]] = None, memo: Optional[TransformMemo] = None,
+                    memo_key: Optional[str] = None, validate: bool = False) -> Optional[Exception]:
+    """Aggregate a job's shared inputs (unless its report data is given), render and validate it.
+    
+    Runs in a worker process; freshly computed report data is memoized under ``memo_key``.
+    """
+    try:
+        plugin: BaseReportPlugin = get_plugin(job.report_type)()
+        if report_data is None:
+            aggregates = {}
+            for name, handle in handles.items():
+                with SharedFrame.attach(handle) as frame:
+                    aggregates[name] = plugin.aggregate_data(frame.frame)
+            report_data = plugin.transform_aggregates(aggregates)
+            if memo is not None and memo_key is not None:
+                memo.store(memo_key, report_data)
+        render_job_data(job, plugin, report_data, validate)
+        return None
+    except Exception as e:
+        return e
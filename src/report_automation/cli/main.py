@@ -2,12 +2,23 @@
 
 import click
 import logging
+import time
 from pathlib import Path
-from typing import List
+from typing import List, Optional
 
-from ..infrastructure.excel import SimpleExcelGenerator
-from ..domain.models import ProcessedData
-from ..plugins import get_plugin, list_plugins as get_plugin_list
+from ..infrastructure.aggregates import PartialAggregate, read_partial, write_partial, merge_partials
+from ..infrastructure.cache import ResultCache, TransformMemo
+from ..infrastructure.config import CachedConfigManager, default_cache_dir, load_batch_config, load_watch_config
+from ..infrastructure.csv import CSVProcessor, DatasetProfiler, TailAggregator
+from ..infrastructure.excel import SimpleExcelGenerator, WorkbookDiffer
+from ..infrastructure.export import EXPORT_FORMATS, check_export_format, export_path, write_tidy
+from ..domain.models import CampaignBatch
+from ..domain.services import CampaignDataTransformer
+from ..plugins import discover_plugins, get_plugin, list_plugins as get_plugin_list
+from ..plugins.base import ExecutionPlanner
+from ..batch import BatchRunner
+from ..session import MultiReportSession
+from ..watch import DirectoryWatcher, JobRunner, default_jobs
 
 
 # Configure logging
@@ -20,51 +31,101 @@ logger = logging.getLogger(__name__)
 
 @click.group()
 @click.option('--verbose', '-v', is_flag=True, help='Enable verbose logging')
-def cli(verbose: bool):
+@click.option('--plugin-dir', type=click.Path(exists=True, file_okay=False, path_type=Path),
+              help='Directory with additional report plugins')
+def cli(verbose: bool, plugin_dir: Path):
     """Report Automation CLI - Generate Excel reports from CSV data."""
     if verbose:
         logging.getLogger().setLevel(logging.DEBUG)
         logger.debug("Verbose logging enabled")
+    if plugin_dir:
+        discover_plugins(plugin_dir)
 
 
 @cli.command()
 @click.argument('input_csv', type=str)
 @click.argument('output_excel', type=click.Path(path_type=Path))
 @click.option('--report-type', '-t', default='a-b-report', 
-              help='Type of report to generate (default: a-b-report)')
-@click.option('--simple', is_flag=True, help='Generate simple test report')
+              help='Type of report to generate (default: a-b-report); a comma-separated '
+                   'list scans the input once and writes <output>_<type>.xlsx per report')
+@click.option('--simple', is_flag=True, help='Generate a simple per-period summary report')
 @click.option('--existing-excel', type=click.Path(exists=True, path_type=Path),
               help='Existing Excel file to update (wp-chains-2-partial only)')
 @click.option('--replace-week', type=str,
               help='Week number to replace (e.g., 01, 02, 03, 04)')
+@click.option('--workers', type=int, default=None,
+              help='Parse each input in parallel shards across this many processes')
+@click.option('--state', 'state_path', type=click.Path(path_type=Path),
+              help='Ingest state file; later runs parse only rows appended since this run')
+@click.option('--max-memory', callback=lambda ctx, param, value: _parse_size(value),
+              help='Memory budget for aggregation, e.g. 512M or 2G; partial sums spill to disk beyond it')
+@click.option('--explain', is_flag=True, help='Show the execution plan without generating the report')
+@click.option('--force', is_flag=True, help='Regenerate even if an identical earlier run is cached')
+@click.option('--cache-dir', type=click.Path(file_okay=False, path_type=Path),
+              help='Directory for cached results and report data (default: the user cache directory)')
+@click.option('--format', 'output_format', type=click.Choice(['xlsx'] + list(EXPORT_FORMATS)), default='xlsx',
+              show_default=True, help='Write the report as Excel or as tidy long-form rows in this format')
+@click.option('--also-export', multiple=True, type=click.Choice(list(EXPORT_FORMATS)),
+              help='Also write tidy rows in this format next to the output (repeatable)')
 def generate(input_csv: str, output_excel: Path, report_type: str, simple: bool,
-             existing_excel: Path, replace_week: str):
-    """Generate Excel report from CSV data."""
+             existing_excel: Path, replace_week: str, workers: int, state_path: Path, max_memory: int,
+             explain: bool, force: bool, cache_dir: Path, output_format: str, also_export: tuple):
+    """Generate Excel report (or tidy rows, see --format) from CSV data."""
     logger.info(f"Generating {report_type} report from {input_csv}")
     
     try:
-        if simple:
-            # Create simple test report
-            test_data = ProcessedData(
-                report_type=report_type,
-                time_periods=['10m', '1h', '1d'],
-                weekly_data={},
-                totals={
-                    '10m': {'sent': 100, 'delivered': 95, 'opened': 50, 'clicked': 10, 'converted': 2},
-                    '1h': {'sent': 200, 'delivered': 190, 'opened': 80, 'clicked': 15, 'converted': 3},
-                    '1d': {'sent': 150, 'delivered': 140, 'opened': 60, 'clicked': 12, 'converted': 4}
-                },
-                percentages={
-                    '10m': {'% Delivered': 95.0, '% Open': 52.6, '% Click': 20.0, '% CR': 4.0},
-                    '1h': {'% Delivered': 95.0, '% Open': 42.1, '% Click': 18.8, '% CR': 3.8},
-                    '1d': {'% Delivered': 93.3, '% Open': 42.9, '% Click': 20.0, '% CR': 6.7}
-                }
-            )
+        if (output_format != 'xlsx' or also_export) and (',' in report_type or simple):
+            click.echo("❌ --format and --also-export cannot be combined with --simple or multiple report types")
+            return
+        if output_format != 'xlsx' and (existing_excel or replace_week):
+            click.echo("❌ --existing-excel and --replace-week need --format xlsx")
+            return
+        for fmt in {output_format, *also_export} - {'xlsx'}:
+            check_export_format(fmt)
+        
+        if ',' in report_type:
+            # Several reports from one scan of the inputs
+            report_types = [t.strip() for t in report_type.split(',') if t.strip()]
+            if simple or existing_excel or replace_week or workers or state_path or max_memory or explain:
+                click.echo("❌ Multiple report types cannot be combined with --simple, --existing-excel, "
+                           "--replace-week, --workers, --state, --max-memory or --explain")
+                return
+            missing = [t for t in report_types if not get_plugin(t)]
+            if missing:
+                click.echo(f"❌ Report type '{missing[0]}' not found")
+                click.echo(f"Available: {', '.join(get_plugin_list())}")
+                return
+            
+            input_paths = _parse_input_paths(input_csv)
+            for path in input_paths:
+                if not path.exists():
+                    click.echo(f"❌ File not found: {path}")
+                    return
             
+            output_paths = {t: output_excel.with_name(f"{output_excel.stem}_{t}{output_excel.suffix}")
+                            for t in report_types}
+            with MultiReportSession(report_types, input_paths) as session:
+                session.render_all(output_paths)
+            for t, path in output_paths.items():
+                click.echo(f"✅ {t} report generated: {path}")
+        elif simple:
+            # Simple report straight from CSVProcessor output via the transformer
+            input_paths = _parse_input_paths(input_csv)
+            for path in input_paths:
+                if not path.exists():
+                    click.echo(f"❌ File not found: {path}")
+                    return
+            
+            processor = CSVProcessor()
+            batch = CampaignBatch.concat([processor.read_batch(path) for path in input_paths])
+            config = CachedConfigManager().get_config(report_type)
+            report_data = CampaignDataTransformer(config).transform_to_arrays(batch, report_type)
+            
+            output_excel.parent.mkdir(parents=True, exist_ok=True)
             generator = SimpleExcelGenerator()
-            generator.create_simple_report(test_data, output_excel)
+            generator.create_simple_report(report_data, output_excel)
             
-            click.echo(f"✅ Simple test report generated: {output_excel}")
+            click.echo(f"✅ Simple report generated: {output_excel}")
         else:
             # Get plugin
             plugin_class = get_plugin(report_type)
@@ -77,10 +138,7 @@ def generate(input_csv: str, output_excel: Path, report_type: str, simple: bool,
             plugin = plugin_class()
             
             # Parse input files
-            if ',' in input_csv:
-                input_paths = [Path(f.strip()) for f in input_csv.split(',')]
-            else:
-                input_paths = [Path(input_csv)]
+            input_paths = _parse_input_paths(input_csv)
             
             # Validate files exist
             for path in input_paths:
@@ -88,23 +146,392 @@ def generate(input_csv: str, output_excel: Path, report_type: str, simple: bool,
                     click.echo(f"❌ File not found: {path}")
                     return
             
+            # Choose in-memory, chunked or sharded reading
+            if not state_path:
+                plan = ExecutionPlanner().plan(plugin, input_paths, workers, max_memory)
+                if explain:
+                    for line in plan.describe():
+                        click.echo(line)
+                    return
+            elif explain:
+                click.echo("Mode: incremental (--state)")
+                return
+            
+            # Tidy exports written next to the output
+            exports = {fmt: export_path(output_excel, fmt) for fmt in dict.fromkeys(also_export)
+                       if fmt != output_format}
+            
+            # Reuse the outputs of an identical earlier run
+            cache = outputs = key = None
+            if not state_path:
+                if not plugin.supports_multiple_files:
+                    input_paths = input_paths[:1]
+                cache = ResultCache((cache_dir or default_cache_dir()) / "results")
+                outputs = {"output": output_excel}
+                if existing_excel and replace_week:
+                    outputs["updated"] = existing_excel.parent / f"updated_{existing_excel.name}"
+                outputs.update({f"export-{fmt}": path for fmt, path in exports.items()})
+                existing = cache.file_digest(existing_excel) if existing_excel and replace_week else None
+                key = cache.key(plugin, input_paths, {"existing_excel": existing, "replace_week": replace_week,
+                                                      "format": output_format, "exports": sorted(exports)})
+                if not force and cache.restore(key, outputs):
+                    click.echo(f"✅ {report_type} report generated: {output_excel} (cached)")
+                    for fmt, path in exports.items():
+                        click.echo(f"✅ Exported {fmt}: {path} (cached)")
+                    return
+            
             # Ensure output directory exists
             output_excel.parent.mkdir(parents=True, exist_ok=True)
             
             # Execute plugin
-            if plugin.supports_multiple_files and len(input_paths) > 1:
-                plugin.execute(input_paths, output_excel, existing_excel, replace_week)
+            if state_path:
+                tail = TailAggregator(plugin.weekly_boundaries, state_path=state_path, report_type=report_type)
+                if not plugin.supports_multiple_files:
+                    input_paths = input_paths[:1]
+                aggregates = {path.name: tail.update(path) for path in input_paths}
+                report_data = plugin.transform_aggregates(aggregates)
             else:
-                plugin.execute(input_paths[0], output_excel)
+                # One aggregation serves every layout, master workbook and export of these inputs
+                memo = TransformMemo((cache_dir or default_cache_dir()) / "transforms")
+                report_data = plugin.transform_inputs(input_paths, plan.workers, plan.max_memory, plan.chunksize,
+                                                      memo=memo, refresh=force)
+            
+            if output_format == 'xlsx':
+                if plugin.supports_week_replacement:
+                    plugin.generate_from_report_data(report_data, output_excel, existing_excel, replace_week)
+                else:
+                    plugin.generate_from_report_data(report_data, output_excel)
+            if output_format != 'xlsx' or exports:
+                tidy = plugin.tidy_report_data(report_data)
+                if output_format != 'xlsx':
+                    write_tidy(tidy, output_excel, output_format)
+                for fmt, path in exports.items():
+                    write_tidy(tidy, path, fmt)
+            if cache is not None:
+                cache.store(key, outputs)
             
             click.echo(f"✅ {report_type} report generated: {output_excel}")
-        
+            for fmt, path in exports.items():
+                click.echo(f"✅ Exported {fmt}: {path}")
+    
     except Exception as e:
         logger.error(f"Error generating report: {e}")
         click.echo(f"❌ Error: {e}", err=True)
         raise click.Abort()
 
 
+@cli.command()
+@click.argument('input_csv', type=str)
+@click.argument('partial_output', type=click.Path(path_type=Path))
+@click.option('--report-type', '-t', default='a-b-report',
+              help='Type of report the aggregates are for (default: a-b-report)')
+@click.option('--workers', type=int, default=None,
+              help='Parse each input in parallel shards across this many processes')
+@click.option('--max-memory', callback=lambda ctx, param, value: _parse_size(value),
+              help='Memory budget for aggregation, e.g. 512M or 2G; partial sums spill to disk beyond it')
+def aggregate(input_csv: str, partial_output: Path, report_type: str, workers: int, max_memory: int):
+    """Aggregate CSV export(s) into a mergeable partial-aggregate file."""
+    logger.info(f"Aggregating {input_csv} for {report_type}")
+    
+    try:
+        plugin_class = get_plugin(report_type)
+        if not plugin_class:
+            click.echo(f"❌ Report type '{report_type}' not found")
+            click.echo(f"Available: {', '.join(get_plugin_list())}")
+            return
+        plugin = plugin_class()
+        
+        input_paths = _parse_input_paths(input_csv)
+        for path in input_paths:
+            if not path.exists():
+                click.echo(f"❌ File not found: {path}")
+                return
+        
+        sections = plugin.aggregate_inputs(input_paths, workers, max_memory)
+        partial = PartialAggregate(report_type, plugin.weekly_boundaries, sections)
+        write_partial(partial_output, partial)
+        
+        click.echo(f"✅ Partial aggregate written: {partial_output} ({partial.row_count} rows)")
+    
+    except Exception as e:
+        logger.error(f"Error aggregating data: {e}")
+        click.echo(f"❌ Error: {e}", err=True)
+        raise click.Abort()
+
+
+@cli.command()
+@click.argument('partials', nargs=-1, required=True, type=click.Path(exists=True, path_type=Path))
+@click.argument('output_excel', type=click.Path(path_type=Path))
+@click.option('--existing-excel', type=click.Path(exists=True, path_type=Path),
+              help='Existing Excel file to update with the merged week')
+@click.option('--replace-week', type=str,
+              help='Week number to replace (e.g., 01, 02, 03, 04)')
+@click.option('--save-partial', type=click.Path(path_type=Path),
+              help='Also write the merged partial-aggregate file')
+def merge(partials: tuple, output_excel: Path, existing_excel: Path, replace_week: str,
+          save_partial: Path):
+    """Merge partial-aggregate files and generate the report from them."""
+    logger.info(f"Merging {len(partials)} partial aggregate(s)")
+    
+    try:
+        merged = merge_partials(read_partial(path) for path in partials)
+        
+        plugin_class = get_plugin(merged.report_type)
+        if not plugin_class:
+            click.echo(f"❌ Report type '{merged.report_type}' not found")
+            return
+        plugin = plugin_class()
+        if [tuple(b) for b in plugin.weekly_boundaries] != merged.weekly_boundaries:
+            click.echo(f"❌ Partials were computed with different week boundaries than {merged.report_type}")
+            return
+        
+        if save_partial:
+            write_partial(save_partial, merged)
+        
+        output_excel.parent.mkdir(parents=True, exist_ok=True)
+        plugin.generate_from_aggregates(merged.sections, output_excel, existing_excel, replace_week)
+        
+        click.echo(f"✅ {merged.report_type} report generated from {merged.row_count} rows: {output_excel}")
+    
+    except Exception as e:
+        logger.error(f"Error merging partials: {e}")
+        click.echo(f"❌ Error: {e}", err=True)
+        raise click.Abort()
+
+
+@cli.command()
+@click.argument('input_csv', type=str)
+@click.option('--report-type', '-t', default=None,
+              help='Report type whose template mapping is used to flag unmapped templates')
+@click.option('--chunksize', type=int, default=500_000, show_default=True,
+              help='Rows read per streaming chunk')
+@click.option('--json', 'json_output', type=click.Path(path_type=Path),
+              help='Also write the full profile as JSON to this path')
+def profile(input_csv: str, report_type: str, chunksize: int, json_output: Path):
+    """Profile CSV export(s) in one pass to triage bad data before generating."""
+    logger.info(f"Profiling {input_csv}")
+    
+    try:
+        input_paths = _parse_input_paths(input_csv)
+        for path in input_paths:
+            if not path.exists():
+                click.echo(f"❌ File not found: {path}")
+                return
+        
+        known_templates = None
+        if report_type:
+            plugin_class = get_plugin(report_type)
+            if not plugin_class:
+                click.echo(f"❌ Report type '{report_type}' not found")
+                click.echo(f"Available: {', '.join(get_plugin_list())}")
+                return
+            known_templates = plugin_class().get_template_names() or None
+        
+        result = DatasetProfiler(chunksize=chunksize).profile(input_paths, known_templates)
+        
+        click.echo(f"Rows: {result.row_count}")
+        click.echo(f"Date range: {result.min_timestamp} to {result.max_timestamp}")
+        if result.invalid_timestamps:
+            click.echo(f"Invalid timestamps: {result.invalid_timestamps}")
+        click.echo(f"Templates: {len(result.template_counts)}  Campaigns: {len(result.campaign_counts)}")
+        for template, count in sorted(result.template_counts.items(), key=lambda item: -item[1]):
+            click.echo(f"  • {template}: {count}")
+        click.echo("Metric totals: " + ", ".join(f"{k}={v}" for k, v in result.metric_totals.items()))
+        for rule, count in result.violation_counts.items():
+            if count:
+                samples = ", ".join(str(i) for i in result.violation_samples[rule])
+                click.echo(f"⚠️  {rule}: {count} rows (e.g. rows {samples})")
+        if result.duplicate_rows:
+            samples = ", ".join(str(i) for i in result.duplicate_samples)
+            click.echo(f"⚠️  Duplicate rows: {result.duplicate_rows} (e.g. rows {samples})")
+        if result.unmapped_templates:
+            click.echo(f"⚠️  Unmapped templates for {report_type}:")
+            for template, count in result.unmapped_templates.items():
+                click.echo(f"  • {template}: {count}")
+        
+        if json_output:
+            json_output.parent.mkdir(parents=True, exist_ok=True)
+            json_output.write_text(result.model_dump_json(indent=2))
+            click.echo(f"Profile written: {json_output}")
+        
+        click.echo("✅ No data issues found" if result.is_clean else "❌ Data issues found")
+    
+    except Exception as e:
+        logger.error(f"Error profiling data: {e}")
+        click.echo(f"❌ Error: {e}", err=True)
+        raise click.Abort()
+
+
+@cli.command()
+@click.argument('old_excel', type=click.Path(exists=True, dir_okay=False, path_type=Path))
+@click.argument('new_excel', type=click.Path(exists=True, dir_okay=False, path_type=Path))
+@click.option('--sheet', 'sheets', multiple=True,
+              help='Sheet to compare (repeatable; default: sheets in both workbooks)')
+@click.option('--columns', help='Column or column range to compare, e.g. BE or BE:BH (default: all)')
+@click.option('--rows', callback=lambda ctx, param, value: _parse_row_range(value),
+              help='Row range to compare, e.g. 5:2000 or 5: (default: all)')
+@click.option('--block-columns', default='B,D', show_default=True,
+              help='Comma-separated columns whose labels group rows into blocks (campaign, template)')
+@click.option('--label-column', help='Column marking data rows; their empty cells are compared too, e.g. E')
+@click.option('--expect-change', is_flag=True,
+              help='Count unchanged cells as missed, e.g. after replacing a week')
+@click.option('--tolerance', type=float, default=1e-9, show_default=True,
+              help='Largest numeric difference treated as unchanged')
+@click.option('--limit', type=int, default=20, show_default=True,
+              help='Blocks and sample cells to print')
+@click.option('--json', 'json_output', type=click.Path(path_type=Path),
+              help='Also write the full diff as JSON to this path')
+def diff(old_excel: Path, new_excel: Path, sheets: tuple, columns: str, rows: tuple, block_columns: str,
+         label_column: str, expect_change: bool, tolerance: float, limit: int, json_output: Path):
+    """Compare two workbooks cell by cell, e.g. a master before and after --replace-week.
+    
+    Reports changed, unchanged and missed cells per campaign/template block.
+    Both workbooks are streamed, so large masters compare in seconds.
+    """
+    logger.info(f"Comparing {old_excel} with {new_excel}")
+    
+    try:
+        differ = WorkbookDiffer(
+            columns=columns,
+            rows=rows,
+            block_columns=[c.strip() for c in block_columns.split(',') if c.strip()],
+            label_column=label_column,
+            expect_change=expect_change,
+            tolerance=tolerance,
+            sample_size=limit,
+        )
+        start = time.perf_counter()
+        result = differ.diff(old_excel, new_excel, list(sheets) or None)
+        elapsed = time.perf_counter() - start
+        
+        click.echo(f"Sheets: {', '.join(result.sheets)}  Columns: {result.columns or 'all'}")
+        click.echo(f"Cells: {result.cells}  Changed: {result.changed}  Unchanged: {result.unchanged}  "
+                   f"Missed: {result.missed}  ({elapsed:.2f}s)")
+        
+        # Blocks with missed cells first, then those without any change
+        flagged = [b for b in result.blocks if b.missed or (expect_change and not b.changed)]
+        if flagged:
+            click.echo(f"⚠️  Blocks with missed cells: {len(flagged)}")
+            for block in flagged[:limit]:
+                click.echo(f"  • {block.sheet} rows {block.first_row}-{block.last_row} {block.name}: "
+                           f"{block.changed} changed, {block.unchanged} unchanged, {block.missed} missed")
+            if len(flagged) > limit:
+                click.echo(f"  … {len(flagged) - limit} more")
+        for cell in result.samples:
+            click.echo(f"  {cell.status}: {cell.sheet}!{cell.coordinate} {cell.old!r} → {cell.new!r}")
+        
+        if json_output:
+            json_output.parent.mkdir(parents=True, exist_ok=True)
+            json_output.write_text(result.model_dump_json(indent=2))
+            click.echo(f"Diff written: {json_output}")
+        
+        click.echo("✅ No missed cells" if result.is_clean else "❌ Missed cells found")
+    
+    except Exception as e:
+        logger.error(f"Error comparing workbooks: {e}")
+        click.echo(f"❌ Error: {e}", err=True)
+        raise click.Abort()
+
+
+@cli.command()
+@click.argument('jobs_file', type=click.Path(exists=True, path_type=Path))
+@click.option('--workers', type=int, default=None,
+              help='Worker processes (default: from the jobs file, else one per job)')
+@click.option('--force', is_flag=True, help='Regenerate every job, ignoring cached results and report data')
+@click.option('--cache-dir', type=click.Path(file_okay=False, path_type=Path),
+              help='Directory for cached results and report data (default: the user cache directory)')
+@click.option('--cache-size', default='1G', show_default=True,
+              callback=lambda ctx, param, value: _parse_size(value),
+              help='Evict least recently used results (and, separately, report data) beyond this size')
+@click.option('--no-validate', is_flag=True, help='Skip the streaming check of each rendered report')
+def batch(jobs_file: Path, workers: int, force: bool, cache_dir: Path, cache_size: int, no_validate: bool):
+    """Run the report jobs in JOBS_FILE in parallel, parsing shared inputs once.
+    
+    Jobs whose inputs, report code, config and options match an earlier run
+    are restored from the result cache; jobs rendering known report data
+    into another master workbook reuse it without parsing. Each rendered
+    report is checked against its layout in one read-only pass.
+    """
+    logger.info(f"Running batch {jobs_file}")
+    
+    try:
+        config = load_batch_config(jobs_file)
+        if not config.jobs:
+            click.echo("❌ No report jobs to run")
+            return
+        
+        cache_root = cache_dir or default_cache_dir()
+        runner = BatchRunner(config.jobs, workers or config.workers,
+                             cache=ResultCache(cache_root / "results", cache_size),
+                             memo=TransformMemo(cache_root / "transforms", cache_size), force=force,
+                             validate=not no_validate)
+        errors = runner.run()
+        for job in config.jobs:
+            if errors[job.name] is None:
+                cached = " (cached)" if job.name in runner.cached else ""
+                click.echo(f"✅ {job.name}: {job.output}{cached}")
+            else:
+                click.echo(f"❌ {job.name}: {errors[job.name]}")
+        if any(errors.values()):
+            raise click.Abort()
+    
+    except click.Abort:
+        raise
+    except Exception as e:
+        logger.error(f"Error running batch: {e}")
+        click.echo(f"❌ Error: {e}", err=True)
+        raise click.Abort()
+
+
+@cli.command()
+@click.argument('directory', type=click.Path(exists=True, file_okay=False, path_type=Path))
+@click.option('--jobs', 'jobs_file', type=click.Path(exists=True, path_type=Path),
+              help='YAML file listing report jobs (default: one job per report type)')
+@click.option('--output-dir', type=click.Path(path_type=Path), default=Path('output'), show_default=True,
+              help='Where default jobs write <report-type>.xlsx')
+@click.option('--interval', type=float, help='Seconds between directory scans')
+@click.option('--debounce', type=float, help='Quiet seconds required before regenerating')
+@click.option('--once', is_flag=True, help='Run every job once and exit')
+@click.option('--state-dir', type=click.Path(file_okay=False, path_type=Path),
+              help='Where ingest state is kept between runs (default: the cache directory)')
+def watch(directory: Path, jobs_file: Path, output_dir: Path, interval: float, debounce: float, once: bool,
+          state_dir: Path):
+    """Regenerate reports whenever CSV exports in DIRECTORY are added or updated."""
+    logger.info(f"Watching {directory}")
+    
+    try:
+        config = load_watch_config(jobs_file) if jobs_file else None
+        jobs = config.jobs if config else default_jobs(output_dir)
+        interval = interval or (config.poll_interval if config else 2.0)
+        debounce = debounce if debounce is not None else (config.debounce if config else 5.0)
+        if not jobs:
+            click.echo("❌ No report jobs to run")
+            return
+        
+        runner = JobRunner(directory, jobs, state_dir=state_dir or default_cache_dir() / "ingest")
+        watcher = DirectoryWatcher(directory, debounce)
+        for job in runner.run_all():
+            click.echo(f"✅ {job.name}: {job.output}")
+        if once:
+            return
+        
+        click.echo(f"Watching {directory} for {len(jobs)} job(s) (Ctrl+C to stop)")
+        while True:
+            changed = watcher.poll()
+            if changed:
+                click.echo(f"Changed: {', '.join(path.name for path in changed)}")
+                for job in runner.run(changed):
+                    click.echo(f"✅ {job.name}: {job.output}")
+            time.sleep(interval)
+    
+    except KeyboardInterrupt:
+        click.echo("Stopped watching")
+    except Exception as e:
+        logger.error(f"Error in watch mode: {e}")
+        click.echo(f"❌ Error: {e}", err=True)
+        raise click.Abort()
+
+
 @cli.command()
 def list_reports():
     """List available report types."""
@@ -131,13 +558,48 @@ def test(output_path: Path):
         generator.create_basic_workbook(output_path)
         
         click.echo(f"✅ Test Excel file created: {output_path}")
-        
+    
     except Exception as e:
         logger.error(f"Error creating test file: {e}")
         click.echo(f"❌ Error: {e}", err=True)
         raise click.Abort()
 
 
+def _parse_size(value: Optional[str]) -> Optional[int]:
+    """Parse a byte size such as ``1500000``, ``512M`` or ``2G``."""
+    if value is None:
+        return None
+    units = {'K': 1024, 'M': 1024 ** 2, 'G': 1024 ** 3}
+    text = value.strip().upper().rstrip('B')
+    try:
+        if text and text[-1] in units:
+            return int(float(text[:-1]) * units[text[-1]])
+        return int(text)
+    except ValueError:
+        raise click.BadParameter(f"Invalid size '{value}'; use e.g. 512M or 2G")
+
+
+def _parse_row_range(value: Optional[str]) -> Optional[tuple]:
+    """Parse a row range such as ``5:2000`` or ``5:`` into ``(start, end or None)``."""
+    if not value:
+        return None
+    start, _, end = value.partition(':')
+    try:
+        first, last = int(start or 1), int(end) if end else None
+    except ValueError:
+        raise click.BadParameter(f"Invalid row range '{value}'; use e.g. 5:2000 or 5:")
+    if first < 1 or (last is not None and last < first):
+        raise click.BadParameter(f"Invalid row range '{value}'; use e.g. 5:2000 or 5:")
+    return first, last
+
+
+def _parse_input_paths(input_csv: str) -> List[Path]:
+    """Split a comma-separated list of input files into paths."""
+    if ',' in input_csv:
+        return [Path(f.strip()) for f in input_csv.split(',')]
+    return [Path(input_csv)]
+
+
 def main():
     """Main entry point for the CLI."""
     cli()
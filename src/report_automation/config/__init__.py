@@ -0,0 +1,5 @@
+"""Packaged report specifications (YAML)."""
+
+from pathlib import Path
+
+REPORTS_DIR = Path(__file__).parent / "reports"
@@ -1,12 +1,13 @@
 """Abstract interfaces for core services."""
 
-from .data import DataProcessor, DataTransformer, ReportGenerator
+from .data import CampaignRows, DataProcessor, DataTransformer, ReportGenerator
 from .config import ConfigLoader, ConfigManager
 from .plugin import ReportPlugin, PluginRegistry, PluginLoader
 from .excel import ExcelGenerator, ExcelFormatter, ExcelValidator
 
 __all__ = [
     # Data processing interfaces
+    "CampaignRows",
     "DataProcessor",
     "DataTransformer", 
     "ReportGenerator",
@@ -2,8 +2,12 @@
 
 from abc import ABC, abstractmethod
 from pathlib import Path
-from typing import List, Dict, Any
-from ..models import CampaignData, ProcessedData
+from typing import List, Dict, Any, Union
+from ..models import CampaignData, CampaignBatch, ProcessedData
+
+
+# Row-model lists and columnar batches are accepted interchangeably
+CampaignRows = Union[List[CampaignData], CampaignBatch]
 
 
 class DataProcessor(ABC):
@@ -15,17 +19,22 @@ class DataProcessor(ABC):
         pass
     
     @abstractmethod
-    def validate_data(self, data: List[CampaignData]) -> bool:
+    def read_batch(self, file_path: Path) -> CampaignBatch:
+        """Read and validate CSV data into a columnar CampaignBatch."""
+        pass
+    
+    @abstractmethod
+    def validate_data(self, data: CampaignRows) -> bool:
         """Validate campaign data meets business requirements."""
         pass
     
     @abstractmethod
-    def filter_by_brand(self, data: List[CampaignData], brand: str) -> List[CampaignData]:
+    def filter_by_brand(self, data: CampaignRows, brand: str) -> CampaignRows:
         """Filter campaign data by brand patterns."""
         pass
     
     @abstractmethod
-    def filter_by_time_period(self, data: List[CampaignData], period: str) -> List[CampaignData]:
+    def filter_by_time_period(self, data: CampaignRows, period: str) -> CampaignRows:
         """Filter campaign data by time period."""
         pass
 
@@ -34,7 +43,7 @@ class DataTransformer(ABC):
     """Abstract interface for transforming campaign data."""
     
     @abstractmethod
-    def aggregate_by_weeks(self, data: List[CampaignData], boundaries: List[tuple]) -> Dict[str, Dict[str, int]]:
+    def aggregate_by_weeks(self, data: CampaignRows, boundaries: List[tuple]) -> Dict[str, Dict[str, int]]:
         """Aggregate campaign data by weekly boundaries."""
         pass
     
@@ -44,7 +53,7 @@ class DataTransformer(ABC):
         pass
     
     @abstractmethod
-    def transform_for_report(self, data: List[CampaignData], report_type: str) -> ProcessedData:
+    def transform_for_report(self, data: CampaignRows, report_type: str) -> ProcessedData:
         """Transform raw data into report-ready format."""
         pass
 
@@ -2,8 +2,8 @@
 
 from abc import ABC, abstractmethod
 from pathlib import Path
-from typing import Dict, List, Any, Optional
-from ..models import ProcessedData, WorksheetLayout, ExcelReport
+from typing import Dict, List, Any, Optional, Union
+from ..models import ArrayProcessedData, ProcessedData, WorksheetLayout, ExcelReport
 
 
 class ExcelGenerator(ABC):
@@ -20,7 +20,7 @@ class ExcelGenerator(ABC):
         pass
     
     @abstractmethod
-    def populate_data(self, worksheet: Any, data: ProcessedData) -> None:
+    def populate_data(self, worksheet: Any, data: Union[ProcessedData, ArrayProcessedData]) -> None:
         """Populate worksheet with processed data."""
         pass
     
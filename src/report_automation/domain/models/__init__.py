@@ -1,21 +1,29 @@
 """Data models for the report automation system."""
 
-from .campaign import CampaignData, ReportConfig, ExcelLayout, MetricCalculation, ProcessedData
-from .config import TemplateMapping, WeeklyBoundary, ColumnMapping, ReportSpecification
+from .campaign import CampaignData, CampaignBatch, ReportConfig, ExcelLayout, MetricCalculation, ProcessedData, ArrayProcessedData
+from .config import TemplateMapping, WeeklyBoundary, ColumnMapping, CalendarRule, ColumnRule, ReportSpecification
 from .excel import CellPosition, CellStyle, ExcelSection, WorksheetLayout, ExcelReport
+from .profile import DatasetProfile
+from .diff import BlockDiff, CellDiff, WorkbookDiff
+from .validation import ValidationIssue, WorkbookValidation
+from .job import BatchConfig, ReportJob, WatchConfig
 
 __all__ = [
     # Campaign models
     "CampaignData",
+    "CampaignBatch",
     "ReportConfig", 
     "ExcelLayout",
     "MetricCalculation",
     "ProcessedData",
+    "ArrayProcessedData",
     
     # Configuration models
     "TemplateMapping",
     "WeeklyBoundary",
     "ColumnMapping", 
+    "CalendarRule",
+    "ColumnRule",
     "ReportSpecification",
     
     # Excel models
@@ -24,4 +32,21 @@ __all__ = [
     "ExcelSection",
     "WorksheetLayout",
     "ExcelReport",
+    
+    # Profiling models
+    "DatasetProfile",
+    
+    # Workbook diff models
+    "BlockDiff",
+    "CellDiff",
+    "WorkbookDiff",
+    
+    # Validation models
+    "ValidationIssue",
+    "WorkbookValidation",
+    
+    # Batch and watch mode models
+    "BatchConfig",
+    "ReportJob",
+    "WatchConfig",
 ]
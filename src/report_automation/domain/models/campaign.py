@@ -1,7 +1,10 @@
 """Core data models for campaign data and report processing."""
 
+from collections import abc
 from datetime import datetime
-from typing import Dict, List, Optional, Tuple, Any
+from typing import Dict, Iterator, List, Mapping, Optional, Sequence, Tuple, Any
+import numpy as np
+import pandas as pd
 from pydantic import BaseModel, Field, validator
 
 
@@ -36,6 +39,154 @@ class CampaignData(BaseModel):
         return v
 
 
+class CampaignBatch:
+    """Columnar batch of CSV campaign rows.
+    
+    Holds the same fields as ``CampaignData`` as one pandas column per field
+    (struct of arrays) instead of one model per row, so millions of rows can
+    be validated, filtered and aggregated without per-row Python objects.
+    Validation enforces the ``CampaignData`` field constraints and validators
+    for every row at once.
+    """
+    
+    STRING_FIELDS = ["template_id", "template_name", "campaign_name"]
+    METRIC_FIELDS = ["sent", "delivered", "opened", "clicked", "converted", "bounced", "unsubscribed"]
+    FIELDS = ["timestamp", "timestamp_rfc3339"] + STRING_FIELDS + METRIC_FIELDS
+    
+    # (field, upper bound field) pairs mirroring the CampaignData validators
+    ORDER_RULES = [("delivered", "sent"), ("opened", "delivered")]
+    
+    def __init__(self, frame: pd.DataFrame, validate: bool = True):
+        """Wrap a frame with one column per ``CampaignData`` field."""
+        missing = [name for name in self.FIELDS if name not in frame.columns and name != "timestamp_rfc3339"]
+        if missing:
+            raise ValueError(f"Missing batch columns: {missing}")
+        
+        columns = {"timestamp": _naive_datetimes(frame["timestamp"])}
+        if "timestamp_rfc3339" in frame.columns:
+            rfc3339 = frame["timestamp_rfc3339"].astype(object)
+            columns["timestamp_rfc3339"] = rfc3339.where(rfc3339.notna(), None)
+        else:
+            columns["timestamp_rfc3339"] = pd.Series(None, index=frame.index, dtype=object)
+        for name in self.STRING_FIELDS:
+            columns[name] = frame[name].astype(str)
+        for name in self.METRIC_FIELDS:
+            if frame[name].isna().any():
+                raise ValueError(f"{name} contains missing values")
+            columns[name] = frame[name].astype(np.int64)
+        
+        self._frame = pd.DataFrame(columns).reset_index(drop=True)
+        if validate:
+            self.validate()
+    
+    @classmethod
+    def from_frame(cls, frame: pd.DataFrame, drop_invalid: bool = False) -> "CampaignBatch":
+        """Build a batch from raw CSV columns, optionally dropping invalid rows.
+        
+        Accepts the export's ``timestamp_RFC3339`` spelling. With
+        ``drop_invalid`` rows that would fail ``CampaignData`` validation are
+        skipped (as ``CSVProcessor.read_csv`` does) instead of raising.
+        """
+        frame = frame.rename(columns={"timestamp_RFC3339": "timestamp_rfc3339"})
+        if drop_invalid:
+            frame = frame.dropna(subset=[name for name in cls.METRIC_FIELDS if name in frame.columns])
+        batch = cls(frame, validate=not drop_invalid)
+        if drop_invalid:
+            invalid = batch.invalid_rows()
+            if invalid.any():
+                batch = batch.take(np.flatnonzero(~invalid))
+        return batch
+    
+    @classmethod
+    def from_records(cls, records: Sequence[CampaignData]) -> "CampaignBatch":
+        """Convert already validated row models into a batch."""
+        frame = pd.DataFrame(
+            [record.dict() for record in records],
+            columns=cls.FIELDS
+        )
+        return cls(frame, validate=False)
+    
+    @classmethod
+    def concat(cls, batches: Sequence["CampaignBatch"]) -> "CampaignBatch":
+        """Stack already validated batches into one."""
+        batch = object.__new__(cls)
+        if not batches:
+            batch._frame = pd.DataFrame(columns=cls.FIELDS)
+        else:
+            batch._frame = pd.concat([b.frame for b in batches], ignore_index=True)
+        return batch
+    
+    def to_records(self) -> List[CampaignData]:
+        """Materialize the batch as ``CampaignData`` models."""
+        return [CampaignData(**row) for row in self._frame.to_dict('records')]
+    
+    def invalid_rows(self) -> np.ndarray:
+        """Boolean mask of rows that would fail ``CampaignData`` validation."""
+        invalid = np.zeros(len(self), dtype=bool)
+        for name in self.METRIC_FIELDS:
+            invalid |= self._frame[name].to_numpy() < 0
+        for name, bound in self.ORDER_RULES:
+            invalid |= self._frame[name].to_numpy() > self._frame[bound].to_numpy()
+        invalid |= self._frame["timestamp"].isna().to_numpy()
+        return invalid
+    
+    def validate(self) -> None:
+        """Raise ``ValueError`` naming the first violated rule and its rows."""
+        if self._frame["timestamp"].isna().any():
+            rows = np.flatnonzero(self._frame["timestamp"].isna().to_numpy())
+            raise ValueError(f"timestamp is missing in {len(rows)} rows (first row {rows[0]})")
+        for name in self.METRIC_FIELDS:
+            rows = np.flatnonzero(self._frame[name].to_numpy() < 0)
+            if len(rows):
+                raise ValueError(f"{name} must be >= 0 in {len(rows)} rows (first row {rows[0]})")
+        for name, bound in self.ORDER_RULES:
+            rows = np.flatnonzero(self._frame[name].to_numpy() > self._frame[bound].to_numpy())
+            if len(rows):
+                raise ValueError(
+                    f"{name} cannot be greater than {bound} in {len(rows)} rows (first row {rows[0]})"
+                )
+    
+    def take(self, indices: np.ndarray) -> "CampaignBatch":
+        """Return the rows at ``indices`` as a new batch."""
+        batch = object.__new__(type(self))
+        batch._frame = self._frame.take(np.asarray(indices, dtype=np.int64)).reset_index(drop=True)
+        return batch
+    
+    def column(self, name: str) -> np.ndarray:
+        """Return one field as a NumPy array."""
+        if name not in self.FIELDS:
+            raise KeyError(f"Unknown batch column: {name}")
+        return self._frame[name].to_numpy()
+    
+    @property
+    def frame(self) -> pd.DataFrame:
+        """Underlying columns; treat as read-only."""
+        return self._frame
+    
+    @property
+    def nbytes(self) -> int:
+        """Approximate memory held by the batch columns."""
+        return int(self._frame.memory_usage(deep=True).sum())
+    
+    def __len__(self) -> int:
+        return len(self._frame)
+    
+    def __iter__(self) -> Iterator[CampaignData]:
+        for row in self._frame.to_dict('records'):
+            yield CampaignData(**row)
+    
+    def __repr__(self) -> str:
+        return f"CampaignBatch(rows={len(self)})"
+
+
+def _naive_datetimes(values: pd.Series) -> pd.Series:
+    """Parse timestamps and drop timezone info, as the row reader does."""
+    values = pd.to_datetime(values)
+    if values.dt.tz is not None:
+        values = values.dt.tz_localize(None)
+    return values
+
+
 class ReportConfig(BaseModel):
     """Configuration for report generation."""
     
@@ -125,3 +276,171 @@ class ProcessedData(BaseModel):
         default_factory=dict,
         description="Additional metadata about the processing"
     )
+
+
+class ArrayProcessedData:
+    """Array-backed variant of ``ProcessedData``.
+    
+    Stores metrics as dense arrays labelled by period, week and metric:
+    ``weekly`` is (periods x weeks x metrics), ``totals_array`` is
+    (periods x metrics) and ``percentages_array`` is (periods x percentage
+    metrics, NaN where absent). Construction checks shapes and dtypes once
+    instead of every leaf value; ``weekly_data``, ``totals`` and
+    ``percentages`` are read-only nested views shaped like the
+    ``ProcessedData`` dicts.
+    """
+    
+    def __init__(self, report_type: str, time_periods: List[str], weeks: List[str],
+                 metrics: List[str], weekly: np.ndarray, totals: Optional[np.ndarray] = None,
+                 percentage_metrics: Optional[List[str]] = None,
+                 percentages: Optional[np.ndarray] = None,
+                 metadata: Optional[Dict[str, Any]] = None):
+        """Wrap metric arrays; ``totals`` defaults to the sum over weeks."""
+        self.report_type = report_type
+        self.time_periods = list(time_periods)
+        self.weeks = list(weeks)
+        self.metrics = list(metrics)
+        self.percentage_metrics = list(percentage_metrics or [])
+        self.metadata = dict(metadata or {})
+        
+        self.weekly = _integer_array("weekly", weekly, (len(self.time_periods), len(self.weeks), len(self.metrics)))
+        if totals is None:
+            totals = self.weekly.sum(axis=1)
+        self.totals_array = _integer_array("totals", totals, (len(self.time_periods), len(self.metrics)))
+        
+        shape = (len(self.time_periods), len(self.percentage_metrics))
+        if percentages is None:
+            percentages = np.full(shape, np.nan)
+        percentages = np.asarray(percentages, dtype=np.float64)
+        if percentages.shape != shape:
+            raise ValueError(f"percentages must have shape {shape}, got {percentages.shape}")
+        self.percentages_array = percentages
+        
+        for name, labels in [("time_periods", self.time_periods), ("weeks", self.weeks),
+                             ("metrics", self.metrics), ("percentage_metrics", self.percentage_metrics)]:
+            if len(set(labels)) != len(labels):
+                raise ValueError(f"{name} labels must be unique")
+    
+    @property
+    def weekly_data(self) -> Mapping[str, Mapping[str, Mapping[str, int]]]:
+        """View: time_period -> week -> metric -> value."""
+        return _ArrayView([self.time_periods, self.weeks, self.metrics], self.weekly)
+    
+    @property
+    def totals(self) -> Mapping[str, Mapping[str, int]]:
+        """View: time_period -> metric -> value."""
+        return _ArrayView([self.time_periods, self.metrics], self.totals_array)
+    
+    @property
+    def percentages(self) -> Mapping[str, Mapping[str, float]]:
+        """View: time_period -> metric -> percentage, skipping absent (NaN) values."""
+        return _ArrayView([self.time_periods, self.percentage_metrics], self.percentages_array)
+    
+    def to_processed_data(self) -> ProcessedData:
+        """Copy the arrays into a dict-based ``ProcessedData``."""
+        return ProcessedData(
+            report_type=self.report_type,
+            time_periods=self.time_periods,
+            weekly_data=_to_dict(self.weekly_data),
+            totals=_to_dict(self.totals),
+            percentages=_to_dict(self.percentages),
+            metadata=self.metadata
+        )
+    
+    @classmethod
+    def from_processed_data(cls, data: ProcessedData) -> "ArrayProcessedData":
+        """Pack a dict-based ``ProcessedData``; missing counts become 0."""
+        weeks = _labels(week for period in data.weekly_data.values() for week in period)
+        metrics = _labels(
+            [metric for period in data.weekly_data.values() for week in period.values() for metric in week]
+            + [metric for period in data.totals.values() for metric in period]
+        )
+        percentage_metrics = _labels(metric for period in data.percentages.values() for metric in period)
+        
+        periods = list(data.time_periods)
+        unknown = [p for p in _labels(list(data.weekly_data) + list(data.totals) + list(data.percentages))
+                   if p not in periods]
+        if unknown:
+            raise ValueError(f"Periods not listed in time_periods: {unknown}")
+        period_index = {period: i for i, period in enumerate(periods)}
+        week_index = {week: i for i, week in enumerate(weeks)}
+        metric_index = {metric: i for i, metric in enumerate(metrics)}
+        percentage_index = {metric: i for i, metric in enumerate(percentage_metrics)}
+        
+        weekly = np.zeros((len(periods), len(weeks), len(metrics)), dtype=np.int64)
+        for period, period_weeks in data.weekly_data.items():
+            for week, values in period_weeks.items():
+                for metric, value in values.items():
+                    weekly[period_index[period], week_index[week], metric_index[metric]] = value
+        totals = np.zeros((len(periods), len(metrics)), dtype=np.int64)
+        for period, values in data.totals.items():
+            for metric, value in values.items():
+                totals[period_index[period], metric_index[metric]] = value
+        percentages = np.full((len(periods), len(percentage_metrics)), np.nan)
+        for period, values in data.percentages.items():
+            for metric, value in values.items():
+                percentages[period_index[period], percentage_index[metric]] = value
+        
+        return cls(data.report_type, periods, weeks, metrics, weekly, totals,
+                   percentage_metrics, percentages, data.metadata)
+    
+    def __repr__(self) -> str:
+        return (f"ArrayProcessedData(report_type={self.report_type!r}, periods={len(self.time_periods)}, "
+                f"weeks={len(self.weeks)}, metrics={len(self.metrics)})")
+
+
+class _ArrayView(abc.Mapping):
+    """Read-only nested mapping over an array with one label list per axis."""
+    
+    def __init__(self, labels: List[List[str]], values: np.ndarray):
+        self._labels = labels
+        self._values = values
+        self._index = {label: i for i, label in enumerate(labels[0])}
+    
+    def __getitem__(self, key: str) -> Any:
+        value = self._values[self._index[key]]
+        if len(self._labels) > 1:
+            return _ArrayView(self._labels[1:], value)
+        if isinstance(value, np.floating) and np.isnan(value):
+            raise KeyError(key)
+        return value.item()
+    
+    def __iter__(self) -> Iterator[str]:
+        for label in self._labels[0]:
+            if label in self:
+                yield label
+    
+    def __len__(self) -> int:
+        return sum(1 for _ in self)
+    
+    def __contains__(self, key: object) -> bool:
+        if key not in self._index:
+            return False
+        if len(self._labels) > 1:
+            return True
+        value = self._values[self._index[key]]
+        return not (isinstance(value, np.floating) and np.isnan(value))
+    
+    def __repr__(self) -> str:
+        return repr(_to_dict(self))
+
+
+def _integer_array(name: str, values: Any, shape: Tuple[int, ...]) -> np.ndarray:
+    """Check an array's shape and that it holds whole numbers, as int64."""
+    values = np.asarray(values)
+    if values.shape != shape:
+        raise ValueError(f"{name} must have shape {shape}, got {values.shape}")
+    if values.dtype.kind not in "iub":
+        if values.dtype.kind != "f" or not np.array_equal(values, np.round(values)):
+            raise ValueError(f"{name} must contain integer values")
+    return values.astype(np.int64, copy=False)
+
+
+def _labels(values) -> List[str]:
+    """Unique labels in order of first appearance."""
+    return list(dict.fromkeys(values))
+
+
+def _to_dict(view: Mapping) -> Dict[str, Any]:
+    """Materialize a nested view as plain dicts."""
+    return {key: _to_dict(value) if isinstance(value, abc.Mapping) else value for key, value in view.items()}
@@ -10,6 +10,7 @@ class TemplateMapping(BaseModel):
     source_template: str = Field(description="Original template name from CSV")
     target_period: str = Field(description="Mapped time period (e.g., '1d', '3d')")
     brand: Optional[str] = Field(default=None, description="Associated brand")
+    group: Optional[str] = Field(default=None, description="Mapping group for reports with several input kinds")
 
 
 class WeeklyBoundary(BaseModel):
@@ -46,16 +47,97 @@ class ColumnMapping(BaseModel):
         return v
 
 
+class CalendarRule(BaseModel):
+    """Rule generating consecutive report weeks."""
+    
+    rule: str = Field(description="'iso', 'custom' or 'rolling'")
+    weeks: int = Field(ge=1, le=520, description="Number of weeks")
+    start: Optional[str] = Field(default=None, description="First week start (custom), YYYY-MM-DD")
+    end: Optional[str] = Field(default=None, description="Date inside the last week (rolling), YYYY-MM-DD or 'today'")
+    year: Optional[int] = Field(default=None, description="ISO year of the first week (iso)")
+    first_week: Optional[int] = Field(default=1, ge=1, le=53, description="ISO week number of the first week (iso)")
+    week_start: str = Field(default="monday", description="Weekday weeks start on (rolling)")
+
+    @validator('rule')
+    def validate_rule(cls, v):
+        """Validate calendar rule name."""
+        allowed_rules = ["iso", "custom", "rolling"]
+        if v not in allowed_rules:
+            raise ValueError(f'rule must be one of {allowed_rules}')
+        return v
+
+    @validator('week_start')
+    def validate_week_start(cls, v):
+        """Validate weekday name."""
+        weekdays = ["monday", "tuesday", "wednesday", "thursday", "friday", "saturday", "sunday"]
+        if v.lower() not in weekdays:
+            raise ValueError(f'week_start must be one of {weekdays}')
+        return v.lower()
+
+    @validator('week_start', always=True)
+    def validate_rule_fields(cls, v, values):
+        """Validate the fields required by the chosen rule are present."""
+        rule = values.get('rule')
+        if rule == "custom" and not values.get('start'):
+            raise ValueError("custom calendar requires 'start'")
+        if rule == "iso" and not values.get('year'):
+            raise ValueError("iso calendar requires 'year'")
+        if rule == "rolling" and not values.get('end'):
+            raise ValueError("rolling calendar requires 'end'")
+        return v
+
+
+class ColumnRule(BaseModel):
+    """Rule generating one Excel column per week."""
+    
+    first: str = Field(description="Column letter of week 1")
+    step: int = Field(default=1, description="Column offset between consecutive weeks")
+
+    @validator('first')
+    def validate_column_letter(cls, v):
+        """Validate column letter format."""
+        if not v.isalpha() or not v.isupper():
+            raise ValueError('Column letter must be uppercase alphabetic')
+        return v
+
+
 class ReportSpecification(BaseModel):
     """Complete specification for a report type."""
     
     name: str = Field(description="Report type name")
     description: str = Field(description="Report description")
     template_mappings: List[TemplateMapping] = Field(description="Template to period mappings")
-    weekly_boundaries: List[WeeklyBoundary] = Field(description="Weekly boundary definitions")
-    column_mappings: List[ColumnMapping] = Field(description="Excel column mappings")
+    weekly_boundaries: List[WeeklyBoundary] = Field(
+        default_factory=list,
+        description="Explicit weekly boundary definitions (ignored when calendar is set)"
+    )
+    column_mappings: List[ColumnMapping] = Field(default_factory=list, description="Excel column mappings")
+    calendar: Optional[CalendarRule] = Field(default=None, description="Rule generating the report weeks")
+    week_columns: Optional[ColumnRule] = Field(
+        default=None,
+        description="Rule generating week columns of the generated workbook"
+    )
+    replace_columns: Optional[ColumnRule] = Field(
+        default=None,
+        description="Rule generating week columns of the master workbook for week replacement"
+    )
     time_periods: List[str] = Field(description="Supported time periods")
     brands: List[str] = Field(default=["Casino A", "Sport B"], description="Supported brands")
+    input_patterns: List[str] = Field(
+        default_factory=list,
+        description="Filename glob per input section, used to route exported files to this report"
+    )
+    
+    # Report layout
+    target_sheet: Optional[str] = Field(default=None, description="Master workbook sheet for week replacement")
+    timing_blocks: Dict[str, Dict[str, List[int]]] = Field(
+        default_factory=dict,
+        description="Time period -> section -> [first row, last row]"
+    )
+    target_labels: Dict[str, str] = Field(
+        default_factory=dict,
+        description="Time period -> template label in the master workbook"
+    )
     
     # Business rules
     aggregation_method: str = Field(default="sum", description="Metric aggregation method")
@@ -71,7 +153,7 @@ class ReportSpecification(BaseModel):
     @validator('time_periods')
     def validate_time_periods(cls, v):
         """Validate time periods are in expected format."""
-        valid_patterns = ['m', 'h', 'd']
+        valid_patterns = ['m', 'min', 'h', 'd']
         for period in v:
             if not any(period.endswith(pattern) for pattern in valid_patterns):
                 raise ValueError(f'Invalid time period format: {period}')
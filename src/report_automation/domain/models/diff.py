@@ -0,0 +1,62 @@
+"""Workbook comparison models for verifying week replacement."""
+
+from typing import Any, List, Optional
+from pydantic import BaseModel, Field
+
+
+CHANGED = "changed"
+UNCHANGED = "unchanged"
+MISSED = "missed"
+
+
+class CellDiff(BaseModel):
+    """One compared cell that changed or was missed."""
+    
+    sheet: str = Field(..., description="Worksheet name")
+    coordinate: str = Field(..., description="Cell coordinate, e.g. BE12")
+    status: str = Field(..., description="changed or missed")
+    old: Any = Field(default=None, description="Value in the old workbook")
+    new: Any = Field(default=None, description="Value in the new workbook")
+
+
+class BlockDiff(BaseModel):
+    """Cell counts of one campaign/template block of rows."""
+    
+    sheet: str = Field(..., description="Worksheet name")
+    labels: List[Optional[str]] = Field(default_factory=list, description="Block column labels, e.g. campaign and template")
+    first_row: int = Field(..., ge=1, description="First row of the block")
+    last_row: int = Field(..., ge=1, description="Last compared row of the block")
+    changed: int = Field(default=0, ge=0, description="Cells whose value differs")
+    unchanged: int = Field(default=0, ge=0, description="Cells with the same value")
+    missed: int = Field(default=0, ge=0, description="Cells emptied, or not changed although expected to")
+    
+    @property
+    def name(self) -> str:
+        """Block labels joined for display."""
+        return " / ".join(label for label in self.labels if label) or "(no label)"
+
+
+class WorkbookDiff(BaseModel):
+    """Result of comparing chosen sheets and columns of two workbooks."""
+    
+    old_file: str = Field(..., description="Old workbook path")
+    new_file: str = Field(..., description="New workbook path")
+    sheets: List[str] = Field(default_factory=list, description="Compared sheet names")
+    columns: Optional[str] = Field(default=None, description="Compared column range (all if empty)")
+    expect_change: bool = Field(default=False, description="Whether unchanged cells count as missed")
+    cells: int = Field(default=0, ge=0, description="Compared cells")
+    changed: int = Field(default=0, ge=0, description="Cells whose value differs")
+    unchanged: int = Field(default=0, ge=0, description="Cells with the same value")
+    missed: int = Field(default=0, ge=0, description="Cells emptied, or not changed although expected to")
+    blocks: List[BlockDiff] = Field(default_factory=list, description="Counts per campaign/template block")
+    samples: List[CellDiff] = Field(
+        default_factory=list,
+        description="First changed and missed cells, up to the sample size"
+    )
+    
+    @property
+    def is_clean(self) -> bool:
+        """Whether no cell was missed (and, when changes are expected, every block changed)."""
+        if self.missed:
+            return False
+        return not self.expect_change or all(block.changed for block in self.blocks)
@@ -0,0 +1,55 @@
+"""Report job models for batch and watch mode."""
+
+from typing import List, Optional
+from pydantic import BaseModel, Field, validator
+
+
+class ReportJob(BaseModel):
+    """One output regenerated from files dropped into a watched directory."""
+    
+    name: str = Field(description="Job identifier used in logs")
+    report_type: str = Field(description="Report plugin name")
+    output: str = Field(description="Path of the generated (or updated) workbook")
+    input_patterns: List[str] = Field(
+        default_factory=list,
+        description="Filename glob per input section; defaults to the report's input_patterns"
+    )
+    inputs: List[str] = Field(default_factory=list, description="Input files of a batch run")
+    existing_excel: Optional[str] = Field(default=None, description="Master workbook to week-replace into")
+    replace_weeks: List[str] = Field(default_factory=list, description="Week numbers to replace, e.g. ['05']")
+    
+    @validator('replace_weeks', each_item=True)
+    def validate_week(cls, v):
+        """Validate week numbers are two-digit strings."""
+        if not (v.isdigit() and len(v) == 2):
+            raise ValueError(f'Week must be a two-digit number, got {v!r}')
+        return v
+    
+    @validator('replace_weeks')
+    def validate_replacement(cls, v, values):
+        """Validate week replacement has a master workbook to write into."""
+        if v and not values.get('existing_excel'):
+            raise ValueError('replace_weeks requires existing_excel')
+        return v
+
+
+class BatchConfig(BaseModel):
+    """Report jobs run together over shared inputs."""
+    
+    jobs: List[ReportJob] = Field(default_factory=list, description="Report jobs")
+    workers: Optional[int] = Field(default=None, gt=0, description="Worker processes (default: one per job)")
+    
+    @validator('jobs', each_item=True)
+    def validate_inputs(cls, v):
+        """Validate every batch job lists its input files."""
+        if not v.inputs:
+            raise ValueError(f"Job '{v.name}' has no inputs")
+        return v
+
+
+class WatchConfig(BaseModel):
+    """Watch mode settings and the jobs to run."""
+    
+    jobs: List[ReportJob] = Field(default_factory=list, description="Report jobs")
+    poll_interval: float = Field(default=2.0, gt=0, description="Seconds between directory scans")
+    debounce: float = Field(default=5.0, ge=0, description="Quiet seconds required after the last write")
@@ -0,0 +1,54 @@
+"""Dataset profile models for triaging CSV exports."""
+
+from datetime import datetime
+from typing import Dict, List, Optional
+from pydantic import BaseModel, Field
+
+
+class DatasetProfile(BaseModel):
+    """Summary of a campaign export computed in a single pass."""
+    
+    source_files: List[str] = Field(default_factory=list, description="Profiled file names")
+    row_count: int = Field(default=0, ge=0, description="Total number of data rows")
+    min_timestamp: Optional[datetime] = Field(default=None, description="Earliest row timestamp")
+    max_timestamp: Optional[datetime] = Field(default=None, description="Latest row timestamp")
+    invalid_timestamps: int = Field(default=0, ge=0, description="Rows with unparseable timestamps")
+    template_counts: Dict[str, int] = Field(
+        default_factory=dict,
+        description="Row count per template name"
+    )
+    campaign_counts: Dict[str, int] = Field(
+        default_factory=dict,
+        description="Row count per campaign name"
+    )
+    metric_totals: Dict[str, int] = Field(
+        default_factory=dict,
+        description="Sum of each metric column over all rows"
+    )
+    violation_counts: Dict[str, int] = Field(
+        default_factory=dict,
+        description="Funnel rule name -> number of violating rows"
+    )
+    violation_samples: Dict[str, List[int]] = Field(
+        default_factory=dict,
+        description="Funnel rule name -> sample of violating row indexes (0-based)"
+    )
+    duplicate_rows: int = Field(default=0, ge=0, description="Rows identical to an earlier row")
+    duplicate_samples: List[int] = Field(
+        default_factory=list,
+        description="Sample of duplicate row indexes (0-based)"
+    )
+    unmapped_templates: Dict[str, int] = Field(
+        default_factory=dict,
+        description="Templates not claimed by the report mapping -> row count"
+    )
+    
+    @property
+    def is_clean(self) -> bool:
+        """Whether the export has no funnel violations, duplicates, bad timestamps or unmapped templates."""
+        return (
+            not any(self.violation_counts.values())
+            and self.duplicate_rows == 0
+            and self.invalid_timestamps == 0
+            and not self.unmapped_templates
+        )
@@ -0,0 +1,45 @@
+"""Generated workbook validation models."""
+
+from typing import List, Optional
+from pydantic import BaseModel, Field
+
+
+STRUCTURE = "structure"
+DATA = "data"
+FORMATTING = "formatting"
+
+
+class ValidationIssue(BaseModel):
+    """One expectation a workbook does not meet."""
+    
+    check: str = Field(..., description="structure, data or formatting")
+    message: str = Field(..., description="What was expected and what was found")
+    coordinate: Optional[str] = Field(default=None, description="Cell coordinate, if the issue is about one cell")
+
+
+class WorkbookValidation(BaseModel):
+    """Result of validating a workbook against its expected layout, data and skeleton."""
+    
+    file: str = Field(..., description="Validated workbook path")
+    sheet: Optional[str] = Field(default=None, description="Validated sheet name")
+    rows_read: int = Field(default=0, ge=0, description="Rows streamed")
+    cells_checked: int = Field(default=0, ge=0, description="Expected cell values compared")
+    issue_count: int = Field(default=0, ge=0, description="Issues found, including those not listed")
+    issues: List[ValidationIssue] = Field(
+        default_factory=list,
+        description="First issues found, up to the validator's limit"
+    )
+    
+    @property
+    def is_valid(self) -> bool:
+        """Whether the workbook met every expectation."""
+        return self.issue_count == 0
+    
+    def summary(self) -> str:
+        """First issue plus the count of the others, for error messages."""
+        if self.is_valid:
+            return "valid"
+        first = self.issues[0]
+        where = f"{first.coordinate}: " if first.coordinate else ""
+        more = f" (+{self.issue_count - 1} more)" if self.issue_count > 1 else ""
+        return f"{first.check} check failed: {where}{first.message}{more}"
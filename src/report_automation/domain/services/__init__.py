@@ -1 +1,15 @@
 """Business services for report processing."""
+
+from .aggregation import METRICS, ROW_COUNT, WeeklyAggregate, assign_weeks
+from .calendar import WeekCalendar
+from .transformer import PERCENTAGE_RULES, CampaignDataTransformer
+
+__all__ = [
+    "METRICS",
+    "PERCENTAGE_RULES",
+    "ROW_COUNT",
+    "CampaignDataTransformer",
+    "WeeklyAggregate",
+    "WeekCalendar",
+    "assign_weeks",
+]
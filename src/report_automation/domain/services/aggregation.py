@@ -0,0 +1,103 @@
+"""Weekly per-template aggregation shared by all report plugins."""
+
+from typing import Dict, Iterable, List, Optional, Sequence, Tuple
+import numpy as np
+import pandas as pd
+
+from .calendar import WeekCalendar
+
+
+METRICS = ["sent", "delivered", "opened", "clicked", "converted", "unsubscribed"]
+GROUP_KEYS = ["week", "template_name"]
+ROW_COUNT = "row_count"
+
+
+def assign_weeks(datetimes: pd.Series, boundaries: Sequence[Tuple[str, str]]) -> np.ndarray:
+    """Map each timestamp to its 1-based week number, 0 if outside all weeks.
+    
+    Boundaries are inclusive ``(start_date, end_date)`` day pairs, sorted and
+    non-overlapping, matching the plugins' ``weekly_boundaries``. Consecutive
+    7-day weeks are mapped arithmetically; other boundaries by binary search.
+    """
+    calendar = WeekCalendar.from_boundaries(boundaries)
+    if calendar is not None:
+        return calendar.week_index(datetimes)
+    
+    starts = np.array([pd.Timestamp(start + ' 00:00:00') for start, _ in boundaries],
+                      dtype='datetime64[ns]')
+    ends = np.array([pd.Timestamp(end + ' 23:59:59') for _, end in boundaries],
+                    dtype='datetime64[ns]')
+    values = np.asarray(datetimes, dtype='datetime64[ns]')
+    
+    position = np.searchsorted(starts, values, side='right') - 1
+    inside = position >= 0
+    inside[inside] = values[inside] <= ends[position[inside]]
+    return np.where(inside, position + 1, 0)
+
+
+class WeeklyAggregate:
+    """Per-(week, template) metric sums for one input file.
+    
+    Aggregates are additive: partial aggregates computed over disjoint row
+    sets (shards, chunks, regional exports) combine into exactly the result
+    of aggregating all rows at once.
+    """
+    
+    def __init__(self, sums: pd.DataFrame, campaign_name: Optional[str] = None):
+        """Wrap a frame indexed by (week, template_name) with metric and row count columns."""
+        self.sums = sums
+        self.campaign_name = campaign_name
+    
+    @classmethod
+    def from_frame(cls, data: pd.DataFrame, boundaries: Sequence[Tuple[str, str]],
+                   metrics: List[str] = METRICS) -> "WeeklyAggregate":
+        """Aggregate raw rows with a ``datetime`` column into weekly sums."""
+        campaign_name = None
+        if not data.empty and 'campaign_name' in data.columns:
+            campaign_name = data['campaign_name'].iloc[0]
+        
+        weeks = assign_weeks(data['datetime'], boundaries)
+        in_range = weeks > 0
+        frame = data.loc[in_range, ['template_name'] + metrics]
+        if isinstance(frame['template_name'].dtype, pd.CategoricalDtype):
+            # Shared frames hold names as categoricals; unused categories must not become rows
+            frame = frame.astype({'template_name': object})
+        frame.insert(0, 'week', weeks[in_range])
+        grouped = frame.groupby(GROUP_KEYS)
+        sums = grouped[metrics].sum()
+        sums[ROW_COUNT] = grouped.size().astype('int64')
+        return cls(sums, campaign_name)
+    
+    @classmethod
+    def combine(cls, aggregates: Iterable["WeeklyAggregate"]) -> "WeeklyAggregate":
+        """Merge partial aggregates; the first known campaign name wins."""
+        aggregates = list(aggregates)
+        if not aggregates:
+            raise ValueError("No aggregates to combine")
+        campaign_name = next((a.campaign_name for a in aggregates if a.campaign_name is not None), None)
+        frames = [a.sums for a in aggregates]
+        if len(frames) == 1:
+            return cls(frames[0], campaign_name)
+        sums = pd.concat(frames).groupby(level=GROUP_KEYS).sum()
+        return cls(sums, campaign_name)
+    
+    @property
+    def metrics(self) -> List[str]:
+        """Metric columns held by this aggregate."""
+        return [column for column in self.sums.columns if column != ROW_COUNT]
+    
+    @property
+    def row_count(self) -> int:
+        """Number of in-range rows folded into this aggregate."""
+        return int(self.sums[ROW_COUNT].sum())
+    
+    def week_frame(self, week: int) -> pd.DataFrame:
+        """Return week sums shaped like ``groupby('template_name').sum().reset_index()``."""
+        if week in self.sums.index.get_level_values('week'):
+            return self.sums.xs(week, level='week').reset_index()
+        return pd.DataFrame({'template_name': pd.Series(dtype=object),
+                             **{m: pd.Series(dtype=self.sums[m].dtype) for m in self.sums.columns}})
+    
+    def week_frames(self, week_count: int) -> Dict[str, pd.DataFrame]:
+        """Return ``{'week1': frame, ...}`` for weeks 1..week_count."""
+        return {f'week{i}': self.week_frame(i) for i in range(1, week_count + 1)}
@@ -0,0 +1,98 @@
+"""Calendar rules generating report weeks and mapping timestamps to them."""
+
+from datetime import date, datetime, timedelta
+from typing import Any, List, Optional, Sequence, Tuple
+import numpy as np
+
+from ..models import CalendarRule
+
+
+WEEKDAYS = ["monday", "tuesday", "wednesday", "thursday", "friday", "saturday", "sunday"]
+WEEK = np.timedelta64(7, 'D').astype('timedelta64[ns]')
+
+
+class WeekCalendar:
+    """A run of consecutive 7-day weeks starting at ``first_start``.
+    
+    Week numbers are 1-based. Mapping a timestamp to its week is plain
+    integer arithmetic on the offset from the first week start, so any
+    amount of history is bucketed in one vectorized operation.
+    """
+    
+    def __init__(self, first_start: date, week_count: int):
+        """Initialize calendar."""
+        if week_count < 1:
+            raise ValueError("A calendar needs at least one week")
+        self.first_start = first_start
+        self.week_count = week_count
+        self._origin = np.datetime64(first_start.isoformat(), 'ns')
+    
+    @classmethod
+    def iso(cls, year: int, first_week: int, week_count: int) -> "WeekCalendar":
+        """ISO weeks (Monday start) beginning with ``first_week`` of ``year``."""
+        return cls(date.fromisocalendar(year, first_week, 1), week_count)
+    
+    @classmethod
+    def rolling(cls, end: date, week_count: int, week_start: str = "monday") -> "WeekCalendar":
+        """The ``week_count`` weeks ending with the week that contains ``end``."""
+        offset = (end.weekday() - WEEKDAYS.index(week_start.lower())) % 7
+        last_start = end - timedelta(days=offset)
+        return cls(last_start - timedelta(weeks=week_count - 1), week_count)
+    
+    @classmethod
+    def from_rule(cls, rule: CalendarRule, today: Optional[date] = None) -> "WeekCalendar":
+        """Build a calendar from a configured rule."""
+        if rule.rule == "iso":
+            return cls.iso(rule.year, rule.first_week or 1, rule.weeks)
+        if rule.rule == "custom":
+            return cls(_parse_date(rule.start), rule.weeks)
+        if rule.end == "today":
+            end = today or date.today()
+        else:
+            end = _parse_date(rule.end)
+        return cls.rolling(end, rule.weeks, rule.week_start)
+    
+    @classmethod
+    def from_boundaries(cls, boundaries: Sequence[Tuple[str, str]]) -> Optional["WeekCalendar"]:
+        """Calendar equivalent to explicit boundaries, or None if they are not contiguous weeks."""
+        if not boundaries:
+            return None
+        starts = [_parse_date(start) for start, _ in boundaries]
+        ends = [_parse_date(end) for _, end in boundaries]
+        for i, (start, end) in enumerate(zip(starts, ends)):
+            if end - start != timedelta(days=6) or start != starts[0] + timedelta(weeks=i):
+                return None
+        return cls(starts[0], len(boundaries))
+    
+    def week_start(self, week: int) -> date:
+        """First day of a 1-based week number (may lie outside the calendar)."""
+        return self.first_start + timedelta(weeks=week - 1)
+    
+    @property
+    def boundaries(self) -> List[Tuple[str, str]]:
+        """Inclusive ``(start_date, end_date)`` pairs in YYYY-MM-DD format."""
+        return [
+            (self.week_start(week).isoformat(), (self.week_start(week) + timedelta(days=6)).isoformat())
+            for week in range(1, self.week_count + 1)
+        ]
+    
+    @property
+    def labels(self) -> List[str]:
+        """Week labels as ``dd.mm`` of each week's first day."""
+        return [self.week_start(week).strftime('%d.%m') for week in range(1, self.week_count + 1)]
+    
+    def week_numbers(self, datetimes: Any) -> np.ndarray:
+        """Unbounded 1-based week numbers (<= 0 before the first week)."""
+        values = np.asarray(datetimes, dtype='datetime64[ns]')
+        missing = np.isnat(values)
+        offsets = np.where(missing, 0, (values - self._origin).view(np.int64))
+        return np.where(missing, 0, offsets // WEEK.astype(np.int64) + 1)
+    
+    def week_index(self, datetimes: Any) -> np.ndarray:
+        """1-based week numbers within the calendar, 0 outside it."""
+        numbers = self.week_numbers(datetimes)
+        return np.where((numbers >= 1) & (numbers <= self.week_count), numbers, 0)
+
+
+def _parse_date(value: str) -> date:
+    return datetime.strptime(value, '%Y-%m-%d').date()
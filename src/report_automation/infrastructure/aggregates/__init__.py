@@ -0,0 +1,6 @@
+"""Persistence of partial weekly aggregates."""
+
+from .partial import PartialAggregate, read_partial, write_partial, merge_partials
+from .spill import SpillingAggregator
+
+__all__ = ["PartialAggregate", "SpillingAggregator", "read_partial", "write_partial", "merge_partials"]
@@ -0,0 +1,149 @@
+"""Versioned partial-aggregate file format for distributed report runs.
+
+A partial file is a compressed NumPy ``.npz`` archive holding the weekly
+per-template sums of one or more input sections (files) together with a
+JSON header. Strings are dictionary-encoded, so a partial is a few KB no
+matter how large the export it was computed from. Partials from any number
+of machines merge by summation into exactly the aggregate of all rows.
+"""
+
+import json
+from pathlib import Path
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+import logging
+
+import numpy as np
+import pandas as pd
+
+from ... import __version__
+from ...domain.services import ROW_COUNT, WeeklyAggregate
+from ...domain.services.aggregation import GROUP_KEYS
+
+
+logger = logging.getLogger(__name__)
+
+FORMAT_NAME = "report-automation-partial"
+FORMAT_VERSION = 1
+FILE_SUFFIX = ".rpa.npz"
+
+
+class PartialAggregate:
+    """Weekly aggregates of one report type, keyed by section (input file name)."""
+    
+    def __init__(self, report_type: str, weekly_boundaries: List[Tuple[str, str]],
+                 sections: Dict[str, WeeklyAggregate], metadata: Optional[Dict[str, Any]] = None):
+        """Initialize partial aggregate; ``metadata`` is extra JSON stored in the header."""
+        self.report_type = report_type
+        self.weekly_boundaries = [tuple(boundary) for boundary in weekly_boundaries]
+        self.sections = sections
+        self.metadata = metadata or {}
+    
+    @property
+    def row_count(self) -> int:
+        """Number of rows folded into all sections."""
+        return sum(aggregate.row_count for aggregate in self.sections.values())
+
+
+def write_partial(path: Path, partial: PartialAggregate) -> Path:
+    """Write a partial aggregate file and return its path."""
+    section_names = list(partial.sections)
+    metrics: List[str] = []
+    for aggregate in partial.sections.values():
+        metrics.extend(m for m in aggregate.metrics if m not in metrics)
+    
+    frames = []
+    for code, name in enumerate(section_names):
+        sums = partial.sections[name].sums.reset_index()
+        sums.insert(0, 'section', code)
+        frames.append(sums)
+    columns = ['section'] + GROUP_KEYS + metrics + [ROW_COUNT]
+    table = pd.concat(frames, ignore_index=True) if frames else pd.DataFrame(columns=columns)
+    table = table.reindex(columns=columns, fill_value=0)
+    
+    template_codes, templates = pd.factorize(table['template_name'].astype(str), sort=True)
+    values = table[metrics].to_numpy()
+    if not np.issubdtype(values.dtype, np.number):
+        values = values.astype(np.float64)
+    
+    header = {
+        "format": FORMAT_NAME,
+        "version": FORMAT_VERSION,
+        "producer": f"report-automation {__version__}",
+        "report_type": partial.report_type,
+        "weekly_boundaries": [list(boundary) for boundary in partial.weekly_boundaries],
+        "metrics": metrics,
+        "sections": {name: {"campaign_name": partial.sections[name].campaign_name}
+                     for name in section_names},
+        "metadata": partial.metadata,
+    }
+    
+    path.parent.mkdir(parents=True, exist_ok=True)
+    with open(path, 'wb') as f:
+        np.savez_compressed(
+            f,
+            header=np.array(json.dumps(header)),
+            section_names=np.array(section_names, dtype=str),
+            templates=np.asarray(templates, dtype=str),
+            section_codes=table['section'].to_numpy(dtype=np.int32),
+            weeks=table['week'].to_numpy(dtype=np.int32),
+            template_codes=template_codes.astype(np.int32),
+            values=values,
+            row_counts=table[ROW_COUNT].to_numpy(dtype=np.int64),
+        )
+    logger.info(f"Partial aggregate written: {path} ({partial.row_count} rows, {len(section_names)} sections)")
+    return path
+
+
+def read_partial(path: Path) -> PartialAggregate:
+    """Read a partial aggregate file written by ``write_partial``."""
+    with np.load(path, allow_pickle=False) as archive:
+        header = json.loads(str(archive['header']))
+        if header.get("format") != FORMAT_NAME:
+            raise ValueError(f"Not a partial aggregate file: {path}")
+        if header.get("version", 0) > FORMAT_VERSION:
+            raise ValueError(
+                f"Partial aggregate {path} has format version {header['version']}, "
+                f"this installation reads up to {FORMAT_VERSION}"
+            )
+        
+        section_names = archive['section_names'].tolist()
+        templates = archive['templates']
+        table = pd.DataFrame(archive['values'], columns=header["metrics"])
+        table.insert(0, 'template_name', templates[archive['template_codes']])
+        table.insert(0, 'week', archive['weeks'].astype(np.int64))
+        table[ROW_COUNT] = archive['row_counts']
+        section_codes = archive['section_codes']
+    
+    sections = {}
+    for code, name in enumerate(section_names):
+        rows = table[section_codes == code]
+        sums = rows.set_index(GROUP_KEYS).sort_index()
+        campaign_name = header["sections"].get(name, {}).get("campaign_name")
+        sections[name] = WeeklyAggregate(sums, campaign_name)
+    
+    return PartialAggregate(header["report_type"], header["weekly_boundaries"], sections,
+                            header.get("metadata"))
+
+
+def merge_partials(partials: Iterable[PartialAggregate]) -> PartialAggregate:
+    """Sum partial aggregates of the same report type section by section."""
+    partials = list(partials)
+    if not partials:
+        raise ValueError("No partial aggregates to merge")
+    
+    first = partials[0]
+    for partial in partials[1:]:
+        if partial.report_type != first.report_type:
+            raise ValueError(
+                f"Cannot merge '{partial.report_type}' partial into '{first.report_type}' partials"
+            )
+        if partial.weekly_boundaries != first.weekly_boundaries:
+            raise ValueError("Cannot merge partials computed with different weekly boundaries")
+    
+    grouped: Dict[str, List[WeeklyAggregate]] = {}
+    for partial in partials:
+        for name, aggregate in partial.sections.items():
+            grouped.setdefault(name, []).append(aggregate)
+    
+    sections = {name: WeeklyAggregate.combine(aggregates) for name, aggregates in grouped.items()}
+    return PartialAggregate(first.report_type, first.weekly_boundaries, sections)
@@ -0,0 +1,114 @@
+"""Memory-bounded combination of partial aggregates with spill to disk."""
+
+import shutil
+import tempfile
+from pathlib import Path
+from typing import Dict, List, Optional
+import logging
+
+import pandas as pd
+
+from ...domain.services import WeeklyAggregate
+
+
+logger = logging.getLogger(__name__)
+
+
+class SpillingAggregator:
+    """Sums partial aggregates while keeping their in-memory size under a budget.
+    
+    Partials are held in memory and compacted (summed) when they exceed
+    ``max_memory`` bytes (never, if it is None). If the compacted sums are still above half the
+    budget, they are hash-partitioned by group key and written to spill
+    files. ``result`` then sums each partition's files separately, so only
+    one partition of keys is grouped at a time; partitions hold disjoint
+    keys and are concatenated. The result equals ``WeeklyAggregate.combine``
+    of everything added.
+    """
+    
+    def __init__(self, max_memory: Optional[int], partitions: int = 16, spill_dir: Optional[Path] = None):
+        """Initialize aggregator; spill files go to a temporary directory under ``spill_dir``."""
+        self.max_memory = max_memory
+        self.partitions = partitions
+        self.spill_dir = spill_dir
+        self.spill_count = 0
+        self.spilled_bytes = 0
+        self._partials: List[pd.DataFrame] = []
+        self._memory = 0
+        self._campaign_name: Optional[str] = None
+        self._work_dir: Optional[Path] = None
+        self._spill_files: Dict[int, List[Path]] = {}
+    
+    def add(self, aggregate: WeeklyAggregate) -> None:
+        """Fold a partial aggregate in, compacting or spilling if over budget."""
+        if self._campaign_name is None:
+            self._campaign_name = aggregate.campaign_name
+        self._partials.append(aggregate.sums)
+        self._memory += _frame_bytes(aggregate.sums)
+        
+        if self.max_memory is not None and self._memory > self.max_memory:
+            self._compact()
+            if self._memory > self.max_memory // 2:
+                self._spill()
+    
+    def result(self) -> WeeklyAggregate:
+        """Sum of every added aggregate."""
+        if not self._spill_files:
+            self._compact()
+            return WeeklyAggregate(self._partials[0], self._campaign_name)
+        
+        self._spill()
+        logger.info(f"Merging {self.spill_count} spill(s) ({self.spilled_bytes / 1024 ** 2:.1f} MiB) "
+                    f"across {len(self._spill_files)} partition(s)")
+        merged = []
+        for partition in sorted(self._spill_files):
+            frames = [pd.read_pickle(path) for path in self._spill_files[partition]]
+            merged.append(WeeklyAggregate.combine(WeeklyAggregate(frame) for frame in frames).sums)
+        return WeeklyAggregate(pd.concat(merged).sort_index(), self._campaign_name)
+    
+    def close(self) -> None:
+        """Remove spill files."""
+        if self._work_dir is not None:
+            shutil.rmtree(self._work_dir, ignore_errors=True)
+            self._work_dir = None
+        self._spill_files.clear()
+    
+    def __enter__(self) -> "SpillingAggregator":
+        return self
+    
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+    
+    def _compact(self) -> None:
+        if not self._partials:
+            raise ValueError("No aggregates to combine")
+        if len(self._partials) > 1:
+            self._partials = [WeeklyAggregate.combine(WeeklyAggregate(p) for p in self._partials).sums]
+        self._memory = _frame_bytes(self._partials[0])
+    
+    def _spill(self) -> None:
+        if not self._partials:
+            return
+        self._compact()
+        sums = self._partials[0]
+        if self._work_dir is None:
+            self._work_dir = Path(tempfile.mkdtemp(prefix="report-spill-", dir=self.spill_dir))
+        
+        buckets = pd.util.hash_pandas_object(sums.index, index=False).to_numpy() % self.partitions
+        for partition in range(self.partitions):
+            rows = sums[buckets == partition]
+            if rows.empty:
+                continue
+            path = self._work_dir / f"part-{partition:03d}-{self.spill_count:05d}.pkl"
+            rows.to_pickle(path)
+            self.spilled_bytes += path.stat().st_size
+            self._spill_files.setdefault(partition, []).append(path)
+        
+        self.spill_count += 1
+        self._partials = []
+        self._memory = 0
+        logger.debug(f"Spilled {len(sums)} groups to {self._work_dir}")
+
+
+def _frame_bytes(frame: pd.DataFrame) -> int:
+    return int(frame.memory_usage(index=True, deep=True).sum())
@@ -0,0 +1,7 @@
+"""On-disk caches of generated reports and their report data."""
+
+from .digests import FileDigests
+from .results import ResultCache
+from .transforms import TransformMemo
+
+__all__ = ["FileDigests", "ResultCache", "TransformMemo"]
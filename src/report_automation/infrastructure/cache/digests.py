@@ -0,0 +1,60 @@
+"""Content digests of input files, memoized across runs."""
+
+import hashlib
+import json
+import os
+from pathlib import Path
+from typing import Any, Dict, Optional
+import logging
+
+
+logger = logging.getLogger(__name__)
+
+HASH_BLOCK = 1024 * 1024
+
+
+class FileDigests:
+    """SHA-256 of file contents, remembered by path, size and modification time.
+    
+    Digests are kept in a JSON file, so an unchanged export is hashed once
+    and later runs only ``stat`` it.
+    """
+    
+    def __init__(self, path: Path):
+        """Initialize digests stored in the JSON file ``path``."""
+        self.path = Path(path)
+        self._digests: Optional[Dict[str, Any]] = None
+    
+    def digest(self, file_path: Path) -> str:
+        """SHA-256 of a file's content."""
+        file_path = Path(file_path).resolve()
+        stat = file_path.stat()
+        digests = self._load()
+        entry = digests.get(str(file_path))
+        if entry and entry["size"] == stat.st_size and entry["mtime_ns"] == stat.st_mtime_ns:
+            return entry["digest"]
+        
+        digest = hashlib.sha256()
+        with open(file_path, 'rb') as f:
+            for block in iter(lambda: f.read(HASH_BLOCK), b""):
+                digest.update(block)
+        digests[str(file_path)] = {"size": stat.st_size, "mtime_ns": stat.st_mtime_ns, "digest": digest.hexdigest()}
+        self._save()
+        return digests[str(file_path)]["digest"]
+    
+    def _load(self) -> Dict[str, Any]:
+        if self._digests is None:
+            try:
+                self._digests = json.loads(self.path.read_text())
+            except (OSError, ValueError):
+                self._digests = {}
+        return self._digests
+    
+    def _save(self) -> None:
+        try:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            tmp_path = self.path.with_suffix(f".{os.getpid()}.tmp")
+            tmp_path.write_text(json.dumps(self._digests))
+            tmp_path.replace(self.path)
+        except OSError as e:
+            logger.debug(f"Could not save file digests: {e}")
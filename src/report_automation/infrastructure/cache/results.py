@@ -0,0 +1,109 @@
+"""Content-addressed cache of generated report workbooks."""
+
+import hashlib
+import json
+import os
+import shutil
+import tempfile
+from pathlib import Path
+from typing import Any, Dict, Iterable, Optional
+import logging
+
+from ... import __version__
+from ..config import default_cache_dir
+from .digests import FileDigests
+
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_MAX_BYTES = 1024 ** 3
+
+
+class ResultCache:
+    """Stores report outputs under a key derived from everything that shapes them.
+    
+    The key covers the content of every input file, the package version,
+    the plugin's ``output_fingerprint`` (code and compiled report config)
+    and the run options that change the output. A hit copies the stored
+    workbooks back to the requested paths instead of recomputing them.
+    
+    File digests are memoized by path, size and modification time, so an
+    unchanged export is not re-hashed. Entries are evicted least recently
+    used first once the cache exceeds ``max_bytes``.
+    """
+    
+    def __init__(self, cache_dir: Optional[Path] = None, max_bytes: int = DEFAULT_MAX_BYTES):
+        """Initialize cache; defaults to ``results`` under the shared cache directory."""
+        self.cache_dir = Path(cache_dir) if cache_dir else default_cache_dir() / "results"
+        self.max_bytes = max_bytes
+        self.digests = FileDigests(self.cache_dir / "hashes.json")
+    
+    def key(self, plugin: Any, input_paths: Iterable[Path], options: Dict[str, Any]) -> str:
+        """Cache key of a plugin run over ``input_paths`` with the given output-shaping options."""
+        payload = {
+            "report": plugin.name,
+            "version": __version__,
+            "plugin": plugin.output_fingerprint(),
+            "inputs": [(Path(path).name, self.file_digest(path)) for path in input_paths],
+            "options": options,
+        }
+        return hashlib.sha256(json.dumps(payload, sort_keys=True, default=str).encode()).hexdigest()
+    
+    def file_digest(self, path: Path) -> str:
+        """SHA-256 of a file's content, memoized by path, size and modification time."""
+        return self.digests.digest(path)
+    
+    def restore(self, key: str, outputs: Dict[str, Path]) -> bool:
+        """Copy a cached entry's files to ``outputs`` (role -> path); False on a miss."""
+        entry = self.cache_dir / key
+        sources = {role: entry / role for role in outputs}
+        if not all(source.exists() for source in sources.values()):
+            return False
+        
+        for role, output_path in outputs.items():
+            Path(output_path).parent.mkdir(parents=True, exist_ok=True)
+            shutil.copyfile(sources[role], output_path)
+        os.utime(entry)
+        logger.info(f"Restored cached result {key[:12]}")
+        return True
+    
+    def store(self, key: str, outputs: Dict[str, Path]) -> None:
+        """Cache the files in ``outputs`` (role -> path) under ``key``, then evict old entries."""
+        self.cache_dir.mkdir(parents=True, exist_ok=True)
+        entry = self.cache_dir / key
+        work_dir = Path(tempfile.mkdtemp(prefix=f".{key[:12]}-", dir=self.cache_dir))
+        try:
+            for role, output_path in outputs.items():
+                shutil.copyfile(output_path, work_dir / role)
+            shutil.rmtree(entry, ignore_errors=True)
+            work_dir.rename(entry)
+        except OSError as e:
+            logger.warning(f"Could not cache result {key[:12]}: {e}")
+            shutil.rmtree(work_dir, ignore_errors=True)
+            return
+        logger.info(f"Cached result {key[:12]}")
+        self.evict(keep=key)
+    
+    def evict(self, keep: Optional[str] = None) -> int:
+        """Remove least recently used entries until the cache fits ``max_bytes``; returns the count."""
+        if not self.cache_dir.exists():
+            return 0
+        entries = []
+        for entry in self.cache_dir.iterdir():
+            if entry.is_dir() and not entry.name.startswith('.'):
+                size = sum(f.stat().st_size for f in entry.iterdir())
+                entries.append((entry.stat().st_mtime, entry, size))
+        
+        total = sum(size for _, _, size in entries)
+        removed = 0
+        for _, entry, size in sorted(entries, key=lambda item: item[0]):
+            if total <= self.max_bytes:
+                break
+            if entry.name == keep:
+                continue
+            shutil.rmtree(entry, ignore_errors=True)
+            total -= size
+            removed += 1
+        if removed:
+            logger.info(f"Evicted {removed} cached result(s)")
+        return removed
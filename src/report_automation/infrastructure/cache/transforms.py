@@ -0,0 +1,107 @@
+"""On-disk memo of plugin report data (``transform_aggregates`` output)."""
+
+import hashlib
+import json
+import os
+import pickle
+import zlib
+from pathlib import Path
+from typing import Any, Dict, Iterable, Optional
+import logging
+
+from ... import __version__
+from ..config import default_cache_dir
+from .digests import FileDigests
+from .results import DEFAULT_MAX_BYTES
+
+
+logger = logging.getLogger(__name__)
+
+FILE_SUFFIX = ".report.z"
+
+
+class TransformMemo:
+    """Report data memoized by input content and the plugin's mapping configuration.
+    
+    Rendering a new workbook and week-replacing into a master workbook
+    start from the same report data, so one aggregation serves every
+    output of the same inputs, whichever master workbook it is rendered
+    into. The key covers the input file digests,
+    the package version and the plugin's ``report_fingerprint`` (reading,
+    aggregation and transform code plus compiled report config). Entries
+    are zlib-compressed pickles, evicted least recently used first beyond
+    ``max_bytes``.
+    """
+    
+    def __init__(self, cache_dir: Optional[Path] = None, max_bytes: int = DEFAULT_MAX_BYTES):
+        """Initialize memo; defaults to ``transforms`` under the shared cache directory."""
+        self.cache_dir = Path(cache_dir) if cache_dir else default_cache_dir() / "transforms"
+        self.max_bytes = max_bytes
+        self.digests = FileDigests(self.cache_dir / "hashes.json")
+    
+    def key(self, plugin: Any, input_paths: Iterable[Path]) -> str:
+        """Memo key of a plugin's report data for ``input_paths``."""
+        payload = {
+            "report": plugin.name,
+            "version": __version__,
+            "plugin": plugin.report_fingerprint(),
+            "inputs": [(Path(path).name, self.digests.digest(path)) for path in input_paths],
+        }
+        return hashlib.sha256(json.dumps(payload, sort_keys=True).encode()).hexdigest()
+    
+    def path(self, key: str) -> Path:
+        """File holding the report data of ``key``."""
+        return self.cache_dir / f"{key}{FILE_SUFFIX}"
+    
+    def load(self, key: str) -> Optional[Dict[str, Any]]:
+        """Memoized report data, or None on a miss."""
+        path = self.path(key)
+        try:
+            report_data = pickle.loads(zlib.decompress(path.read_bytes()))
+        except FileNotFoundError:
+            return None
+        except (OSError, zlib.error, pickle.UnpicklingError, EOFError) as e:
+            logger.warning(f"Ignoring unreadable report data {path.name}: {e}")
+            return None
+        os.utime(path)
+        logger.info(f"Reusing report data {key[:12]}")
+        return report_data
+    
+    def store(self, key: str, report_data: Dict[str, Any]) -> None:
+        """Memoize report data under ``key``, then evict old entries."""
+        path = self.path(key)
+        tmp_path = path.with_suffix(f".{os.getpid()}.tmp")
+        try:
+            self.cache_dir.mkdir(parents=True, exist_ok=True)
+            tmp_path.write_bytes(zlib.compress(pickle.dumps(report_data, protocol=pickle.HIGHEST_PROTOCOL)))
+            tmp_path.replace(path)
+        except OSError as e:
+            logger.warning(f"Could not memoize report data {key[:12]}: {e}")
+            tmp_path.unlink(missing_ok=True)
+            return
+        logger.info(f"Memoized report data {key[:12]} ({path.stat().st_size / 1024:.1f} KiB)")
+        self.evict(keep=key)
+    
+    def evict(self, keep: Optional[str] = None) -> int:
+        """Remove least recently used entries until the memo fits ``max_bytes``; returns the count."""
+        entries = []
+        for path in self.cache_dir.glob(f"*{FILE_SUFFIX}"):
+            try:
+                stat = path.stat()
+            except FileNotFoundError:
+                continue
+            entries.append((stat.st_mtime, path, stat.st_size))
+        
+        total = sum(size for _, _, size in entries)
+        removed = 0
+        for _, path, size in sorted(entries, key=lambda item: item[0]):
+            if total <= self.max_bytes:
+                break
+            if path.name == f"{keep}{FILE_SUFFIX}":
+                continue
+            path.unlink(missing_ok=True)
+            total -= size
+            removed += 1
+        if removed:
+            logger.info(f"Evicted {removed} memoized report data file(s)")
+        return removed
@@ -1 +1,23 @@
 """Configuration loading and management."""
+
+from .loader import (
+    CachedConfigManager,
+    CompiledReportSpec,
+    YAMLConfigLoader,
+    default_cache_dir,
+    get_default_loader,
+    load_batch_config,
+    load_report_spec,
+    load_watch_config,
+)
+
+__all__ = [
+    "CachedConfigManager",
+    "CompiledReportSpec",
+    "YAMLConfigLoader",
+    "default_cache_dir",
+    "get_default_loader",
+    "load_batch_config",
+    "load_report_spec",
+    "load_watch_config",
+]
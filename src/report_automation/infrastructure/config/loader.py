@@ -0,0 +1,318 @@
+"""YAML report specification loading, compilation and caching."""
+
+import hashlib
+import os
+import pickle
+from datetime import date
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Tuple
+import logging
+
+import numpy as np
+import pandas as pd
+import yaml
+from openpyxl.utils import column_index_from_string, get_column_letter
+
+from ...config import REPORTS_DIR
+from ...domain.interfaces import ConfigLoader, ConfigManager
+from ...domain.models import BatchConfig, ColumnRule, ReportConfig, ReportSpecification, WatchConfig
+from ...domain.services import WeekCalendar
+
+
+logger = logging.getLogger(__name__)
+
+# Bump when CompiledReportSpec changes shape so stale disk caches are ignored
+COMPILED_FORMAT_VERSION = 3
+
+
+def default_cache_dir() -> Path:
+    """Directory for on-disk caches (``REPORT_AUTOMATION_CACHE_DIR`` overrides)."""
+    override = os.environ.get("REPORT_AUTOMATION_CACHE_DIR")
+    if override:
+        return Path(override)
+    base = os.environ.get("XDG_CACHE_HOME") or Path.home() / ".cache"
+    return Path(base) / "report-automation"
+
+
+class CompiledReportSpec:
+    """Report specification compiled into lookup structures used at run time.
+    
+    Week boundaries become sorted ``datetime64`` arrays, template mappings
+    become dicts (per group as well), and column mappings become letter and
+    index tables keyed the way the plugins address them (``week1``, ``01``).
+    """
+    
+    def __init__(self, spec: ReportSpecification, source_hash: str):
+        """Compile a validated specification."""
+        self.spec = spec
+        self.source_hash = source_hash
+        self.name = spec.name
+        
+        self.template_periods: Dict[str, str] = {}
+        self.template_groups: Dict[str, Dict[str, str]] = {}
+        for mapping in spec.template_mappings:
+            self.template_periods[mapping.source_template] = mapping.target_period
+            if mapping.group:
+                self.template_groups.setdefault(mapping.group, {})[mapping.source_template] = mapping.target_period
+        
+        self.time_periods: List[str] = list(spec.time_periods)
+        self.timing_blocks: Dict[str, Dict[str, List[int]]] = spec.timing_blocks
+        self.target_labels: Dict[str, str] = spec.target_labels
+        self.target_sheet: Optional[str] = spec.target_sheet
+        self.input_patterns: List[str] = list(spec.input_patterns)
+        
+        self._resolve_weeks()
+    
+    def __setstate__(self, state: Dict[str, Any]) -> None:
+        self.__dict__.update(state)
+        self.refresh()
+    
+    @property
+    def is_relative(self) -> bool:
+        """Whether the weeks depend on the current date."""
+        return self.spec.calendar is not None and self.spec.calendar.end == "today"
+    
+    def refresh(self) -> None:
+        """Re-derive the weeks if they are relative to a date that has passed."""
+        if self.is_relative and self.resolved_on != date.today():
+            self._resolve_weeks()
+    
+    def _resolve_weeks(self) -> None:
+        """Derive week boundaries, labels and week column tables."""
+        spec = self.spec
+        self.resolved_on = date.today()
+        if spec.calendar is not None:
+            self.calendar: Optional[WeekCalendar] = WeekCalendar.from_rule(spec.calendar, self.resolved_on)
+            self.weekly_boundaries: List[Tuple[str, str]] = self.calendar.boundaries
+            self.week_labels: List[str] = self.calendar.labels
+        else:
+            boundaries = sorted(spec.weekly_boundaries, key=lambda b: b.week_number)
+            self.weekly_boundaries = [(b.start_date, b.end_date) for b in boundaries]
+            self.week_labels = [b.label for b in boundaries]
+            self.calendar = WeekCalendar.from_boundaries(self.weekly_boundaries)
+        self.week_starts = np.array([pd.Timestamp(start) for start, _ in self.weekly_boundaries],
+                                    dtype='datetime64[ns]')
+        self.week_ends = np.array([pd.Timestamp(end + ' 23:59:59') for _, end in self.weekly_boundaries],
+                                  dtype='datetime64[ns]')
+        
+        self.columns: Dict[str, Dict[int, str]] = {}
+        for column in spec.column_mappings:
+            self.columns.setdefault(column.metric, {})[column.week_offset or 0] = column.column_letter
+        for metric, rule in (('week', spec.week_columns), ('replace_target', spec.replace_columns)):
+            if rule is not None:
+                self.columns.setdefault(metric, {}).update(self._rule_columns(rule))
+        
+        self.week_columns: Dict[str, str] = {
+            f'week{week}': letter for week, letter in sorted(self.columns.get('week', {}).items())
+        }
+        self.week_mappings: Dict[str, Dict[str, str]] = {
+            'source': {f'{week:02d}': letter for week, letter in sorted(self.columns.get('week', {}).items())},
+            'target': {f'{week:02d}': letter for week, letter in sorted(self.columns.get('replace_target', {}).items())},
+        }
+        self.column_index: Dict[str, int] = {
+            letter: column_index_from_string(letter)
+            for letters in self.columns.values() for letter in letters.values()
+        }
+    
+    def _rule_columns(self, rule: ColumnRule) -> Dict[int, str]:
+        first = column_index_from_string(rule.first)
+        columns = {}
+        for week in range(1, len(self.weekly_boundaries) + 1):
+            index = first + rule.step * (week - 1)
+            if index < 1:
+                raise ValueError(f"Week {week} column rule starting at {rule.first} runs past column A")
+            columns[week] = get_column_letter(index)
+        return columns
+    
+    def column(self, metric: str, week_offset: int = 0) -> Optional[str]:
+        """Column letter for a metric (and week), or None if not mapped."""
+        return self.columns.get(metric, {}).get(week_offset)
+    
+    def week_index(self, datetimes: Any) -> np.ndarray:
+        """Vectorized map of timestamps to 1-based week numbers (0 = outside)."""
+        if self.calendar is not None:
+            return self.calendar.week_index(datetimes)
+        values = np.asarray(datetimes, dtype='datetime64[ns]')
+        position = np.searchsorted(self.week_starts, values, side='right') - 1
+        inside = position >= 0
+        inside[inside] = values[inside] <= self.week_ends[position[inside]]
+        return np.where(inside, position + 1, 0)
+
+
+class YAMLConfigLoader(ConfigLoader):
+    """Load report specifications from YAML files with compiled-form caching.
+    
+    Compiled specs are cached in memory keyed by file path, mtime and size,
+    and on disk keyed by the SHA-256 of the file content, so repeated runs
+    skip YAML parsing and validation entirely.
+    """
+    
+    def __init__(self, config_dir: Path = REPORTS_DIR, cache_dir: Optional[Path] = None,
+                 use_disk_cache: bool = True):
+        """Initialize loader."""
+        self.config_dir = Path(config_dir)
+        self.cache_dir = (cache_dir or default_cache_dir()) / "config"
+        self.use_disk_cache = use_disk_cache
+        self._memory: Dict[Path, Tuple[int, int, CompiledReportSpec]] = {}
+    
+    def config_path(self, report_type: str) -> Path:
+        """Return the YAML path for a report type."""
+        for suffix in (".yaml", ".yml"):
+            path = self.config_dir / f"{report_type}{suffix}"
+            if path.exists():
+                return path
+        raise FileNotFoundError(f"No configuration for report type '{report_type}' in {self.config_dir}")
+    
+    def load_report_config(self, report_type: str) -> ReportSpecification:
+        """Load configuration for a specific report type."""
+        return self.load_compiled(report_type).spec
+    
+    def load_from_file(self, config_path: Path) -> Dict[str, Any]:
+        """Load configuration from YAML/JSON file."""
+        with open(config_path, 'r', encoding='utf-8') as f:
+            config = yaml.safe_load(f) or {}
+        if not isinstance(config, dict):
+            raise ValueError(f"Configuration root must be a mapping: {config_path}")
+        return config
+    
+    def validate_config(self, config: Dict[str, Any]) -> bool:
+        """Validate configuration structure and values."""
+        try:
+            ReportSpecification(**config)
+        except Exception as e:
+            logger.error(f"Invalid report configuration: {e}")
+            return False
+        return True
+    
+    def get_available_reports(self) -> List[str]:
+        """Get list of available report types."""
+        return sorted(path.stem for pattern in ("*.yaml", "*.yml") for path in self.config_dir.glob(pattern))
+    
+    def load_compiled(self, report_type: str) -> CompiledReportSpec:
+        """Return the compiled spec for a report type, using the caches."""
+        return self.load_compiled_file(self.config_path(report_type))
+    
+    def load_compiled_file(self, path: Path) -> CompiledReportSpec:
+        """Return the compiled spec for a YAML file, using the caches."""
+        path = Path(path).resolve()
+        stat = path.stat()
+        cached = self._memory.get(path)
+        if cached and cached[0] == stat.st_mtime_ns and cached[1] == stat.st_size:
+            cached[2].refresh()
+            return cached[2]
+        
+        content = path.read_bytes()
+        source_hash = hashlib.sha256(content).hexdigest()
+        compiled = self._read_disk_cache(path.stem, source_hash)
+        if compiled is None:
+            config = yaml.safe_load(content) or {}
+            compiled = CompiledReportSpec(ReportSpecification(**config), source_hash)
+            self._write_disk_cache(path.stem, compiled)
+            logger.debug(f"Compiled report specification: {path}")
+        
+        self._memory[path] = (stat.st_mtime_ns, stat.st_size, compiled)
+        return compiled
+    
+    def clear_cache(self) -> None:
+        """Drop the in-memory cache (disk entries stay valid by content hash)."""
+        self._memory.clear()
+    
+    def _disk_cache_path(self, name: str, source_hash: str) -> Path:
+        return self.cache_dir / f"{name}-{source_hash[:16]}-v{COMPILED_FORMAT_VERSION}.pickle"
+    
+    def _read_disk_cache(self, name: str, source_hash: str) -> Optional[CompiledReportSpec]:
+        if not self.use_disk_cache:
+            return None
+        cache_path = self._disk_cache_path(name, source_hash)
+        try:
+            with open(cache_path, 'rb') as f:
+                compiled = pickle.load(f)
+        except FileNotFoundError:
+            return None
+        except Exception as e:
+            logger.warning(f"Ignoring unreadable config cache {cache_path}: {e}")
+            return None
+        if not isinstance(compiled, CompiledReportSpec) or compiled.source_hash != source_hash:
+            return None
+        return compiled
+    
+    def _write_disk_cache(self, name: str, compiled: CompiledReportSpec) -> None:
+        if not self.use_disk_cache:
+            return
+        cache_path = self._disk_cache_path(name, compiled.source_hash)
+        try:
+            cache_path.parent.mkdir(parents=True, exist_ok=True)
+            tmp_path = cache_path.with_suffix(f".{os.getpid()}.tmp")
+            with open(tmp_path, 'wb') as f:
+                pickle.dump(compiled, f, protocol=pickle.HIGHEST_PROTOCOL)
+            os.replace(tmp_path, cache_path)
+        except OSError as e:
+            logger.warning(f"Could not write config cache {cache_path}: {e}")
+
+
+class CachedConfigManager(ConfigManager):
+    """Runtime ReportConfig access backed by a YAMLConfigLoader."""
+    
+    def __init__(self, loader: Optional[YAMLConfigLoader] = None):
+        """Initialize manager."""
+        self.loader = loader or get_default_loader()
+        self._configs: Dict[str, ReportConfig] = {}
+    
+    def get_config(self, report_type: str) -> ReportConfig:
+        """Get runtime configuration for report type."""
+        if report_type not in self._configs:
+            compiled = self.loader.load_compiled(report_type)
+            self.cache_config(report_type, ReportConfig(
+                report_type=report_type,
+                template_mappings=dict(compiled.template_periods),
+                weekly_boundaries=list(compiled.weekly_boundaries),
+                time_periods=list(compiled.time_periods),
+            ))
+        return self._configs[report_type]
+    
+    def update_config(self, report_type: str, config: ReportConfig) -> None:
+        """Update configuration for report type."""
+        self._configs[report_type] = config
+    
+    def cache_config(self, report_type: str, config: ReportConfig) -> None:
+        """Cache configuration for performance."""
+        self._configs[report_type] = config
+    
+    def clear_cache(self) -> None:
+        """Clear configuration cache."""
+        self._configs.clear()
+        self.loader.clear_cache()
+
+
+_default_loader: Optional[YAMLConfigLoader] = None
+
+
+def get_default_loader() -> YAMLConfigLoader:
+    """Return the process-wide loader for the packaged report specifications."""
+    global _default_loader
+    if _default_loader is None:
+        _default_loader = YAMLConfigLoader()
+    return _default_loader
+
+
+def load_report_spec(report_type: str) -> CompiledReportSpec:
+    """Load the compiled packaged specification for a report type."""
+    return get_default_loader().load_compiled(report_type)
+
+
+def load_batch_config(path: Path) -> BatchConfig:
+    """Load batch report jobs from a YAML file."""
+    with open(path, 'r', encoding='utf-8') as f:
+        config = yaml.safe_load(f) or {}
+    if not isinstance(config, dict):
+        raise ValueError(f"Configuration root must be a mapping: {path}")
+    return BatchConfig(**config)
+
+
+def load_watch_config(path: Path) -> WatchConfig:
+    """Load watch mode settings and report jobs from a YAML file."""
+    with open(path, 'r', encoding='utf-8') as f:
+        config = yaml.safe_load(f) or {}
+    if not isinstance(config, dict):
+        raise ValueError(f"Configuration root must be a mapping: {path}")
+    return WatchConfig(**config)
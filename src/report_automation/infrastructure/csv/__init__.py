@@ -1,5 +1,18 @@
 """CSV processing and data reading."""
 
+from .prefetch import read_ahead
 from .processor import CSVProcessor
+from .profiler import DatasetProfiler
+from .sharded import ShardedCSVReader
+from .shared import SharedFrame, SharedFrameHandle
+from .tail import TailAggregator
 
-__all__ = ["CSVProcessor"]
+__all__ = [
+    "CSVProcessor",
+    "DatasetProfiler",
+    "ShardedCSVReader",
+    "SharedFrame",
+    "SharedFrameHandle",
+    "TailAggregator",
+    "read_ahead",
+]
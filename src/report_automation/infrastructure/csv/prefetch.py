@@ -0,0 +1,61 @@
+"""Background read-ahead of input files."""
+
+import queue
+import threading
+from pathlib import Path
+from typing import Callable, Iterable, Iterator, Tuple, TypeVar
+
+
+T = TypeVar("T")
+
+_DONE = object()
+
+
+def read_ahead(paths: Iterable[Path], read: Callable[[Path], T], depth: int = 1) -> Iterator[Tuple[Path, T]]:
+    """Yield ``(path, read(path))`` in order, reading up to ``depth`` files ahead on a thread.
+    
+    While the caller works on file N, a reader thread parses file N+1 (the
+    pandas C parser releases the GIL, and I/O waits do too). The reader
+    only starts a file once a slot is free, so at most ``depth`` parsed
+    files exist besides the one being consumed. With ``depth`` 0 files are
+    read inline. Reader errors are raised from the iterator at the failing
+    file's position.
+    """
+    paths = list(paths)
+    if depth < 1 or len(paths) < 2:
+        for path in paths:
+            yield path, read(path)
+        return
+    
+    slots = threading.Semaphore(depth)
+    results: queue.Queue = queue.Queue()
+    stop = threading.Event()
+    
+    def reader() -> None:
+        for path in paths:
+            slots.acquire()
+            if stop.is_set():
+                return
+            try:
+                results.put((path, read(path), None))
+            except BaseException as e:
+                results.put((path, None, e))
+                return
+        results.put(_DONE)
+    
+    thread = threading.Thread(target=reader, name="report-read-ahead", daemon=True)
+    thread.start()
+    try:
+        while True:
+            item = results.get()
+            if item is _DONE:
+                break
+            slots.release()
+            path, data, error = item
+            if error is not None:
+                raise error
+            yield path, data
+    finally:
+        stop.set()
+        slots.release()
+        thread.join()
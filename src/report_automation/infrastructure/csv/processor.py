@@ -1,13 +1,14 @@
 """CSV processing implementation."""
 
+import numpy as np
 import pandas as pd
 from pathlib import Path
-from typing import List, Dict, Any
+from typing import List, Dict, Any, Optional, Tuple
 from datetime import datetime
 import logging
 
-from ...domain.interfaces import DataProcessor
-from ...domain.models import CampaignData
+from ...domain.interfaces import CampaignRows, DataProcessor
+from ...domain.models import CampaignBatch, CampaignData
 
 
 logger = logging.getLogger(__name__)
@@ -27,6 +28,13 @@ class CSVProcessor(DataProcessor):
             "Casino A": ["casino", "Casino A"],
             "Sport B": ["sport", "Sport B"]
         }
+        self.period_patterns = {
+            "10m": ["10 min"],
+            "1h": ["1h", "1 h"],
+            "1d": ["1d", "2d"],
+            "3d": ["3d", "4d"],
+            "7d": ["7d", "8d"]
+        }
     
     def read_csv(self, file_path: Path) -> List[CampaignData]:
         """Read and validate CSV data into CampaignData models."""
@@ -76,12 +84,44 @@ class CSVProcessor(DataProcessor):
             logger.error(f"Error reading CSV file: {e}")
             raise
     
-    def validate_data(self, data: List[CampaignData]) -> bool:
+    def read_batch(self, file_path: Path) -> CampaignBatch:
+        """Read and validate CSV data into a columnar CampaignBatch.
+        
+        Rows failing ``CampaignData`` validation are skipped, as in ``read_csv``.
+        """
+        logger.info(f"Reading CSV file: {file_path}")
+        
+        if not file_path.exists():
+            raise FileNotFoundError(f"CSV file not found: {file_path}")
+        
+        try:
+            df = pd.read_csv(file_path)
+            logger.info(f"Loaded {len(df)} rows from CSV")
+            
+            self._validate_columns(df)
+            df = self._process_timestamps(df)
+            
+            batch = CampaignBatch.from_frame(df, drop_invalid=True)
+            skipped = len(df) - len(batch)
+            if skipped:
+                logger.warning(f"Skipped {skipped} invalid rows")
+            
+            logger.info(f"Successfully processed {len(batch)} valid rows")
+            return batch
+            
+        except Exception as e:
+            logger.error(f"Error reading CSV file: {e}")
+            raise
+    
+    def validate_data(self, data: CampaignRows) -> bool:
         """Validate campaign data meets business requirements."""
-        if not data:
+        if not len(data):
             logger.warning("No data to validate")
             return False
         
+        if isinstance(data, CampaignBatch):
+            return self._validate_batch(data)
+        
         # Check for basic data integrity
         for i, campaign in enumerate(data):
             # Validate metric relationships
@@ -100,50 +140,162 @@ class CSVProcessor(DataProcessor):
         logger.info(f"Data validation passed for {len(data)} records")
         return True
     
-    def filter_by_brand(self, data: List[CampaignData], brand: str) -> List[CampaignData]:
+    def filter_by_brand(self, data: CampaignRows, brand: str) -> CampaignRows:
         """Filter campaign data by brand patterns."""
         if brand not in self.brand_patterns:
             logger.warning(f"Unknown brand: {brand}")
-            return []
+            return data.take(np.array([], dtype=np.int64)) if isinstance(data, CampaignBatch) else []
         
-        patterns = self.brand_patterns[brand]
-        filtered_data = []
+        if isinstance(data, CampaignBatch):
+            filtered_data = data.take(np.flatnonzero(self._name_mask(
+                data, lambda template, campaign: self._matches_brand(template, campaign, brand)
+            )))
+            logger.info(f"Filtered {len(filtered_data)} records for brand: {brand}")
+            return filtered_data
         
-        for campaign in data:
-            # Check if any brand pattern matches template or campaign name
-            template_lower = campaign.template_name.lower()
-            campaign_lower = campaign.campaign_name.lower()
-            
-            if any(pattern.lower() in template_lower or pattern.lower() in campaign_lower 
-                   for pattern in patterns):
-                filtered_data.append(campaign)
+        filtered_data = [
+            campaign for campaign in data
+            if self._matches_brand(campaign.template_name, campaign.campaign_name, brand)
+        ]
         
         logger.info(f"Filtered {len(filtered_data)} records for brand: {brand}")
         return filtered_data
     
-    def filter_by_time_period(self, data: List[CampaignData], period: str) -> List[CampaignData]:
+    def filter_by_time_period(self, data: CampaignRows, period: str) -> CampaignRows:
         """Filter campaign data by time period."""
-        # Extract time period patterns from template names
-        filtered_data = []
+        if isinstance(data, CampaignBatch):
+            filtered_data = data.take(np.flatnonzero(self._name_mask(
+                data, lambda template, campaign: self._matches_period(template, period)
+            )))
+            logger.info(f"Filtered {len(filtered_data)} records for period: {period}")
+            return filtered_data
         
-        for campaign in data:
-            template_name = campaign.template_name.lower()
-            
-            # Check for direct period match in template name
-            if period == "10m" and "10 min" in template_name:
-                filtered_data.append(campaign)
-            elif period == "1h" and ("1h" in template_name or "1 h" in template_name):
-                filtered_data.append(campaign)
-            elif period == "1d" and ("1d" in template_name or "2d" in template_name):
-                filtered_data.append(campaign)
-            elif period == "3d" and ("3d" in template_name or "4d" in template_name):
-                filtered_data.append(campaign)
-            elif period == "7d" and ("7d" in template_name or "8d" in template_name):
-                filtered_data.append(campaign)
+        filtered_data = [
+            campaign for campaign in data
+            if self._matches_period(campaign.template_name, period)
+        ]
         
         logger.info(f"Filtered {len(filtered_data)} records for period: {period}")
         return filtered_data
     
+    def partition(self, data: CampaignRows, brands: Optional[List[str]] = None,
+                  periods: Optional[List[str]] = None) -> Dict[Tuple[str, str], np.ndarray]:
+        """Split campaign data into every brand x period partition in one pass.
+        
+        Returns row index arrays into ``data`` keyed by ``(brand, period)``, so
+        no partition copies the underlying records. Batches are partitioned
+        per distinct template/campaign pair without touching individual rows. A row lands in every
+        partition whose brand and period filters it would pass, exactly like
+        calling ``filter_by_brand`` and ``filter_by_time_period`` in turn.
+        """
+        brands = list(self.brand_patterns) if brands is None else brands
+        periods = list(self.period_patterns) if periods is None else periods
+        
+        known_brands = []
+        for brand in brands:
+            if brand in self.brand_patterns:
+                known_brands.append(brand)
+            else:
+                logger.warning(f"Unknown brand: {brand}")
+        
+        if isinstance(data, CampaignBatch):
+            return self._partition_batch(data, known_brands, brands, periods)
+        
+        # Template/campaign pairs repeat heavily, so each distinct pair is
+        # matched once and the resulting partition keys are reused.
+        keys_by_name: Dict[Tuple[str, str], List[Tuple[str, str]]] = {}
+        indices: Dict[Tuple[str, str], List[int]] = {
+            (brand, period): [] for brand in brands for period in periods
+        }
+        
+        for i, campaign in enumerate(data):
+            name_key = (campaign.template_name, campaign.campaign_name)
+            keys = keys_by_name.get(name_key)
+            if keys is None:
+                matched_periods = [p for p in periods if self._matches_period(campaign.template_name, p)]
+                keys = [
+                    (brand, period)
+                    for brand in known_brands
+                    if self._matches_brand(campaign.template_name, campaign.campaign_name, brand)
+                    for period in matched_periods
+                ]
+                keys_by_name[name_key] = keys
+            for key in keys:
+                indices[key].append(i)
+        
+        partitions = {key: np.asarray(rows, dtype=np.int64) for key, rows in indices.items()}
+        logger.info(f"Partitioned {len(data)} records into {len(partitions)} brand/period slices")
+        return partitions
+    
+    def _partition_batch(self, data: CampaignBatch, known_brands: List[str], brands: List[str],
+                         periods: List[str]) -> Dict[Tuple[str, str], np.ndarray]:
+        """Partition a batch by matching each distinct name pair once."""
+        codes, pairs = self._name_codes(data)
+        order = np.argsort(codes, kind='stable')
+        bounds = np.searchsorted(codes[order], np.arange(len(pairs) + 1))
+        
+        selected: Dict[Tuple[str, str], List[int]] = {
+            (brand, period): [] for brand in brands for period in periods
+        }
+        for code, (template_name, campaign_name) in enumerate(pairs):
+            matched_periods = [p for p in periods if self._matches_period(template_name, p)]
+            for brand in known_brands:
+                if self._matches_brand(template_name, campaign_name, brand):
+                    for period in matched_periods:
+                        selected[(brand, period)].append(code)
+        
+        partitions = {}
+        for key, key_codes in selected.items():
+            rows = [order[bounds[code]:bounds[code + 1]] for code in key_codes]
+            partitions[key] = np.sort(np.concatenate(rows)) if rows else np.array([], dtype=np.int64)
+        logger.info(f"Partitioned {len(data)} records into {len(partitions)} brand/period slices")
+        return partitions
+    
+    @staticmethod
+    def take(data: CampaignRows, indices: np.ndarray) -> CampaignRows:
+        """Materialize a partition returned by ``partition``."""
+        if isinstance(data, CampaignBatch):
+            return data.take(indices)
+        return [data[i] for i in indices]
+    
+    @staticmethod
+    def _name_codes(data: CampaignBatch) -> Tuple[np.ndarray, List[Tuple[str, str]]]:
+        """Factorize rows by (template_name, campaign_name) pair."""
+        codes, pairs = pd.MultiIndex.from_arrays(
+            [data.frame['template_name'], data.frame['campaign_name']]
+        ).factorize()
+        return codes.astype(np.int64), list(pairs)
+    
+    def _name_mask(self, data: CampaignBatch, matches) -> np.ndarray:
+        """Row mask from a predicate evaluated once per distinct name pair."""
+        codes, pairs = self._name_codes(data)
+        matched = np.array([matches(template, campaign) for template, campaign in pairs], dtype=bool)
+        return matched[codes] if len(pairs) else np.zeros(len(data), dtype=bool)
+    
+    def _validate_batch(self, data: CampaignBatch) -> bool:
+        """Vectorized ``validate_data`` for columnar batches."""
+        for name, bound in [("delivered", "sent"), ("opened", "delivered"), ("clicked", "opened")]:
+            rows = np.flatnonzero(data.column(name) > data.column(bound))
+            if len(rows):
+                i = rows[0]
+                logger.error(f"Row {i}: {name} ({data.column(name)[i]}) > {bound} ({data.column(bound)[i]})")
+                return False
+        
+        logger.info(f"Data validation passed for {len(data)} records")
+        return True
+    
+    def _matches_brand(self, template_name: str, campaign_name: str, brand: str) -> bool:
+        """Check if any brand pattern matches the template or campaign name."""
+        template_lower = template_name.lower()
+        campaign_lower = campaign_name.lower()
+        return any(pattern.lower() in template_lower or pattern.lower() in campaign_lower
+                   for pattern in self.brand_patterns[brand])
+    
+    def _matches_period(self, template_name: str, period: str) -> bool:
+        """Check for a direct period match in the template name."""
+        template_lower = template_name.lower()
+        return any(pattern in template_lower for pattern in self.period_patterns.get(period, []))
+    
     def _validate_columns(self, df: pd.DataFrame) -> None:
         """Validate that required columns are present."""
         missing_columns = [col for col in self.required_columns if col not in df.columns]
@@ -155,8 +307,11 @@ class CSVProcessor(DataProcessor):
     def _process_timestamps(self, df: pd.DataFrame) -> pd.DataFrame:
         """Process timestamp columns to datetime objects."""
         try:
-            # Convert timestamp column to datetime
-            df['timestamp'] = pd.to_datetime(df['timestamp'])
+            # Convert timestamp column to datetime; exports use epoch seconds
+            if pd.api.types.is_numeric_dtype(df['timestamp']):
+                df['timestamp'] = pd.to_datetime(df['timestamp'], unit='s')
+            else:
+                df['timestamp'] = pd.to_datetime(df['timestamp'])
             
             # Remove timezone info if present (for Excel compatibility)
             if df['timestamp'].dt.tz is not None:
@@ -169,23 +324,31 @@ class CSVProcessor(DataProcessor):
             logger.error(f"Error processing timestamps: {e}")
             raise ValueError(f"Invalid timestamp format: {e}")
     
-    def get_date_range(self, data: List[CampaignData]) -> tuple:
+    def get_date_range(self, data: CampaignRows) -> tuple:
         """Get the date range of the campaign data."""
-        if not data:
+        if not len(data):
             return None, None
         
-        timestamps = [campaign.timestamp for campaign in data]
-        min_date = min(timestamps)
-        max_date = max(timestamps)
+        if isinstance(data, CampaignBatch):
+            min_date = data.frame['timestamp'].min()
+            max_date = data.frame['timestamp'].max()
+        else:
+            timestamps = [campaign.timestamp for campaign in data]
+            min_date = min(timestamps)
+            max_date = max(timestamps)
         
         logger.info(f"Date range: {min_date.date()} to {max_date.date()}")
         return min_date, max_date
     
-    def get_template_summary(self, data: List[CampaignData]) -> Dict[str, int]:
+    def get_template_summary(self, data: CampaignRows) -> Dict[str, int]:
         """Get summary of templates and their counts."""
-        template_counts = {}
-        for campaign in data:
-            template_counts[campaign.template_name] = template_counts.get(campaign.template_name, 0) + 1
+        if isinstance(data, CampaignBatch):
+            counts = data.frame['template_name'].value_counts(sort=False)
+            template_counts = {name: int(count) for name, count in counts.items()}
+        else:
+            template_counts = {}
+            for campaign in data:
+                template_counts[campaign.template_name] = template_counts.get(campaign.template_name, 0) + 1
         
         logger.info(f"Found {len(template_counts)} unique templates")
         return template_counts
@@ -0,0 +1,138 @@
+"""Single-pass profiling of campaign CSV exports."""
+
+import pandas as pd
+import numpy as np
+from pathlib import Path
+from typing import Dict, Iterable, List, Optional, Union
+import logging
+
+from ...domain.models import DatasetProfile
+
+
+logger = logging.getLogger(__name__)
+
+PROFILE_METRICS = ["sent", "delivered", "opened", "clicked", "converted", "bounced", "unsubscribed"]
+# Only the simple report reads these; plugin exports may lack them
+OPTIONAL_METRICS = {"bounced"}
+
+# Rule name -> (metric, upper bound metric); mirrors CSVProcessor.validate_data
+FUNNEL_RULES = {
+    "delivered_gt_sent": ("delivered", "sent"),
+    "opened_gt_delivered": ("opened", "delivered"),
+    "clicked_gt_opened": ("clicked", "opened"),
+}
+NEGATIVE_RULE = "negative_metric"
+
+
+class DatasetProfiler:
+    """Compute a DatasetProfile for one or more exports in a single streaming pass.
+    
+    Every statistic is gathered from the same chunk as it is read, so the
+    file is scanned once and peak memory is bounded by ``chunksize`` plus one
+    8-byte row hash for duplicate detection. Rows are read as text, so a row
+    hashes the same whatever dtypes the rest of its chunk would infer and the
+    duplicate count does not depend on ``chunksize``.
+    """
+    
+    def __init__(self, chunksize: int = 500_000, sample_size: int = 10):
+        """Initialize profiler."""
+        self.chunksize = chunksize
+        self.sample_size = sample_size
+    
+    def profile(self, file_paths: Union[Path, List[Path]],
+                known_templates: Optional[Iterable[str]] = None) -> DatasetProfile:
+        """Profile CSV file(s); row indexes run on across files in order."""
+        if isinstance(file_paths, Path):
+            file_paths = [file_paths]
+        known = set(known_templates) if known_templates is not None else None
+        
+        row_count = 0
+        invalid_timestamps = 0
+        min_ts = max_ts = None
+        template_counts = pd.Series(dtype='int64')
+        campaign_counts = pd.Series(dtype='int64')
+        metric_totals: Dict[str, int] = {}
+        violation_counts = dict.fromkeys(list(FUNNEL_RULES) + [NEGATIVE_RULE], 0)
+        violation_samples: Dict[str, List[int]] = {rule: [] for rule in violation_counts}
+        row_hashes = []
+        
+        for path in file_paths:
+            if not path.exists():
+                raise FileNotFoundError(f"CSV file not found: {path}")
+            logger.info(f"Profiling CSV file: {path}")
+            
+            for chunk in pd.read_csv(path, chunksize=self.chunksize, dtype=str):
+                positions = np.arange(row_count, row_count + len(chunk))
+                row_hashes.append(pd.util.hash_pandas_object(chunk, index=False).to_numpy())
+                
+                timestamps = self._parse_timestamps(chunk['timestamp'])
+                invalid_timestamps += int(timestamps.isna().sum())
+                if timestamps.notna().any():
+                    chunk_min, chunk_max = timestamps.min(), timestamps.max()
+                    min_ts = chunk_min if min_ts is None else min(min_ts, chunk_min)
+                    max_ts = chunk_max if max_ts is None else max(max_ts, chunk_max)
+                
+                template_counts = template_counts.add(
+                    chunk['template_name'].astype(str).value_counts(), fill_value=0)
+                campaign_counts = campaign_counts.add(
+                    chunk['campaign_name'].astype(str).value_counts(), fill_value=0)
+                
+                columns = [m for m in PROFILE_METRICS if m in chunk.columns or m not in OPTIONAL_METRICS]
+                metrics = chunk[columns].apply(pd.to_numeric, errors='coerce').fillna(0)
+                for metric, total in metrics.sum().items():
+                    metric_totals[metric] = metric_totals.get(metric, 0) + int(total)
+                
+                masks = {rule: (metrics[metric] > metrics[bound]).to_numpy()
+                         for rule, (metric, bound) in FUNNEL_RULES.items()}
+                masks[NEGATIVE_RULE] = (metrics < 0).any(axis=1).to_numpy()
+                for rule, mask in masks.items():
+                    violation_counts[rule] += int(mask.sum())
+                    room = self.sample_size - len(violation_samples[rule])
+                    if room > 0:
+                        violation_samples[rule].extend(positions[mask][:room].tolist())
+                
+                row_count += len(chunk)
+        
+        duplicate_positions = self._duplicate_positions(row_hashes)
+        template_counts = template_counts.astype('int64')
+        unmapped = {}
+        if known is not None:
+            unmapped = {name: int(count) for name, count in template_counts.items() if name not in known}
+        
+        profile = DatasetProfile(
+            source_files=[path.name for path in file_paths],
+            row_count=row_count,
+            min_timestamp=None if min_ts is None else min_ts.to_pydatetime(),
+            max_timestamp=None if max_ts is None else max_ts.to_pydatetime(),
+            invalid_timestamps=invalid_timestamps,
+            template_counts={name: int(count) for name, count in template_counts.items()},
+            campaign_counts={name: int(count) for name, count in campaign_counts.astype('int64').items()},
+            metric_totals=metric_totals,
+            violation_counts=violation_counts,
+            violation_samples=violation_samples,
+            duplicate_rows=len(duplicate_positions),
+            duplicate_samples=duplicate_positions[:self.sample_size].tolist(),
+            unmapped_templates=unmapped,
+        )
+        logger.info(f"Profiled {row_count} rows from {len(file_paths)} file(s)")
+        return profile
+    
+    def _parse_timestamps(self, column: pd.Series) -> pd.Series:
+        """Parse epoch-second or textual timestamps, NaT where blank or invalid."""
+        numeric = pd.to_numeric(column, errors='coerce')
+        parsed = pd.to_datetime(numeric, unit='s')
+        text = numeric.isna() & column.notna()
+        if text.any():
+            parsed = parsed.astype('datetime64[ns]')
+            parsed[text] = pd.to_datetime(column[text], errors='coerce', utc=True).dt.tz_localize(None)
+        return parsed
+    
+    def _duplicate_positions(self, row_hashes: List[np.ndarray]) -> np.ndarray:
+        """Return sorted positions of rows whose hash was already seen."""
+        if not row_hashes:
+            return np.array([], dtype=np.int64)
+        hashes = np.concatenate(row_hashes)
+        order = np.argsort(hashes, kind='stable')
+        repeated = np.zeros(len(hashes), dtype=bool)
+        repeated[1:] = hashes[order][1:] == hashes[order][:-1]
+        return np.sort(order[repeated])
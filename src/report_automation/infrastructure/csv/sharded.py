@@ -0,0 +1,137 @@
+"""Parallel sharded parsing of a single large CSV export."""
+
+import io
+import os
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+from typing import List, Optional, Sequence, Tuple
+import logging
+
+import pandas as pd
+
+from ...domain.services import METRICS, WeeklyAggregate
+from ..aggregates.spill import SpillingAggregator
+
+
+logger = logging.getLogger(__name__)
+
+# Columns whose type must not depend on which rows a shard happens to see
+SHARD_DTYPES = {"template_name": str, "campaign_name": str}
+# Rough in-memory size of one parsed row, used to size chunks under a memory budget
+ROW_MEMORY_ESTIMATE = 512
+
+
+class _ByteRangeReader(io.RawIOBase):
+    """Readable stream yielding a CSV header followed by one byte range of a file."""
+    
+    def __init__(self, path: Path, header: bytes, start: int, end: int):
+        self._file = open(path, 'rb')
+        self._file.seek(start)
+        self._header = header
+        self._remaining = end - start
+    
+    def readable(self) -> bool:
+        return True
+    
+    def readinto(self, buffer) -> int:
+        if self._header:
+            size = min(len(buffer), len(self._header))
+            buffer[:size] = self._header[:size]
+            self._header = self._header[size:]
+            return size
+        size = min(len(buffer), self._remaining)
+        if size <= 0:
+            return 0
+        data = self._file.read(size)
+        buffer[:len(data)] = data
+        self._remaining -= len(data)
+        return len(data)
+    
+    def close(self) -> None:
+        self._file.close()
+        super().close()
+
+
+def aggregate_byte_range(path: Path, header: bytes, start: int, end: int,
+                         boundaries: Sequence[Tuple[str, str]], metrics: List[str] = METRICS,
+                         chunksize: int = 500_000, max_memory: Optional[int] = None) -> WeeklyAggregate:
+    """Parse the rows in ``[start, end)`` (behind ``header``) in chunks into weekly sums.
+    
+    With ``max_memory`` (bytes) half the budget bounds the parsed chunk and
+    half the accumulated sums, which spill to disk when they outgrow it.
+    """
+    if max_memory:
+        chunksize = max(1_000, min(chunksize, max_memory // 2 // ROW_MEMORY_ESTIMATE))
+    
+    with SpillingAggregator(max_memory // 2 if max_memory else None) as partials:
+        added = False
+        with io.BufferedReader(_ByteRangeReader(path, header, start, end)) as stream:
+            for chunk in pd.read_csv(stream, chunksize=chunksize, dtype=SHARD_DTYPES):
+                chunk['datetime'] = pd.to_datetime(chunk['timestamp'], unit='s')
+                partials.add(WeeklyAggregate.from_frame(chunk, boundaries, metrics))
+                added = True
+        if added:
+            return partials.result()
+    
+    empty = pd.read_csv(io.BytesIO(header), dtype=SHARD_DTYPES)
+    empty['datetime'] = pd.to_datetime(empty['timestamp'], unit='s')
+    return WeeklyAggregate.from_frame(empty, boundaries, metrics)
+
+
+class ShardedCSVReader:
+    """Split one CSV at newline-aligned byte offsets and aggregate shards in parallel.
+    
+    Each worker process parses its own byte range and returns per-(week,
+    template) partial sums, which are merged in file order. Because the sums
+    are additive the result equals the single-process aggregate exactly.
+    Fields containing quoted newlines are not supported. ``max_memory``
+    (bytes) is split evenly between the concurrently running shards.
+    """
+    
+    def __init__(self, workers: Optional[int] = None, min_shard_bytes: int = 32 * 1024 * 1024,
+                 chunksize: int = 500_000, max_memory: Optional[int] = None):
+        """Initialize sharded reader."""
+        self.workers = workers or os.cpu_count() or 1
+        self.min_shard_bytes = min_shard_bytes
+        self.chunksize = chunksize
+        self.max_memory = max_memory
+    
+    def plan_shards(self, path: Path) -> Tuple[bytes, List[Tuple[int, int]]]:
+        """Return the header line and ``(start, end)`` byte ranges of each shard."""
+        size = path.stat().st_size
+        with open(path, 'rb') as f:
+            header = f.readline()
+            data_start = f.tell()
+            
+            shard_count = max(1, min(self.workers, (size - data_start) // max(self.min_shard_bytes, 1)))
+            step = (size - data_start) // shard_count
+            
+            offsets = [data_start]
+            for i in range(1, shard_count):
+                f.seek(data_start + i * step)
+                f.readline()  # advance to the start of the next full row
+                offset = min(f.tell(), size)
+                if offset > offsets[-1]:
+                    offsets.append(offset)
+            offsets.append(size)
+        
+        shards = [(start, end) for start, end in zip(offsets, offsets[1:]) if end > start]
+        return header, shards or [(data_start, size)]
+    
+    def aggregate(self, path: Path, boundaries: Sequence[Tuple[str, str]],
+                  metrics: List[str] = METRICS) -> WeeklyAggregate:
+        """Aggregate a CSV file into weekly per-template sums using all shards."""
+        header, shards = self.plan_shards(path)
+        logger.info(f"Reading {path.name} in {len(shards)} shard(s) with {self.workers} worker(s)")
+        
+        concurrent = min(self.workers, len(shards))
+        shard_memory = self.max_memory // concurrent if self.max_memory else None
+        args = [(path, header, start, end, boundaries, metrics, self.chunksize, shard_memory)
+                for start, end in shards]
+        if len(shards) == 1:
+            partials = [aggregate_byte_range(*args[0])]
+        else:
+            with ProcessPoolExecutor(max_workers=concurrent) as pool:
+                partials = list(pool.map(aggregate_byte_range, *zip(*args)))
+        
+        return WeeklyAggregate.combine(partials)
@@ -0,0 +1,110 @@
+"""Parsed input frames placed in shared memory for process pools."""
+
+from multiprocessing import shared_memory
+from typing import Iterable, List, Optional, Tuple
+import logging
+
+import numpy as np
+import pandas as pd
+
+
+logger = logging.getLogger(__name__)
+
+ALIGNMENT = 64
+
+
+class SharedFrameHandle:
+    """Picklable description of a ``SharedFrame``: block name, row count and column layout.
+    
+    Each column entry is ``(name, dtype, offset, categories)``; text columns
+    are stored as category codes and carry their distinct values.
+    """
+    
+    def __init__(self, name: str, rows: int, columns: List[Tuple[str, str, int, Optional[List[str]]]]):
+        """Initialize handle."""
+        self.name = name
+        self.rows = rows
+        self.columns = columns
+
+
+class SharedFrame:
+    """A DataFrame whose column buffers live in one ``multiprocessing.shared_memory`` block.
+    
+    The process that parsed the input calls ``create`` once and passes the
+    small ``handle`` to workers; ``attach`` there gives a read-only frame
+    backed by the same pages, so N workers hold one copy of the data.
+    Numeric and datetime columns are stored as-is, text columns as category
+    codes. Only the creating process unlinks the block.
+    """
+    
+    def __init__(self, shm: shared_memory.SharedMemory, handle: SharedFrameHandle, owner: bool):
+        """Wrap an open shared-memory block; use ``create`` or ``attach``."""
+        self._shm = shm
+        self.handle = handle
+        self.owner = owner
+    
+    @classmethod
+    def create(cls, frame: pd.DataFrame, columns: Optional[Iterable[str]] = None) -> "SharedFrame":
+        """Copy ``frame`` (or the given columns of it) into a new shared-memory block."""
+        columns = list(frame.columns) if columns is None else [c for c in columns if c in frame.columns]
+        
+        arrays = []
+        for column in columns:
+            values = frame[column]
+            if isinstance(values.dtype, np.dtype) and values.dtype.kind in "biufmM":
+                arrays.append((column, np.ascontiguousarray(values.to_numpy()), None))
+            else:
+                categorical = values.astype('category').array
+                arrays.append((column, categorical.codes, categorical.categories.tolist()))
+        
+        layout = []
+        size = 0
+        for column, array, categories in arrays:
+            offset = -(-size // ALIGNMENT) * ALIGNMENT
+            layout.append((column, array.dtype.str, offset, categories))
+            size = offset + array.nbytes
+        
+        shm = shared_memory.SharedMemory(create=True, size=max(size, 1))
+        handle = SharedFrameHandle(shm.name, len(frame), layout)
+        for (column, array, _), (_, _, offset, _) in zip(arrays, layout):
+            target = np.ndarray(array.shape, dtype=array.dtype, buffer=shm.buf, offset=offset)
+            target[...] = array
+            del target
+        logger.info(f"Shared {len(frame)} rows x {len(columns)} columns in {size / 1024 ** 2:.1f} MiB")
+        return cls(shm, handle, owner=True)
+    
+    @classmethod
+    def attach(cls, handle: SharedFrameHandle) -> "SharedFrame":
+        """Open a block created by another process."""
+        return cls(shared_memory.SharedMemory(name=handle.name), handle, owner=False)
+    
+    @property
+    def frame(self) -> pd.DataFrame:
+        """Read-only zero-copy view of the shared columns."""
+        data = {}
+        for column, dtype, offset, categories in self.handle.columns:
+            array = np.ndarray((self.handle.rows,), dtype=np.dtype(dtype), buffer=self._shm.buf, offset=offset)
+            array.flags.writeable = False
+            if categories is None:
+                data[column] = array
+            else:
+                data[column] = pd.Categorical.from_codes(
+                    array, dtype=pd.CategoricalDtype(categories), validate=False
+                )
+        return pd.DataFrame(data, copy=False)
+    
+    def close(self) -> None:
+        """Detach from the block; the owner also frees it."""
+        try:
+            self._shm.close()
+        except BufferError:
+            # A view is still referenced; the mapping goes away with the process
+            logger.debug(f"Shared frame {self.handle.name} still in use at close")
+        if self.owner:
+            self._shm.unlink()
+    
+    def __enter__(self) -> "SharedFrame":
+        return self
+    
+    def __exit__(self, *exc_info) -> None:
+        self.close()
@@ -0,0 +1,204 @@
+"""Incremental ingestion of CSV exports that grow between runs."""
+
+import hashlib
+import os
+import time
+from pathlib import Path
+from typing import Dict, List, Optional, Sequence, Tuple
+import logging
+
+from ...domain.services import METRICS, WeeklyAggregate
+from ..aggregates import PartialAggregate, read_partial, write_partial
+from .sharded import aggregate_byte_range
+
+
+logger = logging.getLogger(__name__)
+
+HASH_BLOCK_SIZE = 1024 * 1024
+
+
+class FileWatermark:
+    """How far into one file rows have been aggregated."""
+    
+    def __init__(self, offset: int, header: bytes, digest: str, aggregate: WeeklyAggregate,
+                 size: int = -1, mtime_ns: int = -1):
+        """Initialize watermark; ``offset`` is the end of the last complete row read.
+        
+        ``digest`` is the SHA-256 of the up to ``HASH_BLOCK_SIZE`` bytes
+        before ``offset``; ``size`` and ``mtime_ns`` are the file's size and
+        modification time when it was last looked at.
+        """
+        self.offset = offset
+        self.header = header
+        self.digest = digest
+        self.aggregate = aggregate
+        self.size = size
+        self.mtime_ns = mtime_ns
+
+
+class TailAggregator:
+    """Keeps per-file weekly aggregates up to date by parsing only new rows.
+    
+    Each file's watermark is the byte offset just past the last complete row
+    already aggregated, with the header line, a checksum of the block before
+    the offset and the file's size and modification time. ``update`` parses
+    the bytes appended since then and folds them into the stored aggregate.
+    A file whose header or last read block changed, or that shrank, is
+    re-read from the start; an untouched file (same size and modification
+    time) is not read at all, so the cost of an update does not grow with
+    the already-ingested prefix.
+    
+    Bytes after the last newline are a row still being written, unless the
+    file has settled: unchanged since the previous update, or not modified
+    for ``settle`` seconds. A settled file's unterminated last row is
+    aggregated into the returned result but kept out of the watermark, so it
+    is read again (and correctly, should it turn out to grow) next time.
+    
+    With a ``state_path`` the watermarks and aggregates are kept in a partial
+    aggregate file, so the next process resumes where this one stopped.
+    """
+    
+    def __init__(self, boundaries: Sequence[Tuple[str, str]], metrics: List[str] = METRICS,
+                 chunksize: int = 500_000, state_path: Optional[Path] = None,
+                 report_type: str = "", settle: float = 2.0):
+        """Initialize aggregator for one set of week boundaries, loading ``state_path`` if present."""
+        self.boundaries = [tuple(boundary) for boundary in boundaries]
+        self.metrics = metrics
+        self.chunksize = chunksize
+        self.state_path = Path(state_path) if state_path else None
+        self.report_type = report_type
+        self.settle = settle
+        self._watermarks: Dict[Path, FileWatermark] = {}
+        
+        if self.state_path is not None and self.state_path.exists():
+            self.load_state()
+    
+    def update(self, path: Path) -> WeeklyAggregate:
+        """Fold any rows appended to ``path`` into its aggregate and return it."""
+        path = Path(path).resolve()
+        with open(path, 'rb') as f:
+            stat = os.fstat(f.fileno())
+            header = f.readline()
+            data_start = f.tell()
+            end = _complete_rows_end(f, data_start, stat.st_size)
+            
+            watermark = self._watermarks.get(path)
+            if watermark is not None and not _extends(f, watermark, header, stat):
+                logger.info(f"{path.name} was rewritten; re-reading it from the start")
+                watermark = None
+            unchanged = (watermark is not None
+                         and (watermark.size, watermark.mtime_ns) == (stat.st_size, stat.st_mtime_ns))
+            
+            start = data_start if watermark is None else watermark.offset
+            end = max(end, start)
+            if watermark is None or end > start:
+                digest = _hash_range(f, hashlib.sha256(), max(0, end - HASH_BLOCK_SIZE), end).hexdigest()
+        
+        if watermark is None or end > start:
+            tail = aggregate_byte_range(path, header, start, end, self.boundaries, self.metrics, self.chunksize)
+            aggregate = tail if watermark is None else WeeklyAggregate.combine([watermark.aggregate, tail])
+            watermark = self._watermarks[path] = FileWatermark(end, header, digest, aggregate)
+            logger.info(f"Ingested {end - start} new bytes of {path.name}")
+        if not unchanged:
+            watermark.size, watermark.mtime_ns = stat.st_size, stat.st_mtime_ns
+            if self.state_path is not None:
+                self.save_state()
+        
+        settled = unchanged or time.time() - stat.st_mtime >= self.settle
+        if stat.st_size > end and settled:
+            # A finished export need not end with a newline
+            last_row = aggregate_byte_range(path, header, end, stat.st_size, self.boundaries, self.metrics,
+                                            self.chunksize)
+            return WeeklyAggregate.combine([watermark.aggregate, last_row])
+        return watermark.aggregate
+    
+    def paths(self) -> List[Path]:
+        """Files with a watermark."""
+        return list(self._watermarks)
+    
+    def watermark(self, path: Path) -> Optional[FileWatermark]:
+        """Current watermark of a file, if it was ingested."""
+        return self._watermarks.get(Path(path).resolve())
+    
+    def forget(self, path: Path) -> None:
+        """Drop a file's watermark and aggregate."""
+        if self._watermarks.pop(Path(path).resolve(), None) is not None and self.state_path is not None:
+            self.save_state()
+    
+    def save_state(self) -> Path:
+        """Write watermarks and aggregates to ``state_path``."""
+        if self.state_path is None:
+            raise ValueError("TailAggregator has no state_path")
+        watermarks = {
+            str(path): {
+                "offset": watermark.offset,
+                "header": watermark.header.decode('latin-1'),
+                "digest": watermark.digest,
+                "size": watermark.size,
+                "mtime_ns": watermark.mtime_ns,
+            }
+            for path, watermark in self._watermarks.items()
+        }
+        sections = {str(path): watermark.aggregate for path, watermark in self._watermarks.items()}
+        partial = PartialAggregate(self.report_type, self.boundaries, sections,
+                                   {"metrics": self.metrics, "watermarks": watermarks})
+        
+        tmp_path = self.state_path.with_name(f"{self.state_path.name}.{os.getpid()}.tmp")
+        write_partial(tmp_path, partial)
+        os.replace(tmp_path, self.state_path)
+        return self.state_path
+    
+    def load_state(self) -> None:
+        """Restore watermarks from ``state_path``; unusable state is ignored."""
+        try:
+            partial = read_partial(self.state_path)
+        except Exception as e:
+            logger.warning(f"Ignoring unreadable ingest state {self.state_path}: {e}")
+            return
+        if partial.weekly_boundaries != self.boundaries or partial.metadata.get("metrics") != self.metrics:
+            logger.info(f"Ingest state {self.state_path} was built for other settings; starting over")
+            return
+        
+        for name, entry in partial.metadata.get("watermarks", {}).items():
+            self._watermarks[Path(name)] = FileWatermark(
+                entry["offset"], entry["header"].encode('latin-1'), entry["digest"], partial.sections[name],
+                entry.get("size", -1), entry.get("mtime_ns", -1)
+            )
+        logger.info(f"Resumed {len(self._watermarks)} file watermark(s) from {self.state_path}")
+
+
+def _complete_rows_end(f, data_start: int, size: int, block_size: int = 64 * 1024) -> int:
+    """Offset just past the last newline at or after ``data_start`` (later bytes are an incomplete row)."""
+    position = size
+    while position > data_start:
+        start = max(data_start, position - block_size)
+        f.seek(start)
+        block = f.read(position - start)
+        newline = block.rfind(b"\n")
+        if newline != -1:
+            return start + newline + 1
+        position = start
+    return data_start
+
+
+def _extends(f, watermark: FileWatermark, header: bytes, stat: os.stat_result) -> bool:
+    """Whether an open file still starts with what ``watermark`` ingested."""
+    if watermark.header != header or stat.st_size < watermark.offset:
+        return False
+    if (watermark.size, watermark.mtime_ns) == (stat.st_size, stat.st_mtime_ns):
+        return True
+    start = max(0, watermark.offset - HASH_BLOCK_SIZE)
+    return _hash_range(f, hashlib.sha256(), start, watermark.offset).hexdigest() == watermark.digest
+
+
+def _hash_range(f, digest, start: int, end: int):
+    """Feed bytes ``[start, end)`` of an open file into ``digest`` and return it."""
+    f.seek(start)
+    remaining = end - start
+    while remaining > 0:
+        block = f.read(min(HASH_BLOCK_SIZE, remaining))
+        if not block:
+            break
+        digest.update(block)
+        remaining -= len(block)
+    return digest
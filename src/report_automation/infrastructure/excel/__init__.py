@@ -1,9 +1,24 @@
 """Excel generation and formatting."""
 
+from .diff import WorkbookDiffer
 from .generator import ExcelGeneratorImpl, ExcelFormatterImpl, SimpleExcelGenerator
+from .skeleton import SKELETONS, SkeletonCache, WorkbookSkeleton
+from .validator import StreamingExcelValidator, simple_report_cells
 
 # Alias for easier importing
 ExcelGenerator = ExcelGeneratorImpl
 ExcelFormatter = ExcelFormatterImpl
 
-__all__ = ["ExcelGenerator", "ExcelGeneratorImpl", "ExcelFormatter", "ExcelFormatterImpl", "SimpleExcelGenerator"]
+__all__ = [
+    "ExcelGenerator",
+    "ExcelGeneratorImpl",
+    "ExcelFormatter",
+    "ExcelFormatterImpl",
+    "SKELETONS",
+    "SimpleExcelGenerator",
+    "SkeletonCache",
+    "StreamingExcelValidator",
+    "WorkbookDiffer",
+    "WorkbookSkeleton",
+    "simple_report_cells",
+]
@@ -0,0 +1,160 @@
+"""Streaming cell-by-cell comparison of two workbooks."""
+
+import numbers
+from itertools import zip_longest
+from pathlib import Path
+from typing import Any, Iterator, List, Optional, Sequence, Tuple
+import logging
+
+from openpyxl import load_workbook
+from openpyxl.utils import column_index_from_string, get_column_letter
+
+from ...domain.models import BlockDiff, CellDiff, WorkbookDiff
+from ...domain.models.diff import CHANGED, MISSED, UNCHANGED
+
+
+logger = logging.getLogger(__name__)
+
+
+class WorkbookDiffer:
+    """Compare chosen sheets and columns of two workbooks row by row.
+    
+    Both workbooks are opened read-only and their rows are streamed in
+    lockstep, so memory stays bounded by one row whatever the sheet size.
+    Rows are grouped into blocks by the labels in ``block_columns``
+    (campaign in B and template in D by default): a label carries down to
+    the following rows until the next one, and a new campaign resets the
+    template.
+    
+    Each compared cell is *changed* (values differ), *unchanged* (same
+    value) or *missed* (a value was emptied; with ``expect_change``, also
+    any cell that did not change, as after an incomplete week
+    replacement). Cells empty on both sides are only compared on rows with
+    a value in ``label_column`` (e.g. the metric name column), so skipped
+    writes into empty target cells are found too.
+    """
+    
+    def __init__(self, columns: Optional[str] = None, rows: Optional[Tuple[int, Optional[int]]] = None,
+                 block_columns: Sequence[str] = ("B", "D"), label_column: Optional[str] = None,
+                 expect_change: bool = False, tolerance: float = 1e-9, sample_size: int = 50):
+        """Initialize differ; ``columns`` is a letter range such as ``BE`` or ``BE:BH`` (all if None)."""
+        self.columns = columns
+        self.rows = rows
+        self.block_columns = list(block_columns)
+        self.label_column = label_column
+        self.expect_change = expect_change
+        self.tolerance = tolerance
+        self.sample_size = sample_size
+    
+    def diff(self, old_path: Path, new_path: Path, sheets: Optional[List[str]] = None) -> WorkbookDiff:
+        """Compare ``sheets`` (default: those in both workbooks, else the active sheets)."""
+        old_wb = load_workbook(old_path, read_only=True, data_only=True)
+        new_wb = load_workbook(new_path, read_only=True, data_only=True)
+        try:
+            pairs = self._sheet_pairs(old_wb, new_wb, sheets)
+            result = WorkbookDiff(old_file=str(old_path), new_file=str(new_path), sheets=[name for name, _, _ in pairs],
+                                  columns=self.columns, expect_change=self.expect_change)
+            for name, old_ws, new_ws in pairs:
+                self._diff_sheet(name, old_ws, new_ws, result)
+        finally:
+            old_wb.close()
+            new_wb.close()
+        logger.info(f"Compared {result.cells} cells: {result.changed} changed, {result.unchanged} unchanged, "
+                    f"{result.missed} missed")
+        return result
+    
+    def _sheet_pairs(self, old_wb, new_wb, sheets: Optional[List[str]]) -> List[Tuple[str, Any, Any]]:
+        if sheets:
+            for name in sheets:
+                for wb, path in ((old_wb, "old"), (new_wb, "new")):
+                    if name not in wb.sheetnames:
+                        raise ValueError(f"Sheet '{name}' not found in {path} workbook "
+                                         f"(has: {', '.join(wb.sheetnames)})")
+            return [(name, old_wb[name], new_wb[name]) for name in sheets]
+        common = [name for name in new_wb.sheetnames if name in old_wb.sheetnames]
+        if common:
+            return [(name, old_wb[name], new_wb[name]) for name in common]
+        return [(new_wb.active.title, old_wb.active, new_wb.active)]
+    
+    def _column_span(self, old_ws, new_ws) -> Tuple[int, int, int, int]:
+        """(first compared, last compared, first read, last read) column indexes."""
+        if self.columns:
+            start, _, end = self.columns.partition(":")
+            first, last = column_index_from_string(start.strip()), column_index_from_string((end or start).strip())
+        else:
+            first, last = 1, max(old_ws.max_column or 1, new_ws.max_column or 1)
+        extra = [column_index_from_string(c) for c in self.block_columns]
+        if self.label_column:
+            extra.append(column_index_from_string(self.label_column))
+        return first, last, min([first] + extra), max([last] + extra)
+    
+    def _rows(self, ws, first_col: int, last_col: int) -> Iterator[Tuple[Any, ...]]:
+        min_row, max_row = self.rows or (1, None)
+        return ws.iter_rows(min_row=min_row, max_row=max_row, min_col=first_col, max_col=last_col, values_only=True)
+    
+    def _diff_sheet(self, name: str, old_ws, new_ws, result: WorkbookDiff) -> None:
+        first, last, read_first, read_last = self._column_span(old_ws, new_ws)
+        compared = range(first - read_first, last - read_first + 1)
+        block_offsets = [column_index_from_string(c) - read_first for c in self.block_columns]
+        label_offset = column_index_from_string(self.label_column) - read_first if self.label_column else None
+        empty_row = (None,) * (read_last - read_first + 1)
+        
+        labels: List[Optional[str]] = [None] * len(block_offsets)
+        block: Optional[BlockDiff] = None
+        # Plain counters per block; pydantic attribute writes per cell are slow
+        counts = {CHANGED: 0, UNCHANGED: 0, MISSED: 0}
+        blocks: List[Tuple[BlockDiff, dict]] = []
+        row_number = (self.rows or (1, None))[0] - 1
+        for old_row, new_row in zip_longest(self._rows(old_ws, read_first, read_last),
+                                            self._rows(new_ws, read_first, read_last), fillvalue=empty_row):
+            row_number += 1
+            
+            # Block labels come from the new workbook, carried down until the next label
+            for i, offset in enumerate(block_offsets):
+                value = new_row[offset]
+                if value is not None and str(value).strip():
+                    # A new outer label clears inner ones; inner labels on the same row are read next
+                    labels[i:] = [str(value).strip()] + [None] * (len(labels) - i - 1)
+            if block is None or block.labels != labels:
+                block = BlockDiff(sheet=name, labels=list(labels), first_row=row_number, last_row=row_number)
+                counts = {CHANGED: 0, UNCHANGED: 0, MISSED: 0}
+                blocks.append((block, counts))
+            
+            labelled = label_offset is not None and new_row[label_offset] is not None
+            row_compared = False
+            for offset in compared:
+                old, new = old_row[offset], new_row[offset]
+                if old is None and new is None and not labelled:
+                    continue
+                status = self._status(old, new)
+                counts[status] += 1
+                row_compared = True
+                if status != UNCHANGED and len(result.samples) < self.sample_size:
+                    coordinate = f"{get_column_letter(read_first + offset)}{row_number}"
+                    result.samples.append(CellDiff(sheet=name, coordinate=coordinate, status=status,
+                                                   old=old, new=new))
+            if row_compared:
+                block.last_row = row_number
+        
+        for block, counts in blocks:
+            # Blocks without compared cells (label-only rows) are not reported
+            if not any(counts.values()):
+                continue
+            block.changed, block.unchanged, block.missed = counts[CHANGED], counts[UNCHANGED], counts[MISSED]
+            result.blocks.append(block)
+            result.changed += block.changed
+            result.unchanged += block.unchanged
+            result.missed += block.missed
+            result.cells += block.changed + block.unchanged + block.missed
+    
+    def _status(self, old: Any, new: Any) -> str:
+        if self._equal(old, new):
+            return MISSED if self.expect_change else UNCHANGED
+        if new is None and old is not None:
+            return MISSED
+        return CHANGED
+    
+    def _equal(self, old: Any, new: Any) -> bool:
+        if isinstance(old, numbers.Real) and isinstance(new, numbers.Real):
+            return abs(old - new) <= self.tolerance
+        return old == new
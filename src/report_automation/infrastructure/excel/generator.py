@@ -1,19 +1,27 @@
 """Excel generation implementation."""
 
 from pathlib import Path
-from typing import Dict, List, Any, Optional
+from typing import Dict, List, Any, Optional, Union
 import logging
 
+import numpy as np
+
 from openpyxl import Workbook, load_workbook
 from openpyxl.styles import Font, PatternFill, Alignment, Border, Side
 from openpyxl.utils import get_column_letter
 
 from ...domain.interfaces import ExcelGenerator, ExcelFormatter
-from ...domain.models import ProcessedData, WorksheetLayout, CellStyle
+from ...domain.models import ArrayProcessedData, ProcessedData, WorksheetLayout, CellStyle
 
 
 logger = logging.getLogger(__name__)
 
+# Simple report layout: period headers in row 1 from column B, metric rows from row 2
+SIMPLE_METRIC_LABELS = ["Sent", "Delivered", "Opened", "Clicked", "Converted",
+                        "% Delivered", "% Open", "% Click", "% CR"]
+SIMPLE_METRICS = ["sent", "delivered", "opened", "clicked", "converted"]
+SIMPLE_PERCENTAGE_METRICS = ["% Delivered", "% Open", "% Click", "% CR"]
+
 
 class ExcelGeneratorImpl(ExcelGenerator):
     """Implementation of Excel file generation."""
@@ -46,7 +54,7 @@ class ExcelGeneratorImpl(ExcelGenerator):
         
         return worksheet
     
-    def populate_data(self, worksheet: Any, data: ProcessedData) -> None:
+    def populate_data(self, worksheet: Any, data: Union[ProcessedData, ArrayProcessedData]) -> None:
         """Populate worksheet with processed data."""
         logger.info(f"Populating data for report type: {data.report_type}")
         
@@ -85,7 +93,7 @@ class ExcelGeneratorImpl(ExcelGenerator):
         
         logger.debug(f"Applied formatting for layout: {layout.name}")
     
-    def _add_headers(self, worksheet: Any, data: ProcessedData) -> None:
+    def _add_headers(self, worksheet: Any, data: Union[ProcessedData, ArrayProcessedData]) -> None:
         """Add header rows to worksheet."""
         # Add time period headers
         col_offset = 2  # Start after row labels
@@ -96,18 +104,19 @@ class ExcelGeneratorImpl(ExcelGenerator):
             cell.alignment = Alignment(horizontal='center')
         
         # Add metric labels
-        metrics = ["Sent", "Delivered", "Opened", "Clicked", "Converted", 
-                  "% Delivered", "% Open", "% Click", "% CR"]
-        
-        for i, metric in enumerate(metrics):
+        for i, metric in enumerate(SIMPLE_METRIC_LABELS):
             cell = worksheet.cell(row=2 + i, column=1)
             cell.value = metric
             cell.font = Font(bold=True)
     
-    def _add_data_rows(self, worksheet: Any, data: ProcessedData) -> None:
+    def _add_data_rows(self, worksheet: Any, data: Union[ProcessedData, ArrayProcessedData]) -> None:
         """Add data rows to worksheet."""
-        metrics = ["sent", "delivered", "opened", "clicked", "converted"]
-        percentage_metrics = ["% Delivered", "% Open", "% Click", "% CR"]
+        metrics = SIMPLE_METRICS
+        percentage_metrics = SIMPLE_PERCENTAGE_METRICS
+        
+        if isinstance(data, ArrayProcessedData):
+            self._add_array_rows(worksheet, data, metrics, percentage_metrics)
+            return
         
         # Add totals data
         col_offset = 2
@@ -128,6 +137,26 @@ class ExcelGeneratorImpl(ExcelGenerator):
                         if metric in percentages:
                             cell = worksheet.cell(row=2 + len(metrics) + j, column=col_offset + i)
                             cell.value = f"{percentages[metric]:.2f}%"
+    
+    def _add_array_rows(self, worksheet: Any, data: ArrayProcessedData,
+                        metrics: List[str], percentage_metrics: List[str]) -> None:
+        """Write totals straight from the arrays, one column per period."""
+        metric_rows = [(2 + j, data.metrics.index(m)) for j, m in enumerate(metrics) if m in data.metrics]
+        percentage_rows = [
+            (2 + len(metrics) + j, data.percentage_metrics.index(m))
+            for j, m in enumerate(percentage_metrics) if m in data.percentage_metrics
+        ]
+        totals = data.totals_array.tolist()
+        
+        col_offset = 2
+        for i in range(len(data.time_periods)):
+            column = col_offset + i
+            for row, k in metric_rows:
+                worksheet.cell(row=row, column=column, value=totals[i][k])
+            for row, k in percentage_rows:
+                value = data.percentages_array[i, k]
+                if not np.isnan(value):
+                    worksheet.cell(row=row, column=column, value=f"{value:.2f}%")
 
 
 class ExcelFormatterImpl(ExcelFormatter):
@@ -192,7 +221,7 @@ class SimpleExcelGenerator:
         self.generator = ExcelGeneratorImpl()
         self.formatter = ExcelFormatterImpl()
     
-    def create_simple_report(self, data: ProcessedData, output_path: Path) -> None:
+    def create_simple_report(self, data: Union[ProcessedData, ArrayProcessedData], output_path: Path) -> None:
         """Create a simple Excel report from processed data."""
         logger.info("Creating simple Excel report")
         
@@ -0,0 +1,104 @@
+"""Pre-rendered workbook skeletons: the static structure of a report layout."""
+
+import hashlib
+import os
+import pickle
+from pathlib import Path
+from typing import Any, Dict, Iterable, Optional, Tuple
+import logging
+
+import openpyxl
+from openpyxl import Workbook
+
+from ..config import default_cache_dir
+
+
+logger = logging.getLogger(__name__)
+
+
+class WorkbookSkeleton:
+    """Static labels, merged ranges and column widths of a one-sheet report.
+    
+    Plugins declare their skeleton once; ``SkeletonCache`` renders it into a
+    template workbook and hands out clones, so generating a report only
+    writes its data cells.
+    """
+    
+    def __init__(self, name: str, cells: Dict[str, Any], merged: Iterable[str] = (),
+                 column_widths: Optional[Dict[str, float]] = None):
+        """Initialize skeleton; ``cells`` maps coordinates such as ``'A3'`` to values."""
+        self.name = name
+        self.cells = cells
+        self.merged = list(merged)
+        self.column_widths = column_widths or {}
+    
+    @property
+    def fingerprint(self) -> str:
+        """Digest of the declared structure; a changed layout gets a new template."""
+        content = repr((sorted(self.cells.items()), self.merged, sorted(self.column_widths.items())))
+        return hashlib.sha256(content.encode()).hexdigest()
+    
+    def render(self) -> Workbook:
+        """Build the skeleton workbook from scratch."""
+        wb = Workbook()
+        ws = wb.active
+        for cell_range in self.merged:
+            ws.merge_cells(cell_range)
+        for coordinate, value in self.cells.items():
+            ws[coordinate] = value
+        for column, width in self.column_widths.items():
+            ws.column_dimensions[column].width = width
+        return wb
+
+
+class SkeletonCache:
+    """Rendered skeletons, kept as pickled template files and cloned per report.
+    
+    A skeleton is rendered once per layout: the template lands in
+    ``skeletons`` under the shared cache directory (named by the layout's
+    fingerprint) and its bytes are kept in memory, so later reports, in
+    this or other processes, start from a clone instead of rebuilding the
+    static structure cell by cell.
+    """
+    
+    def __init__(self, cache_dir: Optional[Path] = None):
+        """Initialize cache; ``cache_dir`` defaults to ``skeletons`` under the shared cache directory."""
+        self.cache_dir = cache_dir
+        self._templates: Dict[str, Tuple[str, bytes]] = {}
+    
+    def clone(self, skeleton: WorkbookSkeleton) -> Workbook:
+        """A fresh workbook holding the skeleton's static structure."""
+        fingerprint = skeleton.fingerprint
+        cached = self._templates.get(skeleton.name)
+        if cached is None or cached[0] != fingerprint:
+            cached = (fingerprint, self._load_template(skeleton, fingerprint))
+            self._templates[skeleton.name] = cached
+        return pickle.loads(cached[1])
+    
+    def _load_template(self, skeleton: WorkbookSkeleton, fingerprint: str) -> bytes:
+        # Pickled workbooks are only valid for the openpyxl version that wrote them
+        name = f"{skeleton.name}-{fingerprint[:16]}-openpyxl{openpyxl.__version__}.pickle"
+        path = (self.cache_dir or default_cache_dir() / "skeletons") / name
+        try:
+            template = path.read_bytes()
+            pickle.loads(template)
+            return template
+        except FileNotFoundError:
+            pass
+        except Exception as e:
+            logger.warning(f"Ignoring unreadable skeleton template {path}: {e}")
+        
+        template = pickle.dumps(skeleton.render(), protocol=pickle.HIGHEST_PROTOCOL)
+        try:
+            path.parent.mkdir(parents=True, exist_ok=True)
+            tmp_path = path.with_suffix(f".{os.getpid()}.tmp")
+            tmp_path.write_bytes(template)
+            tmp_path.replace(path)
+            logger.debug(f"Rendered skeleton template: {path}")
+        except OSError as e:
+            logger.warning(f"Could not write skeleton template {path}: {e}")
+        return template
+
+
+# Shared by every plugin in the process
+SKELETONS = SkeletonCache()
@@ -0,0 +1,162 @@
+"""Streaming validation of generated workbooks."""
+
+import numbers
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Tuple, Union
+import logging
+
+from openpyxl import load_workbook
+from openpyxl.utils import column_index_from_string, get_column_letter
+from openpyxl.utils.cell import coordinate_to_tuple
+
+from ...domain.interfaces import ExcelValidator
+from ...domain.models import (ArrayProcessedData, ProcessedData, ValidationIssue, WorkbookValidation,
+                              WorksheetLayout)
+from ...domain.models.validation import DATA, FORMATTING, STRUCTURE
+from .generator import SIMPLE_METRICS, SIMPLE_PERCENTAGE_METRICS
+from .skeleton import WorkbookSkeleton
+
+
+logger = logging.getLogger(__name__)
+
+
+class StreamingExcelValidator(ExcelValidator):
+    """Check workbooks against expected layout, data and skeleton in one read-only pass.
+    
+    Expectations become a map of expected cell values (skeleton labels and
+    data cells, given by (row, column) or as ``ProcessedData`` of the simple
+    report layout) plus, per layout section, the columns that must hold a
+    value somewhere in its rows. The sheet is then streamed once, only down
+    to the last row any expectation refers to, and each row is checked as it
+    goes by, so memory stays bounded by one row and validation costs about
+    one read of the file.
+    
+    ``skeletons`` maps report types to the skeletons ``check_formatting``
+    expects; read-only mode does not expose merged ranges or column widths,
+    so only the skeleton's static cell values are checked.
+    """
+    
+    def __init__(self, skeletons: Optional[Dict[str, WorkbookSkeleton]] = None,
+                 tolerance: float = 1e-6, max_issues: int = 50):
+        """Initialize validator."""
+        self.skeletons = dict(skeletons or {})
+        self.tolerance = tolerance
+        self.max_issues = max_issues
+    
+    def validate_structure(self, file_path: Path, expected_layout: WorksheetLayout) -> bool:
+        """Validate Excel file structure matches expected layout."""
+        return self.validate(file_path, layout=expected_layout).is_valid
+    
+    def validate_data(self, file_path: Path, expected_data: ProcessedData) -> bool:
+        """Validate Excel file data matches expected values."""
+        return self.validate(file_path, expected_data=expected_data).is_valid
+    
+    def check_formatting(self, file_path: Path, report_type: str) -> bool:
+        """Check if formatting meets report type requirements."""
+        return self.validate(file_path, report_type=report_type).is_valid
+    
+    def validate(self, file_path: Path, layout: Optional[WorksheetLayout] = None,
+                 expected_data: Optional[Union[ProcessedData, ArrayProcessedData,
+                                               Dict[Tuple[int, int], Any]]] = None,
+                 report_type: Optional[str] = None) -> WorkbookValidation:
+        """Run every given check in a single pass over the layout's sheet (default: the active sheet)."""
+        expected: Dict[Tuple[int, int], Tuple[str, Any]] = {}
+        if report_type is not None:
+            skeleton = self.skeletons.get(report_type)
+            if skeleton is None:
+                raise ValueError(f"No skeleton registered for report type '{report_type}'")
+            for coordinate, value in skeleton.cells.items():
+                expected[coordinate_to_tuple(coordinate)] = (FORMATTING, value)
+        if expected_data is not None:
+            if not isinstance(expected_data, dict):
+                expected_data = simple_report_cells(expected_data)
+            for cell, value in expected_data.items():
+                expected[cell] = (DATA, value)
+        
+        # Per section: columns that still need a value within its rows
+        pending: List[Tuple[str, int, int, Dict[int, str]]] = []
+        for section in (layout.sections if layout else []):
+            columns = {column_index_from_string(col): key for key, col in section.columns.items()}
+            pending.append((section.name, section.start_row, section.end_row, columns))
+        
+        result = WorkbookValidation(file=str(file_path))
+        wb = load_workbook(file_path, read_only=True)
+        try:
+            if layout is not None and layout.name not in wb.sheetnames:
+                self._add_issue(result, STRUCTURE, f"Sheet '{layout.name}' not found "
+                                                   f"(has: {', '.join(wb.sheetnames)})")
+                return result
+            ws = wb[layout.name] if layout is not None else wb.active
+            result.sheet = ws.title
+            
+            last_row = max([row for row, _ in expected] + [end for _, _, end, _ in pending] + [1])
+            last_col = max([col for _, col in expected] +
+                           [col for _, _, _, columns in pending for col in columns] + [1])
+            row_expected: Dict[int, List[Tuple[int, str, Any]]] = {}
+            for (row, col), (check, value) in expected.items():
+                row_expected.setdefault(row, []).append((col, check, value))
+            
+            for row_number, values in enumerate(ws.iter_rows(max_row=last_row, max_col=last_col,
+                                                             values_only=True), start=1):
+                result.rows_read += 1
+                for col, check, value in row_expected.pop(row_number, []):
+                    found = values[col - 1] if col <= len(values) else None
+                    result.cells_checked += 1
+                    if not self._equal(value, found):
+                        self._add_issue(result, check, f"expected {value!r}, found {found!r}",
+                                        f"{get_column_letter(col)}{row_number}")
+                for _, start, end, columns in pending:
+                    if start <= row_number <= end:
+                        for col in [c for c in columns if c <= len(values) and values[c - 1] is not None]:
+                            del columns[col]
+            
+            # Rows past the end of the sheet were never streamed
+            for row_number, cells in sorted(row_expected.items()):
+                for col, check, value in cells:
+                    result.cells_checked += 1
+                    if value is not None:
+                        self._add_issue(result, check, f"expected {value!r}, found empty",
+                                        f"{get_column_letter(col)}{row_number}")
+            for name, start, end, columns in pending:
+                for col, key in columns.items():
+                    self._add_issue(result, STRUCTURE, f"Section '{name}' has no {key} values in column "
+                                                       f"{get_column_letter(col)} (rows {start}-{end})")
+        finally:
+            wb.close()
+        
+        if result.is_valid:
+            logger.info(f"Validated {file_path}: {result.cells_checked} cells, {result.rows_read} rows")
+        else:
+            logger.warning(f"Validation of {file_path} found {result.issue_count} issue(s)")
+        return result
+    
+    def _add_issue(self, result: WorkbookValidation, check: str, message: str,
+                   coordinate: Optional[str] = None) -> None:
+        result.issue_count += 1
+        if len(result.issues) < self.max_issues:
+            result.issues.append(ValidationIssue(check=check, message=message, coordinate=coordinate))
+    
+    def _equal(self, expected: Any, found: Any) -> bool:
+        if isinstance(expected, numbers.Real) and isinstance(found, numbers.Real):
+            return abs(expected - found) <= self.tolerance * max(1.0, abs(expected))
+        return expected == found
+
+
+def simple_report_cells(data: Union[ProcessedData, ArrayProcessedData]) -> Dict[Tuple[int, int], Any]:
+    """Cells ``SimpleExcelGenerator`` writes for ``data``, keyed by (row, column)."""
+    cells: Dict[Tuple[int, int], Any] = {}
+    for i, period in enumerate(data.time_periods):
+        column = 2 + i
+        cells[(1, column)] = period.upper()
+        if period not in data.totals:
+            continue
+        totals = data.totals[period]
+        for j, metric in enumerate(SIMPLE_METRICS):
+            if metric in totals:
+                cells[(2 + j, column)] = totals[metric]
+        percentages = data.percentages[period] if period in data.percentages else {}
+        for j, metric in enumerate(SIMPLE_PERCENTAGE_METRICS):
+            if metric in percentages:
+                cells[(2 + len(SIMPLE_METRICS) + j, column)] = f"{percentages[metric]:.2f}%"
+    return cells
+
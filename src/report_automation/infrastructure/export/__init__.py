@@ -0,0 +1,5 @@
+"""Machine-readable exports of report results."""
+
+from .tidy import EXPORT_FORMATS, TIDY_COLUMNS, check_export_format, export_path, write_tidy
+
+__all__ = ["EXPORT_FORMATS", "TIDY_COLUMNS", "check_export_format", "export_path", "write_tidy"]
@@ -0,0 +1,57 @@
+"""Tidy long-form report results as Parquet, Arrow IPC, CSV or JSON Lines."""
+
+import importlib.util
+from pathlib import Path
+import logging
+
+import pandas as pd
+
+
+logger = logging.getLogger(__name__)
+
+# One row per report value
+TIDY_COLUMNS = ["report", "section", "group", "week", "metric", "value"]
+
+# Export format -> file suffix
+EXPORT_FORMATS = {
+    "parquet": ".parquet",
+    "arrow": ".arrow",
+    "csv": ".csv",
+    "jsonl": ".jsonl",
+}
+
+_ARROW_FORMATS = ("parquet", "arrow")
+
+
+def export_path(output_path: Path, fmt: str) -> Path:
+    """Path of a ``fmt`` export written alongside ``output_path``."""
+    return Path(output_path).with_suffix(EXPORT_FORMATS[fmt])
+
+
+def check_export_format(fmt: str) -> None:
+    """Raise if ``fmt`` is unknown or its optional dependency is missing.
+    
+    Parquet and Arrow IPC need ``pyarrow`` (``pip install
+    'report-automation[arrow]'``); CSV and JSON Lines do not.
+    """
+    if fmt not in EXPORT_FORMATS:
+        raise ValueError(f"Unknown export format '{fmt}'; use one of {', '.join(EXPORT_FORMATS)}")
+    if fmt in _ARROW_FORMATS and importlib.util.find_spec("pyarrow") is None:
+        raise ImportError(f"{fmt} export requires pyarrow: pip install 'report-automation[arrow]'")
+
+
+def write_tidy(frame: pd.DataFrame, path: Path, fmt: str) -> Path:
+    """Write tidy report rows in ``fmt`` and return the path."""
+    check_export_format(fmt)
+    path = Path(path)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    if fmt == "parquet":
+        frame.to_parquet(path, index=False)
+    elif fmt == "arrow":
+        frame.to_feather(path)
+    elif fmt == "csv":
+        frame.to_csv(path, index=False)
+    else:
+        frame.to_json(path, orient="records", lines=True, force_ascii=False)
+    logger.info(f"Exported {len(frame)} rows as {fmt}: {path}")
+    return path
@@ -1,12 +1,19 @@
 """Report plugins package."""
 
-from .base import BaseReportPlugin, register_plugin, get_plugin, list_plugins
-from .implementations import ABReportPlugin
+from .base import BaseReportPlugin, register_plugin, get_plugin, list_plugins, discover_plugins
 
 __all__ = [
     "BaseReportPlugin",
     "register_plugin",
     "get_plugin", 
     "list_plugins",
+    "discover_plugins",
     "ABReportPlugin",
 ]
+
+
+def __getattr__(name):
+    if name == "ABReportPlugin":
+        from .implementations import ABReportPlugin
+        return ABReportPlugin
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -1,12 +1,26 @@
 """Base plugin system."""
 
-from .plugin import BaseReportPlugin
-from .registry import PluginRegistry, register_plugin, get_plugin, list_plugins
+from .plugin import BaseReportPlugin, WeekReplacementMixin
+from .discovery import ENTRY_POINT_GROUP, PluginSpec, scan_plugin_directory, scan_plugin_file
+from .registry import PluginRegistry, register_plugin, get_plugin, list_plugins, discover_plugins, get_registry
+from .loader import ModulePluginLoader, get_plugin_loader
+from .planner import ExecutionPlan, ExecutionPlanner
 
 __all__ = [
     "BaseReportPlugin",
+    "ExecutionPlan",
+    "ExecutionPlanner",
     "PluginRegistry", 
+    "PluginSpec",
+    "ModulePluginLoader",
+    "ENTRY_POINT_GROUP",
     "register_plugin",
     "get_plugin",
     "list_plugins",
+    "discover_plugins",
+    "get_registry",
+    "get_plugin_loader",
+    "scan_plugin_directory",
+    "scan_plugin_file",
+    "WeekReplacementMixin",
 ]
@@ -0,0 +1,164 @@
+"""Lightweight plugin discovery: find plugins without importing them.
+
+Plugins are described by a ``PluginSpec`` (report name plus a
+``module:Class`` or ``path.py:Class`` target). Specs come from the built-in
+table, the ``report_automation.plugins`` entry point group of installed
+packages, and AST scans of plugin directories; the module behind a spec is
+imported only when that report type is first requested.
+"""
+
+import ast
+import importlib
+import importlib.util
+import sys
+from importlib import metadata
+from pathlib import Path
+from typing import List, Optional, Type
+import logging
+
+
+logger = logging.getLogger(__name__)
+
+ENTRY_POINT_GROUP = "report_automation.plugins"
+
+# Report name -> import target of the plugins shipped with this package
+BUILTIN_PLUGINS = {
+    "a-b-report": "report_automation.plugins.implementations.ab_report:ABReportPlugin",
+    "casino-ret": "report_automation.plugins.implementations.casino_ret:CasinoRetPlugin",
+    "awol": "report_automation.plugins.implementations.awol:AWOLPlugin",
+}
+
+
+class PluginSpec:
+    """Where to find a plugin class, resolved on first use."""
+    
+    def __init__(self, name: str, target: str, source: str, path: Optional[Path] = None):
+        """Initialize spec; ``path`` is set for plugins found in a directory."""
+        self.name = name
+        self.target = target
+        self.source = source
+        self.path = path
+    
+    @property
+    def module_name(self) -> str:
+        """Module part of the target."""
+        return self.target.rpartition(":")[0]
+    
+    @property
+    def class_name(self) -> str:
+        """Class part of the target."""
+        return self.target.rpartition(":")[2]
+    
+    def load(self) -> Type:
+        """Import the plugin module and return the plugin class."""
+        if self.path is not None:
+            module = _import_path(self.module_name, self.path)
+        else:
+            module = importlib.import_module(self.module_name)
+        try:
+            return getattr(module, self.class_name)
+        except AttributeError:
+            raise ImportError(f"{self.module_name} has no plugin class {self.class_name}")
+    
+    def __repr__(self) -> str:
+        return f"PluginSpec({self.name!r}, {self.target!r}, source={self.source!r})"
+
+
+def builtin_specs() -> List[PluginSpec]:
+    """Specs of the plugins shipped with this package."""
+    return [PluginSpec(name, target, "builtin") for name, target in BUILTIN_PLUGINS.items()]
+
+
+def entry_point_specs(group: str = ENTRY_POINT_GROUP) -> List[PluginSpec]:
+    """Specs advertised by installed packages (entry point name = report type)."""
+    try:
+        entry_points = metadata.entry_points()
+        if hasattr(entry_points, "select"):
+            selected = entry_points.select(group=group)
+        else:  # Python < 3.10
+            selected = entry_points.get(group, [])
+    except Exception as e:
+        logger.warning(f"Could not read plugin entry points: {e}")
+        return []
+    return [PluginSpec(ep.name, ep.value, "entry_point") for ep in selected]
+
+
+def scan_plugin_directory(directory: Path) -> List[PluginSpec]:
+    """Find plugin classes in a directory's ``*.py`` files without importing them."""
+    directory = Path(directory)
+    if not directory.is_dir():
+        logger.warning(f"Plugin directory not found: {directory}")
+        return []
+    
+    specs = []
+    for path in sorted(directory.glob("*.py")):
+        if not path.name.startswith("_"):
+            specs += scan_plugin_file(path)
+    return specs
+
+
+def scan_plugin_file(path: Path) -> List[PluginSpec]:
+    """Find plugin classes in one file by parsing, not importing, it.
+    
+    A class counts as a plugin when it is decorated with ``register_plugin``
+    or derives from ``BaseReportPlugin`` and assigns a literal string ``name``
+    in its class body.
+    """
+    path = Path(path)
+    try:
+        tree = ast.parse(path.read_text(encoding="utf-8"), filename=str(path))
+    except (OSError, SyntaxError) as e:
+        logger.warning(f"Skipping plugin file {path.name}: {e}")
+        return []
+    
+    specs = []
+    for node in tree.body:
+        if isinstance(node, ast.ClassDef) and _looks_like_plugin(node):
+            name = _class_name_attribute(node)
+            if name:
+                module_name = f"report_automation_plugins.{path.stem}"
+                specs.append(PluginSpec(name, f"{module_name}:{node.name}", "directory", path))
+    return specs
+
+
+def _looks_like_plugin(node: ast.ClassDef) -> bool:
+    """Whether a class is registered or derives from BaseReportPlugin."""
+    decorators = [_dotted_tail(d.func if isinstance(d, ast.Call) else d) for d in node.decorator_list]
+    bases = [_dotted_tail(base) for base in node.bases]
+    return "register_plugin" in decorators or "BaseReportPlugin" in bases
+
+
+def _class_name_attribute(node: ast.ClassDef) -> Optional[str]:
+    """Literal value of ``name = "..."`` in a class body."""
+    for statement in node.body:
+        if isinstance(statement, ast.Assign) and isinstance(statement.value, ast.Constant):
+            targets = [t.id for t in statement.targets if isinstance(t, ast.Name)]
+            if "name" in targets and isinstance(statement.value.value, str):
+                return statement.value.value
+    return None
+
+
+def _dotted_tail(node: ast.AST) -> Optional[str]:
+    """Last component of a ``Name`` or ``Attribute`` expression."""
+    if isinstance(node, ast.Name):
+        return node.id
+    if isinstance(node, ast.Attribute):
+        return node.attr
+    return None
+
+
+def _import_path(module_name: str, path: Path):
+    """Import a module from a file, reusing it if already imported."""
+    if module_name in sys.modules:
+        return sys.modules[module_name]
+    spec = importlib.util.spec_from_file_location(module_name, path)
+    if spec is None or spec.loader is None:
+        raise ImportError(f"Cannot import plugin file: {path}")
+    module = importlib.util.module_from_spec(spec)
+    sys.modules[module_name] = module
+    try:
+        spec.loader.exec_module(module)
+    except Exception:
+        del sys.modules[module_name]
+        raise
+    return module
@@ -0,0 +1,131 @@
+"""Plugin loading and hot reloading for long-running processes."""
+
+import importlib
+import sys
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple, Type
+import logging
+
+from ...domain.interfaces import PluginLoader
+from ...infrastructure.config import get_default_loader
+from .discovery import PluginSpec, scan_plugin_directory, scan_plugin_file
+from .plugin import BaseReportPlugin
+from .registry import PluginRegistry, get_registry
+
+
+logger = logging.getLogger(__name__)
+
+
+class ModulePluginLoader(PluginLoader):
+    """Loads plugin classes into a registry and reloads them when edited.
+    
+    Each loaded plugin's module file and report YAML are stamped (mtime and
+    size), so ``changed_plugins``/``reload_changed`` can pick up edited code,
+    mapping constants and layouts in a warm process.
+    """
+    
+    def __init__(self, registry: Optional[PluginRegistry] = None):
+        """Initialize loader for a registry (the global one by default)."""
+        self.registry = registry or get_registry()
+        self._stamps: Dict[str, Dict[Path, Tuple[int, int]]] = {}
+    
+    def load_plugin(self, plugin_path: Path) -> Type[BaseReportPlugin]:
+        """Load the plugin defined in a ``.py`` file (the first one if several)."""
+        specs = scan_plugin_file(Path(plugin_path))
+        if not specs:
+            raise ImportError(f"No plugin class found in {plugin_path}")
+        plugins = [self._load_spec(spec) for spec in specs]
+        return plugins[0]
+    
+    def load_plugins_from_directory(self, directory: Path) -> List[Type[BaseReportPlugin]]:
+        """Load every plugin found in a directory's ``*.py`` files."""
+        plugins = []
+        for spec in scan_plugin_directory(Path(directory)):
+            try:
+                plugins.append(self._load_spec(spec))
+            except Exception as e:
+                logger.error(f"Failed to load plugin '{spec.name}' from {spec.path}: {e}")
+        logger.info(f"Loaded {len(plugins)} plugin(s) from {directory}")
+        return plugins
+    
+    def reload_plugin(self, plugin_name: str) -> Type[BaseReportPlugin]:
+        """Re-import a plugin's module (and its report YAML) and return the new class."""
+        spec = self.registry.get_spec(plugin_name)
+        if spec is None:
+            raise ValueError(f"Plugin '{plugin_name}' not found")
+        
+        module = sys.modules.get(spec.module_name)
+        if module is None:
+            logger.debug(f"Plugin '{plugin_name}' was not imported yet; loading it")
+        elif spec.path is not None:
+            del sys.modules[spec.module_name]
+        else:
+            importlib.reload(module)
+        
+        plugin_class = spec.load()
+        self.registry.register_class(plugin_name, plugin_class)
+        self._stamps[plugin_name] = self._stamp(plugin_class)
+        logger.info(f"Reloaded plugin '{plugin_name}' from {spec.target}")
+        return plugin_class
+    
+    def changed_plugins(self) -> List[str]:
+        """Names of loaded plugins whose module file or report YAML changed."""
+        changed = []
+        for name, stamps in self._stamps.items():
+            if any(_file_stamp(path) != stamp for path, stamp in stamps.items()):
+                changed.append(name)
+        return changed
+    
+    def reload_changed(self) -> List[str]:
+        """Reload every changed plugin; returns the reloaded names."""
+        reloaded = []
+        for name in self.changed_plugins():
+            try:
+                self.reload_plugin(name)
+                reloaded.append(name)
+            except Exception as e:
+                logger.error(f"Failed to reload plugin '{name}': {e}")
+        return reloaded
+    
+    def track(self, plugin_name: str) -> Type[BaseReportPlugin]:
+        """Load a registered plugin and start watching its files."""
+        plugin_class = self.registry.get(plugin_name)
+        if plugin_class is None:
+            raise ValueError(f"Plugin '{plugin_name}' not found")
+        if plugin_name not in self._stamps:
+            self._stamps[plugin_name] = self._stamp(plugin_class)
+        return plugin_class
+    
+    def _load_spec(self, spec: PluginSpec) -> Type[BaseReportPlugin]:
+        self.registry.register_spec(spec)
+        return self.track(spec.name)
+    
+    def _stamp(self, plugin_class: Type[BaseReportPlugin]) -> Dict[Path, Tuple[int, int]]:
+        """Current stamps of the files a plugin is built from."""
+        paths = []
+        module = sys.modules.get(plugin_class.__module__)
+        if module is not None and getattr(module, '__file__', None):
+            paths.append(Path(module.__file__))
+        report_spec = getattr(module, 'SPEC', None)
+        if report_spec is not None and getattr(report_spec, 'name', None):
+            paths.append(get_default_loader().config_path(report_spec.name))
+        return {path: _file_stamp(path) for path in paths}
+
+
+def _file_stamp(path: Path) -> Tuple[int, int]:
+    try:
+        stat = path.stat()
+    except OSError:
+        return (-1, -1)
+    return (stat.st_mtime_ns, stat.st_size)
+
+
+_default_loader: Optional[ModulePluginLoader] = None
+
+
+def get_plugin_loader() -> ModulePluginLoader:
+    """Return the process-wide plugin loader for the global registry."""
+    global _default_loader
+    if _default_loader is None:
+        _default_loader = ModulePluginLoader()
+    return _default_loader
@@ -0,0 +1,213 @@
+"""Choose how a plugin reads its inputs: in memory, chunked or sharded."""
+
+import math
+import os
+from pathlib import Path
+from typing import List, Optional
+import logging
+
+import pandas as pd
+
+from ...infrastructure.csv.sharded import ROW_MEMORY_ESTIMATE
+from .plugin import BaseReportPlugin
+
+
+logger = logging.getLogger(__name__)
+
+IN_MEMORY = "in-memory"
+CHUNKED = "chunked"
+SHARDED = "sharded"
+
+# Share of available memory a plan may use
+MEMORY_HEADROOM = 0.5
+# Files below this size are not worth splitting across processes
+SHARD_MIN_BYTES = 256 * 1024 * 1024
+SAMPLE_ROWS = 2_000
+MAX_CHUNKSIZE = 500_000
+MIN_CHUNKSIZE = 1_000
+
+
+class InputProfile:
+    """Size estimates of one input file from a sample of its first rows."""
+    
+    def __init__(self, path: Path, size: int, rows: int, row_bytes: int, claimed_share: Optional[float]):
+        """Initialize profile; ``claimed_share`` is None when the plugin claims every template.
+        
+        Readers parse every row, so ``claimed_share`` is reported by
+        ``--explain`` but does not change the memory estimate.
+        """
+        self.path = path
+        self.size = size
+        self.rows = rows
+        self.row_bytes = row_bytes
+        self.claimed_share = claimed_share
+    
+    @property
+    def memory(self) -> int:
+        """Estimated size of the fully parsed file."""
+        return self.rows * self.row_bytes
+
+
+class ExecutionPlan:
+    """How to run a plugin over its inputs, and why."""
+    
+    def __init__(self, mode: str, workers: Optional[int], max_memory: Optional[int], chunksize: Optional[int],
+                 inputs: List[InputProfile], available_memory: int, cpus: int, reasons: List[str]):
+        """Initialize plan; ``workers``, ``max_memory`` and ``chunksize`` are passed to ``execute``."""
+        self.mode = mode
+        self.workers = workers
+        self.max_memory = max_memory
+        self.chunksize = chunksize
+        self.inputs = inputs
+        self.available_memory = available_memory
+        self.cpus = cpus
+        self.reasons = reasons
+    
+    @property
+    def estimated_memory(self) -> int:
+        """Estimated size of all inputs fully parsed."""
+        return sum(profile.memory for profile in self.inputs)
+    
+    def describe(self) -> List[str]:
+        """Human-readable plan, one line per fact."""
+        lines = [f"Mode: {self.mode}"]
+        if self.workers:
+            lines.append(f"Workers: {self.workers}")
+        if self.chunksize:
+            lines.append(f"Chunk size: {self.chunksize} rows")
+        if self.max_memory:
+            lines.append(f"Memory budget: {_mib(self.max_memory)} (partial sums spill beyond half)")
+        lines.append(f"Available: {_mib(self.available_memory)} memory, {self.cpus} CPU(s)")
+        for profile in self.inputs:
+            share = "" if profile.claimed_share is None else f", {profile.claimed_share:.0%} of rows claimed"
+            lines.append(f"  {profile.path.name}: {_mib(profile.size)} on disk, ~{profile.rows} rows, "
+                         f"~{_mib(profile.memory)} parsed{share}")
+        lines.extend(f"Because {reason}" for reason in self.reasons)
+        return lines
+
+
+class ExecutionPlanner:
+    """Picks the read strategy and chunk size from input sizes, memory and CPUs.
+    
+    * in-memory: the parsed inputs fit the memory budget and no file is big
+      enough to benefit from sharding;
+    * sharded: a file exceeds ``SHARD_MIN_BYTES`` and several CPUs are free;
+      the budget is split across shards and enforced if the inputs do not fit;
+    * chunked: otherwise, streaming with chunks sized to the budget.
+    
+    Row counts and parsed row sizes are extrapolated from a sample of each
+    file, parsed like the plugin parses it (only its ``input_columns``). The
+    share of sampled rows whose template the plugin claims is reported
+    alongside, and scales the memory estimate of plugins whose reader drops
+    unclaimed rows.
+    """
+    
+    def __init__(self, available_memory: Optional[int] = None, cpus: Optional[int] = None):
+        """Initialize planner; defaults probe this machine (cgroup limits included)."""
+        self.available_memory = available_memory or detect_available_memory()
+        self.cpus = cpus or detect_cpus()
+    
+    def plan(self, plugin: BaseReportPlugin, input_paths: List[Path], workers: Optional[int] = None,
+             max_memory: Optional[int] = None) -> ExecutionPlan:
+        """Plan a run; explicit ``workers`` or ``max_memory`` are honoured."""
+        profiles = [self.profile(plugin, Path(path)) for path in input_paths]
+        budget = max_memory or int(self.available_memory * MEMORY_HEADROOM)
+        estimated = sum(profile.memory for profile in profiles)
+        largest = max((profile.size for profile in profiles), default=0)
+        reasons = []
+        
+        if workers and workers > 1:
+            mode = SHARDED
+            reasons.append(f"{workers} workers were requested")
+        elif largest >= SHARD_MIN_BYTES and self.cpus > 1 and not max_memory:
+            mode = SHARDED
+            workers = min(self.cpus, max(2, math.ceil(largest / SHARD_MIN_BYTES)))
+            reasons.append(f"the largest input ({_mib(largest)}) is over {_mib(SHARD_MIN_BYTES)} "
+                           f"and {self.cpus} CPUs are available")
+        elif estimated <= budget and not max_memory:
+            mode = IN_MEMORY
+            workers = None
+            reasons.append(f"the parsed inputs (~{_mib(estimated)}) fit the {_mib(budget)} budget")
+        else:
+            mode = CHUNKED
+            workers = 1
+            reasons.append(f"a memory budget of {_mib(budget)} was requested" if max_memory else
+                           f"the parsed inputs (~{_mib(estimated)}) exceed the {_mib(budget)} budget")
+        
+        chunksize = None
+        plan_memory = None
+        if mode != IN_MEMORY:
+            if estimated > budget or max_memory:
+                plan_memory = budget
+            shard_budget = budget // (workers or 1)
+            row_bytes = max([profile.row_bytes for profile in profiles] + [ROW_MEMORY_ESTIMATE])
+            chunksize = max(MIN_CHUNKSIZE, min(MAX_CHUNKSIZE, shard_budget // 2 // row_bytes))
+        
+        if not plugin.get_template_names():
+            reasons.append(f"{plugin.name} declares no template mapping, so every template is aggregated")
+        
+        plan = ExecutionPlan(mode, workers, plan_memory, chunksize, profiles, self.available_memory,
+                             self.cpus, reasons)
+        for line in plan.describe():
+            logger.info(f"Plan: {line}")
+        return plan
+    
+    def profile(self, plugin: BaseReportPlugin, path: Path) -> InputProfile:
+        """Estimate rows and parsed row size of one file from its first rows."""
+        size = path.stat().st_size
+        columns = set(plugin.csv_columns())
+        sample = pd.read_csv(path, nrows=SAMPLE_ROWS, usecols=lambda column: column in columns)
+        if sample.empty:
+            return InputProfile(path, size, 0, 0, None)
+        if 'datetime' in plugin.input_columns and 'timestamp' in sample.columns:
+            sample['datetime'] = pd.to_datetime(sample['timestamp'], unit='s', errors='coerce')
+        
+        with open(path, 'rb') as f:
+            f.readline()
+            data_start = f.tell()
+            sample_bytes = sum(len(f.readline()) for _ in range(len(sample)))
+        rows = math.ceil((size - data_start) / max(sample_bytes / len(sample), 1))
+        row_bytes = math.ceil(sample.memory_usage(index=False, deep=True).sum() / len(sample))
+        
+        claimed_share = None
+        claimed = plugin.get_template_names()
+        if claimed and 'template_name' in sample.columns:
+            claimed_share = float(sample['template_name'].isin(claimed).mean())
+        return InputProfile(path, size, rows, row_bytes, claimed_share)
+
+
+def detect_available_memory() -> int:
+    """Bytes of memory this process may use: available RAM, capped by a cgroup limit."""
+    candidates = []
+    try:
+        with open('/proc/meminfo') as f:
+            for line in f:
+                if line.startswith('MemAvailable:'):
+                    candidates.append(int(line.split()[1]) * 1024)
+    except OSError:
+        pass
+    for limit_path in ('/sys/fs/cgroup/memory.max', '/sys/fs/cgroup/memory/memory.limit_in_bytes'):
+        try:
+            value = Path(limit_path).read_text().strip()
+        except OSError:
+            continue
+        if value.isdigit() and int(value) < 2 ** 60:
+            candidates.append(int(value))
+    if not candidates:
+        try:
+            candidates.append(os.sysconf('SC_PAGE_SIZE') * os.sysconf('SC_AVPHYS_PAGES'))
+        except (ValueError, OSError, AttributeError):
+            candidates.append(2 * 1024 ** 3)
+    return min(candidates)
+
+
+def detect_cpus() -> int:
+    """CPUs this process may run on."""
+    try:
+        return len(os.sched_getaffinity(0))
+    except AttributeError:
+        return os.cpu_count() or 1
+
+
+def _mib(size: int) -> str:
+    return f"{size / 1024 ** 2:.1f} MiB"
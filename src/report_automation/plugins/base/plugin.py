@@ -1,14 +1,77 @@
 """Base plugin system for report generation."""
 
+import fnmatch
+import hashlib
+import inspect
+import numbers
+import re
 from abc import ABC, abstractmethod
 from pathlib import Path
-from typing import Dict, List, Any
+from types import CodeType
+from typing import Dict, Iterator, List, Any, Optional, Tuple
 import pandas as pd
+from openpyxl import Workbook
+from openpyxl.utils import column_index_from_string
+
+from ...domain.services import METRICS, ROW_COUNT, WeeklyAggregate
+from ...infrastructure.cache import TransformMemo
+from ...infrastructure.csv import ShardedCSVReader, read_ahead
+from ...domain.models import WorkbookValidation, WorksheetLayout
+from ...infrastructure.excel import SKELETONS, StreamingExcelValidator, WorkbookSkeleton
+from ...infrastructure.export import TIDY_COLUMNS
 
 
 class BaseReportPlugin(ABC):
     """Abstract base class for report plugins."""
     
+    # Filename glob of each input section, used to route exported files
+    input_patterns: List[str] = []
+    # Files parsed on a background thread ahead of the one being processed
+    read_ahead_files = 1
+    # Parsed columns aggregation reads; only these are read, and batch runs share only these between processes
+    input_columns: List[str] = ['datetime', 'template_name', 'campaign_name'] + METRICS
+    supports_week_replacement = False
+    # Compiled report config the plugin renders from, if it has one
+    spec = None
+    # Sheet reports render into (openpyxl's default title)
+    sheet_title = "Sheet"
+    
+    @property
+    def weekly_boundaries(self) -> List[Tuple[str, str]]:
+        """Inclusive (start_date, end_date) week boundaries used for aggregation.
+        
+        Week tables are read from ``spec`` on every access, after re-deriving
+        a relative calendar whose date has passed, so long-running watch and
+        session processes follow ``CompiledReportSpec.refresh()``. Plugins
+        without a spec override this with a class attribute.
+        """
+        return self._current_spec().weekly_boundaries if self.spec is not None else []
+    
+    @property
+    def week_labels(self) -> List[str]:
+        """Display label of each week, oldest first."""
+        return self._current_spec().week_labels if self.spec is not None else []
+    
+    @property
+    def week_columns(self) -> Dict[str, str]:
+        """Workbook column letter of each week, keyed ``week1``, ``week2``..."""
+        return self._current_spec().week_columns if self.spec is not None else {}
+    
+    @property
+    def week_column_indexes(self) -> Dict[str, int]:
+        """Workbook column index of each week, keyed like ``week_columns``."""
+        return {week_key: column_index_from_string(letter) for week_key, letter in self.week_columns.items()}
+    
+    @property
+    def week_mappings(self) -> Dict[str, Dict[str, str]]:
+        """Week number (``01``...) -> column of the generated (``source``) and master (``target``) workbook."""
+        return self._current_spec().week_mappings if self.spec is not None else {'source': {}, 'target': {}}
+    
+    def _current_spec(self):
+        """``spec`` with its weeks re-derived if they are relative to a date that has passed."""
+        self.spec.refresh()
+        return self.spec
+    
     @property
     @abstractmethod
     def name(self) -> str:
@@ -36,15 +99,298 @@ class BaseReportPlugin(ABC):
         """Generate Excel file from report data."""
         pass
     
+    def skeleton(self) -> Optional[WorkbookSkeleton]:
+        """Static structure of the generated workbook (labels, merges, widths), if declared."""
+        return None
+    
+    def new_workbook(self) -> Workbook:
+        """Workbook to render data cells into: a clone of the cached skeleton template."""
+        skeleton = self.skeleton()
+        return SKELETONS.clone(skeleton) if skeleton is not None else Workbook()
+    
+    @staticmethod
+    def _write_cells(ws, cells: Dict[Tuple[int, int], Any]) -> None:
+        """Write cell values keyed by (row, column) into a worksheet."""
+        for (row, column), value in cells.items():
+            ws.cell(row=row, column=column, value=value)
+    
+    @staticmethod
+    def _row_values(frame: Optional[pd.DataFrame]) -> Dict[str, Any]:
+        """Values of a frame's first row by column, read once for writing cells (empty if no rows)."""
+        if frame is None or frame.empty:
+            return {}
+        return dict(zip(frame.columns, frame.iloc[0].tolist()))
+    
+    def get_template_names(self) -> List[str]:
+        """Template names claimed by this plugin's mapping (empty if unknown)."""
+        return []
+    
+    def input_section(self, file_name: str, campaign_name: Optional[str] = None) -> Optional[Tuple[int, str]]:
+        """(index of the matching input pattern, section name) of rows, or None if no section claims them.
+        
+        Without ``campaign_name`` the file name is matched against
+        ``input_patterns``. With it, the campaign decides: it is slugged into
+        a file name (``"Inactive 7 [SPORT]"`` becomes ``"inactive7sport.csv"``)
+        so it names the section the plugin's file-name detection expects,
+        and the real file name is kept when it matches the same pattern.
+        Plugins without patterns claim every file as its own section.
+        """
+        if not self.input_patterns:
+            return 0, file_name
+        file_index = self._pattern_index(file_name)
+        if campaign_name is None:
+            return None if file_index is None else (file_index, file_name)
+        section_name = _campaign_file_name(campaign_name)
+        campaign_index = self._pattern_index(section_name)
+        if campaign_index is None:
+            return None
+        return campaign_index, file_name if file_index == campaign_index else section_name
+    
+    def _pattern_index(self, file_name: str) -> Optional[int]:
+        """Index of the first input pattern matching a file name (case-insensitive)."""
+        for index, pattern in enumerate(self.input_patterns):
+            if fnmatch.fnmatch(file_name.lower(), pattern.lower()):
+                return index
+        return None
+    
+    def csv_columns(self) -> List[str]:
+        """CSV columns ``input_columns`` are read from (``datetime`` is parsed from ``timestamp``)."""
+        return ['timestamp' if column == 'datetime' else column for column in self.input_columns]
+    
+    def read_input(self, csv_path: Path) -> pd.DataFrame:
+        """Read the ``input_columns`` of one CSV export and parse its epoch-second timestamps."""
+        columns = set(self.csv_columns())
+        data = pd.read_csv(csv_path, usecols=lambda column: column in columns)
+        data['datetime'] = pd.to_datetime(data['timestamp'], unit='s')
+        return data
+    
+    def iter_inputs(self, input_paths: List[Path]) -> Iterator[Tuple[Path, pd.DataFrame]]:
+        """Parsed input files in order, reading the next file while the caller handles this one."""
+        return read_ahead(input_paths, self.read_input, self.read_ahead_files)
+    
+    def aggregate_data(self, data: pd.DataFrame) -> WeeklyAggregate:
+        """Aggregate parsed rows into per-(week, template) sums."""
+        return WeeklyAggregate.from_frame(data, self.weekly_boundaries)
+    
+    def aggregate_inputs(self, input_paths: List[Path], workers: Optional[int] = None,
+                         max_memory: Optional[int] = None,
+                         chunksize: Optional[int] = None) -> Dict[str, WeeklyAggregate]:
+        """Aggregate each input file, sharding large files across ``workers`` processes.
+        
+        With ``max_memory`` (bytes) files are streamed in chunks and partial
+        sums spill to disk instead of exceeding the budget.
+        """
+        if (workers and workers > 1) or max_memory:
+            reader = ShardedCSVReader(workers=workers or 1, max_memory=max_memory,
+                                      chunksize=chunksize or 500_000)
+            return {path.name: reader.aggregate(path, self.weekly_boundaries) for path in input_paths}
+        return {path.name: self.aggregate_data(data) for path, data in self.iter_inputs(input_paths)}
+    
+    @abstractmethod
+    def transform_aggregates(self, aggregates: Dict[str, WeeklyAggregate]) -> Dict[str, Any]:
+        """Transform per-file weekly aggregates into report structure."""
+        pass
+    
+    def transform_inputs(self, input_paths: List[Path], workers: Optional[int] = None,
+                         max_memory: Optional[int] = None, chunksize: Optional[int] = None,
+                         memo: Optional[TransformMemo] = None, refresh: bool = False) -> Dict[str, Any]:
+        """Report data of the input files, reused from ``memo`` unless ``refresh`` is set."""
+        key = memo.key(self, input_paths) if memo is not None else None
+        if key is not None and not refresh:
+            report_data = memo.load(key)
+            if report_data is not None:
+                return report_data
+        
+        report_data = self.transform_aggregates(self.aggregate_inputs(input_paths, workers, max_memory, chunksize))
+        if key is not None:
+            memo.store(key, report_data)
+        return report_data
+    
+    def tidy_report_data(self, report_data: Dict[str, Any]) -> pd.DataFrame:
+        """``transform_aggregates`` output as long-form rows (report, section, group, week, metric, value).
+        
+        Report data nests ``{section: {group: {week: frame}}}``, or
+        ``{group: {week: frame}}`` when a report has one section (section is
+        then empty). Each week's first row is read, as the workbook
+        renderers do, and every numeric column but the row count becomes a
+        metric.
+        """
+        rows = []
+        
+        def walk(node: Dict[str, Any], path: List[str]) -> None:
+            for key, value in node.items():
+                if isinstance(value, dict):
+                    walk(value, path + [key])
+                    continue
+                if not isinstance(value, pd.DataFrame):
+                    continue
+                section = path[0] if len(path) > 1 else None
+                group = path[-1] if path else None
+                for metric, number in self._row_values(value).items():
+                    if metric != ROW_COUNT and isinstance(number, numbers.Real) and not isinstance(number, bool):
+                        rows.append((self.name, section, group, key, metric, float(number)))
+        
+        walk(report_data, [])
+        return pd.DataFrame(rows, columns=TIDY_COLUMNS)
+    
+    def generate_from_aggregates(self, aggregates: Dict[str, WeeklyAggregate], output_path: Path,
+                                 existing_excel: Optional[Path] = None,
+                                 replace_week: Optional[str] = None) -> None:
+        """Render a report (and optional week replacement) from precomputed aggregates."""
+        self.generate_from_report_data(self.transform_aggregates(aggregates), output_path,
+                                       existing_excel, replace_week)
+    
+    def generate_from_report_data(self, report_data: Dict[str, Any], output_path: Path,
+                                  existing_excel: Optional[Path] = None,
+                                  replace_week: Optional[str] = None) -> None:
+        """Render a report (and optional week replacement) from ``transform_aggregates`` output."""
+        if self.supports_week_replacement:
+            self.existing_excel = existing_excel
+            self.replace_week = replace_week
+        elif existing_excel or replace_week:
+            raise ValueError(f"{self.name} does not support week replacement")
+        self.generate_excel(report_data, output_path)
+    
+    def expected_layout(self, report_data: Dict[str, Any]) -> Optional[WorksheetLayout]:
+        """Sections the generated workbook must fill for ``report_data``, if declared.
+        
+        Each section maps a key (e.g. a week) to a column that must hold at
+        least one value within the section's rows.
+        """
+        return None
+    
+    def expected_cells(self, report_data: Dict[str, Any]) -> Dict[Tuple[int, int], Any]:
+        """Data cells rendered from ``report_data`` by (row, column), if declared.
+        
+        Renderers that declare them write exactly these cells, so validation
+        catches any value that is wrong or blank in the file.
+        """
+        return {}
+    
+    def validate_output(self, output_path: Path, report_data: Dict[str, Any]) -> WorkbookValidation:
+        """Check a generated workbook against skeleton, layout and data cells in one streaming pass."""
+        skeleton = self.skeleton()
+        validator = StreamingExcelValidator({self.name: skeleton} if skeleton is not None else None)
+        return validator.validate(output_path, layout=self.expected_layout(report_data),
+                                  expected_data=self.expected_cells(report_data) or None,
+                                  report_type=self.name if skeleton is not None else None)
+    
+    def replace_weeks(self, generated_path: Path, existing_path: Path, weeks: List[str],
+                      output_path: Optional[Path] = None) -> Path:
+        """Copy weeks of a generated report into an existing workbook; see ``WeekReplacementMixin``."""
+        raise ValueError(f"{self.name} does not support week replacement")
+    
+    def input_fingerprint(self) -> str:
+        """Digest of the code and columns that parse input files."""
+        return _digest([_code_digest(type(self).read_input), repr(sorted(self.csv_columns()))])
+    
+    def transform_fingerprint(self) -> str:
+        """Digest of everything that shapes parsed inputs and weekly aggregates.
+        
+        Covers week boundaries, aggregated metrics and the reading/aggregation
+        code. Template mappings and layout only act on aggregates, so a
+        reloaded plugin with an unchanged fingerprint can reuse cached inputs
+        and aggregates.
+        """
+        parts = [self.input_fingerprint(), repr([tuple(b) for b in self.weekly_boundaries]), repr(METRICS)]
+        parts += [_code_digest(getattr(type(self), method)) for method in ('aggregate_data', 'aggregate_inputs')]
+        return _digest(parts)
+    
+    def report_fingerprint(self) -> str:
+        """Digest of everything that shapes ``transform_aggregates`` output.
+        
+        Extends ``transform_fingerprint`` with the plugin's module source
+        and its compiled report config (template mappings), so memoized
+        report data is invalidated when either changes.
+        """
+        parts = [self.transform_fingerprint(), _source_digest(type(self))]
+        if self.spec is not None:
+            parts.append(self.spec.source_hash)
+        return _digest(parts)
+    
+    def output_fingerprint(self) -> str:
+        """Digest of everything that shapes the generated workbook.
+        
+        Adds the base rendering code to ``report_fingerprint``, so cached
+        outputs are invalidated when layout or week replacement changes.
+        """
+        return _digest([self.report_fingerprint(), _source_digest(BaseReportPlugin)])
+    
     def validate_input(self, csv_path: Path) -> bool:
         """Validate input file(s) exist and are readable."""
         if not csv_path.exists():
             raise FileNotFoundError(f"CSV file not found: {csv_path}")
         return True
     
-    def execute(self, input_path: Path, output_path: Path) -> None:
+    def execute(self, input_path: Path, output_path: Path, workers: Optional[int] = None,
+                max_memory: Optional[int] = None, chunksize: Optional[int] = None) -> None:
         """Execute full report generation pipeline."""
         self.validate_input(input_path)
-        data = self.process_csv(input_path)
-        report_data = self.transform_data(data)
+        if (workers and workers > 1) or max_memory:
+            aggregates = self.aggregate_inputs([input_path], workers, max_memory, chunksize)
+            report_data = self.transform_aggregates(aggregates)
+        else:
+            data = self.process_csv(input_path)
+            report_data = self.transform_data(data)
         self.generate_excel(report_data, output_path)
+
+
+class WeekReplacementMixin(ABC):
+    """Week replacement for plugins rendering into a master workbook.
+    
+    Mix in before ``BaseReportPlugin``. ``generate_from_report_data`` sets
+    ``existing_excel`` and ``replace_week``, which ``generate_excel``
+    applies after saving; ``_replace_week`` copies one week column.
+    """
+    
+    supports_week_replacement = True
+    existing_excel: Optional[Path] = None
+    replace_week: Optional[str] = None
+    
+    def replace_weeks(self, generated_path: Path, existing_path: Path, weeks: List[str],
+                      output_path: Optional[Path] = None) -> Path:
+        """Copy the given weeks of a generated report into an existing workbook.
+        
+        All weeks land in one output file (``updated_<name>`` next to the
+        existing workbook by default), which is returned.
+        """
+        output_path = output_path or existing_path.parent / f"updated_{existing_path.name}"
+        source_path = existing_path
+        for week in weeks:
+            self._replace_week(generated_path, source_path, week, output_path)
+            source_path = output_path
+        return output_path
+    
+    @abstractmethod
+    def _replace_week(self, generated_path: Path, existing_path: Path, week_number: str,
+                      output_path: Optional[Path] = None) -> Path:
+        """Replace one week column of an existing workbook with generated data."""
+        pass
+
+
+def _campaign_file_name(campaign_name: str) -> str:
+    """File name a single-campaign export of ``campaign_name`` would match: its lowercase letters and digits."""
+    return re.sub(r'[^a-z0-9]', '', campaign_name.lower()) + ".csv"
+
+
+def _digest(parts: List[str]) -> str:
+    return hashlib.sha256("\0".join(parts).encode()).hexdigest()
+
+
+def _source_digest(cls: type) -> str:
+    """Digest of the source file a class is defined in."""
+    return hashlib.sha256(Path(inspect.getfile(cls)).read_bytes()).hexdigest()
+
+
+def _code_digest(function: Any) -> str:
+    """Digest of a function's bytecode and constants, ignoring line numbers."""
+    def walk(code: CodeType) -> Iterator[bytes]:
+        yield code.co_code
+        yield repr(code.co_names).encode()
+        for const in code.co_consts:
+            if isinstance(const, CodeType):
+                yield from walk(const)
+            else:
+                yield repr(const).encode()
+    
+    return hashlib.sha256(b"\0".join(walk(function.__code__))).hexdigest()
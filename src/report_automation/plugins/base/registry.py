@@ -1,31 +1,105 @@
 """Plugin registry for managing report plugins."""
 
-from typing import Dict, Type, Optional
+import os
+from pathlib import Path
+from typing import Dict, List, Optional, Type
+import logging
+
 from .plugin import BaseReportPlugin
+from .discovery import PluginSpec, builtin_specs, entry_point_specs, scan_plugin_directory
+
+
+logger = logging.getLogger(__name__)
+
+# os.pathsep-separated directories scanned for extra plugins
+PLUGIN_PATH_ENV = "REPORT_AUTOMATION_PLUGIN_PATH"
 
 
 class PluginRegistry:
-    """Registry for discovering and managing report plugins."""
+    """Registry for discovering and managing report plugins.
+    
+    Plugins are either registered classes or ``PluginSpec`` entries found by
+    discovery; a spec's module is imported the first time its report type
+    is requested, so listing plugins never imports them.
+    """
     
     def __init__(self):
         self._plugins: Dict[str, Type[BaseReportPlugin]] = {}
+        self._specs: Dict[str, PluginSpec] = {}
+        self._discovered = False
     
     def register(self, plugin_class: Type[BaseReportPlugin]) -> None:
         """Register a plugin class."""
         plugin_name = plugin_class.name if hasattr(plugin_class, 'name') else plugin_class.__name__
         self._plugins[plugin_name] = plugin_class
     
+    def register_class(self, name: str, plugin_class: Type[BaseReportPlugin]) -> None:
+        """Register (or replace) the loaded class behind a report name."""
+        self._plugins[name] = plugin_class
+    
+    def register_spec(self, spec: PluginSpec) -> None:
+        """Register a plugin to import on first use; later specs override earlier ones."""
+        previous = self._specs.get(spec.name)
+        if previous is not None and previous.target != spec.target:
+            logger.debug(f"Plugin '{spec.name}' from {spec.source} overrides {previous.source}")
+            self._plugins.pop(spec.name, None)
+        self._specs[spec.name] = spec
+    
+    def discover_plugins(self, plugin_dir: Optional[Path] = None) -> List[PluginSpec]:
+        """Register built-in, entry point and plugin directory specs without importing them."""
+        specs = builtin_specs() + entry_point_specs()
+        for directory in _env_plugin_dirs():
+            specs += scan_plugin_directory(directory)
+        if plugin_dir is not None:
+            specs += scan_plugin_directory(plugin_dir)
+        
+        # Classes registered before discovery stay loaded; only a spec that
+        # replaces an earlier, different spec drops the loaded class.
+        for spec in specs:
+            self.register_spec(spec)
+        self._discovered = True
+        return specs
+    
     def get(self, name: str) -> Optional[Type[BaseReportPlugin]]:
-        """Get plugin class by name."""
-        return self._plugins.get(name)
+        """Get plugin class by name, importing it on first request."""
+        self._ensure_discovered()
+        if name in self._plugins:
+            return self._plugins[name]
+        
+        spec = self._specs.get(name)
+        if spec is None:
+            return None
+        plugin_class = spec.load()
+        if not (isinstance(plugin_class, type) and issubclass(plugin_class, BaseReportPlugin)):
+            raise TypeError(f"Plugin '{name}' ({spec.target}) is not a BaseReportPlugin")
+        self._plugins[name] = plugin_class
+        logger.debug(f"Loaded plugin '{name}' from {spec.target}")
+        return plugin_class
+    
+    def get_spec(self, name: str) -> Optional[PluginSpec]:
+        """Get the discovery spec of a plugin, if it was discovered."""
+        self._ensure_discovered()
+        return self._specs.get(name)
     
     def list_plugins(self) -> list:
         """List all registered plugin names."""
-        return list(self._plugins.keys())
+        self._ensure_discovered()
+        return list(dict.fromkeys(list(self._specs) + list(self._plugins)))
     
     def has_plugin(self, name: str) -> bool:
         """Check if plugin is registered."""
-        return name in self._plugins
+        self._ensure_discovered()
+        return name in self._plugins or name in self._specs
+    
+    def _ensure_discovered(self) -> None:
+        if not self._discovered:
+            self.discover_plugins()
+
+
+def _env_plugin_dirs() -> List[Path]:
+    """Plugin directories listed in ``REPORT_AUTOMATION_PLUGIN_PATH``."""
+    value = os.environ.get(PLUGIN_PATH_ENV, "")
+    return [Path(entry) for entry in value.split(os.pathsep) if entry]
 
 
 # Global registry instance
@@ -46,3 +120,13 @@ def get_plugin(name: str) -> Optional[Type[BaseReportPlugin]]:
 def list_plugins() -> list:
     """List all registered plugins."""
     return _registry.list_plugins()
+
+
+def discover_plugins(plugin_dir: Optional[Path] = None) -> List[PluginSpec]:
+    """Discover plugins (optionally also from ``plugin_dir``) into the global registry."""
+    return _registry.discover_plugins(plugin_dir)
+
+
+def get_registry() -> PluginRegistry:
+    """Return the global plugin registry."""
+    return _registry
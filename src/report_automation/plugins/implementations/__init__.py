@@ -1,7 +1,22 @@
-"""Report plugin implementations."""
+"""Report plugin implementations.
 
-from .ab_report import ABReportPlugin
-from .casino_ret import CasinoRetPlugin
-from .awol import AWOLPlugin
+Plugin modules load their report specification at import time, so they are
+imported on first attribute access instead of with the package.
+"""
+
+import importlib
+
+_PLUGIN_MODULES = {
+    "ABReportPlugin": ".ab_report",
+    "CasinoRetPlugin": ".casino_ret",
+    "AWOLPlugin": ".awol",
+}
 
 __all__ = ["ABReportPlugin", "CasinoRetPlugin", "AWOLPlugin"]
+
+
+def __getattr__(name):
+    if name in _PLUGIN_MODULES:
+        module = importlib.import_module(_PLUGIN_MODULES[name], __name__)
+        return getattr(module, name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -2,37 +2,27 @@
 
 import pandas as pd
 from pathlib import Path
-from typing import Dict
+from typing import Any, Dict, List, Tuple
 import logging
+from openpyxl.utils import column_index_from_string
 
 from ..base import BaseReportPlugin, register_plugin
+from ...domain.models import ExcelSection, WorksheetLayout
+from ...domain.services import METRICS, WeeklyAggregate
+from ...infrastructure.config import load_report_spec
+from ...infrastructure.excel import WorkbookSkeleton
 
 logger = logging.getLogger(__name__)
 
 # V3 Constants
-TEMPLATE_MAPPING = {
-    "[S] 10 min sport basic wp": "10m",
-    "[S] 1h sport basic wp": "1h",
-    "[S] 1d 2 BLOCKS (basic wp + highroller)": "1d",
-    "[S] 3d casino 1st dep total wp": "3d",
-    "[S] 5d casino 1st dep": "5d",
-    "[S] 7d 2 BLOCKS SPORT + CAS": "7d",
-    "[S] 10d A: freebet + 100fs": "9d",
-    "[S] 10d b: 150%sport + 100fs": "9d",
-    "[S] 12d A: freebet + 100fs": "12d",
-    "[S] 12d b: 150%sport + 100fs": "12d",
-}
+SPEC = load_report_spec("a-b-report")
 
-WEEKLY_BOUNDARIES = [
-    ("2025-12-29", "2026-01-04"),  # Week 1
-    ("2026-01-05", "2026-01-11"),  # Week 2
-    ("2026-01-12", "2026-01-18"),  # Week 3
-    ("2026-01-19", "2026-01-25"),  # Week 4
-    ("2026-01-26", "2026-02-01"),  # Week 5
-]
-
-TIME_PERIODS = ["10m", "1h", "1d", "3d", "5d", "7d", "9d", "12d"]
-METRICS = ["sent", "delivered", "opened", "clicked", "converted", "unsubscribed"]
+TEMPLATE_MAPPING = SPEC.template_periods
+TIME_PERIODS = SPEC.time_periods
+TOTAL_COLUMN = SPEC.column("total")
+TOTAL_COLUMN_INDEX = column_index_from_string(TOTAL_COLUMN)
+METRIC_LABELS = ["Sent", "Delivered", "Opened", "Clicked", "Converted (Dep/Acc.Bon)",
+                 "Unsubscribe", "% Delivered", "% Open", "% Click", "% CR"]
 
 
 @register_plugin
@@ -41,20 +31,24 @@ class ABReportPlugin(BaseReportPlugin):
     
     name = "a-b-report"
     supports_multiple_files = False
+    spec = SPEC
+    input_patterns = SPEC.input_patterns
+    
+    def get_template_names(self) -> List[str]:
+        """Template names claimed by the A-B mapping."""
+        return list(TEMPLATE_MAPPING)
     
     def process_csv(self, csv_path: Path) -> pd.DataFrame:
         """Read and process CSV file."""
-        data = pd.read_csv(csv_path)
-        data['datetime'] = pd.to_datetime(data['timestamp'], unit='s')
-        return data
+        return self.read_input(csv_path)
     
     def transform_data(self, data: pd.DataFrame) -> Dict[str, Dict[str, pd.DataFrame]]:
         """Transform data according to V3 specification."""
-        # Filter to mapped templates only
-        filtered = data[data['template_name'].isin(TEMPLATE_MAPPING.keys())]
-        
-        # Aggregate by weeks
-        weekly_data = self._aggregate_by_weeks(filtered)
+        return self.transform_aggregates({"data": self.aggregate_data(data)})
+    
+    def transform_aggregates(self, aggregates: Dict[str, WeeklyAggregate]) -> Dict[str, Dict[str, pd.DataFrame]]:
+        """Transform weekly aggregates of all inputs into time period blocks."""
+        weekly_data = WeeklyAggregate.combine(aggregates.values()).week_frames(len(self.weekly_boundaries))
         
         # Group by time periods
         report_data = {}
@@ -72,19 +66,6 @@ class ABReportPlugin(BaseReportPlugin):
         
         return report_data
     
-    def _aggregate_by_weeks(self, data: pd.DataFrame) -> Dict[str, pd.DataFrame]:
-        """Aggregate data by weekly boundaries."""
-        weekly_data = {}
-        for i, (start_date, end_date) in enumerate(WEEKLY_BOUNDARIES, 1):
-            start = pd.to_datetime(start_date + ' 00:00:00')
-            end = pd.to_datetime(end_date + ' 23:59:59')
-            
-            week_mask = (data['datetime'] >= start) & (data['datetime'] <= end)
-            week_data = data[week_mask].groupby('template_name')[METRICS].sum().reset_index()
-            weekly_data[f'week{i}'] = week_data
-        
-        return weekly_data
-    
     def _calculate_percentages(self, data: pd.DataFrame) -> pd.DataFrame:
         """Calculate percentage metrics."""
         result = data.copy()
@@ -94,50 +75,70 @@ class ABReportPlugin(BaseReportPlugin):
         result['pct_cr'] = (result['converted'] / result['delivered'] * 100).fillna(0)
         return result
     
-    def generate_excel(self, report_data: Dict[str, Dict[str, pd.DataFrame]], output_path: Path):
-        """Generate Excel file with V3 formatting."""
-        from openpyxl import Workbook
-        
-        wb = Workbook()
-        ws = wb.active
+    def skeleton(self) -> WorkbookSkeleton:
+        """Campaign, week and total headers with time period and metric labels in column A."""
+        cells = {}
         
         # Headers
-        ws.merge_cells('L1:U1')
-        ws['L1'] = "Sport B"
-        ws.merge_cells('L2:U2')
-        ws['L2'] = "280% up to 375 EUR"
+        cells['L1'] = "Sport B"
+        cells['L2'] = "280% up to 375 EUR"
         
         # Week headers
-        week_labels = ["week 1 29.12", "week 2 05.01", "week 3 12.01", "week 4 19.01", "week 5 26.01"]
-        week_cols = ['I', 'L', 'O', 'R', 'U']
-        for col, label in zip(week_cols, week_labels):
-            ws[f'{col}3'] = label
-        ws['H3'] = "Total"
+        week_labels = [f"week {i} {label}" for i, label in enumerate(self.week_labels, 1)]
+        for col, label in zip(self.week_columns.values(), week_labels):
+            cells[f'{col}3'] = label
+        cells[f'{TOTAL_COLUMN}3'] = "Total"
         
-        # Data rows
+        # Row labels
         current_row = 4
-        ws[f'A{current_row}'] = "Time"
+        cells[f'A{current_row}'] = "Time"
         current_row += 1
-        
-        metric_labels = ["Sent", "Delivered", "Opened", "Clicked", "Converted (Dep/Acc.Bon)", 
-                        "Unsubscribe", "% Delivered", "% Open", "% Click", "% CR"]
-        
         for time_period in TIME_PERIODS:
-            ws[f'A{current_row}'] = time_period
+            cells[f'A{current_row}'] = time_period
             current_row += 1
-            
-            period_data = report_data.get(time_period, {})
-            
-            for metric_label in metric_labels:
-                ws[f'A{current_row}'] = metric_label
-                self._populate_metric_row(ws, current_row, metric_label, period_data)
+            for metric_label in METRIC_LABELS:
+                cells[f'A{current_row}'] = metric_label
                 current_row += 1
         
+        return WorkbookSkeleton(self.name, cells, merged=['L1:U1', 'L2:U2'])
+    
+    def expected_layout(self, report_data: Dict[str, Dict[str, pd.DataFrame]]) -> WorksheetLayout:
+        """One section per time period; its metric rows hold weekly values and a total."""
+        columns = dict(self.week_columns, total=TOTAL_COLUMN)
+        sections = []
+        
+        # Metric rows start below the "Time" row and each time period label
+        first_row = 6
+        for time_period in TIME_PERIODS:
+            sections.append(ExcelSection(name=time_period, start_row=first_row,
+                                         end_row=first_row + len(METRIC_LABELS) - 1, columns=columns))
+            first_row += len(METRIC_LABELS) + 1
+        return WorksheetLayout(name=self.sheet_title, sections=sections)
+    
+    def generate_excel(self, report_data: Dict[str, Dict[str, pd.DataFrame]], output_path: Path):
+        """Generate Excel file with V3 formatting."""
+        wb = self.new_workbook()
+        self._write_cells(wb.active, self.expected_cells(report_data))
         wb.save(output_path)
         logger.info(f"Excel report saved to: {output_path}")
     
-    def _populate_metric_row(self, ws, row: int, metric_label: str, period_data: Dict[str, pd.DataFrame]):
-        """Populate a single metric row."""
+    def expected_cells(self, report_data: Dict[str, Dict[str, pd.DataFrame]]) -> Dict[Tuple[int, int], Any]:
+        """Weekly values and total of every metric row of every time period."""
+        cells = {}
+        
+        # Data rows, below the "Time" row and each time period label
+        current_row = 5
+        for time_period in TIME_PERIODS:
+            current_row += 1
+            period_data = report_data.get(time_period, {})
+            week_rows = {week_key: self._row_values(period_data.get(week_key)) for week_key in self.week_columns}
+            for metric_label in METRIC_LABELS:
+                cells.update(self._metric_row_cells(current_row, metric_label, week_rows))
+                current_row += 1
+        return cells
+    
+    def _metric_row_cells(self, row: int, metric_label: str, week_rows: Dict[str, Dict]) -> Dict[Tuple[int, int], Any]:
+        """Cells of a single metric row from each week's first-row values."""
         metric_map = {
             "Sent": "sent", "Delivered": "delivered", "Opened": "opened",
             "Clicked": "clicked", "Converted (Dep/Acc.Bon)": "converted",
@@ -147,15 +148,14 @@ class ABReportPlugin(BaseReportPlugin):
         
         metric_col = metric_map.get(metric_label)
         if not metric_col:
-            return
+            return {}
         
         total_value = 0
         week_values = []
         
-        for week_key in ['week1', 'week2', 'week3', 'week4', 'week5']:
-            week_df = period_data.get(week_key)
-            if week_df is not None and not week_df.empty and metric_col in week_df.columns:
-                value = week_df[metric_col].iloc[0]
+        for values in week_rows.values():
+            if metric_col in values:
+                value = values[metric_col]
                 week_values.append(value)
                 if not metric_col.startswith('pct_'):
                     total_value += value
@@ -163,11 +163,13 @@ class ABReportPlugin(BaseReportPlugin):
                 week_values.append(0)
         
         # Total column
+        cells = {}
         if metric_col.startswith('pct_') and week_values:
-            ws[f'H{row}'] = sum(week_values) / len([v for v in week_values if v > 0]) if any(week_values) else 0
+            cells[(row, TOTAL_COLUMN_INDEX)] = sum(week_values) / len([v for v in week_values if v > 0]) if any(week_values) else 0
         else:
-            ws[f'H{row}'] = total_value
+            cells[(row, TOTAL_COLUMN_INDEX)] = total_value
         
         # Weekly columns
-        for week_val, col in zip(week_values, ['I', 'L', 'O', 'R', 'U']):
-            ws[f'{col}{row}'] = week_val
+        for week_val, column in zip(week_values, self.week_column_indexes.values()):
+            cells[(row, column)] = week_val
+        return cells
@@ -2,73 +2,65 @@
 
 import pandas as pd
 from pathlib import Path
-from typing import Dict, List
+from typing import Any, Dict, List, Optional, Tuple
 import logging
 from openpyxl import Workbook, load_workbook
 import copy
 
-from ..base import BaseReportPlugin, register_plugin
+from ..base import BaseReportPlugin, WeekReplacementMixin, register_plugin
+from ...domain.models import ExcelSection, WorksheetLayout
+from ...domain.services import WeeklyAggregate
+from ...infrastructure.config import load_report_spec
+from ...infrastructure.excel import WorkbookSkeleton
 
 logger = logging.getLogger(__name__)
 
-AWOL_MAPPINGS = {"Day 1": "1d", "Day 3": "3d", "Day 5": "5d", "Day 10": "10d", "Day 15": "15d", "Day 20": "20d", "Day 30": "30d", "Day 40": "40d"}
-WEEKLY_BOUNDARIES = [
-    ("2025-12-29", "2026-01-04"),
-    ("2026-01-05", "2026-01-11"),
-    ("2026-01-12", "2026-01-18"),
-    ("2026-01-19", "2026-01-25"),
-    ("2026-01-26", "2026-02-01"),
-    ("2026-02-02", "2026-02-08"),
-]
-METRICS = ["sent", "delivered", "opened", "clicked", "converted", "unsubscribed"]
-WEEK_COLUMNS = {'week1': 'K', 'week2': 'J', 'week3': 'I', 'week4': 'H', 'week5': 'G', 'week6': 'F'}
-TIMING_BLOCKS = {
-    "1d": {"inactive7": [3, 8], "inactive14": [11, 16], "inactive22": [19, 24], "inactive31": [27, 32]},
-    "10d": {"inactive7": [35, 40], "inactive14": [43, 48], "inactive22": [51, 56], "inactive31": [59, 64]},
-}
-WEEK_MAPPINGS = {
-    'source': {'01': 'K', '02': 'J', '03': 'I', '04': 'H', '05': 'G', '06': 'F'},
-    'target': {'01': 'BF', '02': 'BE', '03': 'BD', '04': 'BC', '05': 'BB', '06': 'BA'}
-}
+SPEC = load_report_spec("awol")
+
+AWOL_MAPPINGS = SPEC.template_periods
+TIMING_BLOCKS = SPEC.timing_blocks
 
 SHEET_MAPPINGS = {
-    'awol': 'AWOL Chains Sport'
+    'awol': SPEC.target_sheet
 }
 
+# First row of each inactive section; templates follow in 8-row blocks
+SECTION_START_ROWS = {"inactive7": 3, "inactive14": 11, "inactive22": 27, "inactive31": 43}
+
 
 @register_plugin
-class AWOLPlugin(BaseReportPlugin):
+class AWOLPlugin(WeekReplacementMixin, BaseReportPlugin):
     """AWOL report plugin."""
     
     name = "awol"
     supports_multiple_files = True
+    spec = SPEC
+    input_patterns = SPEC.input_patterns
     
     def __init__(self):
         self.existing_excel = None
         self.replace_week = None
     
+    def get_template_names(self) -> List[str]:
+        return list(AWOL_MAPPINGS)
+    
     def process_csv(self, csv_paths: List[Path]) -> Dict[str, pd.DataFrame]:
         data_files = {}
         for path in csv_paths:
-            df = pd.read_csv(path)
-            df['datetime'] = pd.to_datetime(df['timestamp'], unit='s')
+            df = self.read_input(path)
             data_files[path.name] = df
             logger.info(f"Loaded {path.name}: {len(df)} rows")
         return data_files
     
     def transform_data(self, data_files: Dict[str, pd.DataFrame]) -> Dict[str, Dict[str, pd.DataFrame]]:
+        aggregates = {file_name: self.aggregate_data(data) for file_name, data in data_files.items()}
+        return self.transform_aggregates(aggregates)
+    
+    def transform_aggregates(self, aggregates: Dict[str, WeeklyAggregate]) -> Dict[str, Dict[str, pd.DataFrame]]:
         report_data = {}
         
-        for file_name, data in data_files.items():
-            filtered = data[data['template_name'].isin(AWOL_MAPPINGS.keys())]
-            
-            weekly_data = {}
-            for i, (start_date, end_date) in enumerate(WEEKLY_BOUNDARIES, 1):
-                start = pd.to_datetime(start_date + ' 00:00:00')
-                end = pd.to_datetime(end_date + ' 23:59:59')
-                week_mask = (filtered['datetime'] >= start) & (filtered['datetime'] <= end)
-                week_df = filtered[week_mask].groupby('template_name')[METRICS].sum().reset_index()
-                weekly_data[f'week{i}'] = week_df
+        for file_name, aggregate in aggregates.items():
+            weekly_data = aggregate.week_frames(len(self.weekly_boundaries))
             
             file_report = {}
             for template_name, timing_category in AWOL_MAPPINGS.items():
@@ -102,41 +94,81 @@ class AWOLPlugin(BaseReportPlugin):
         }])
     
     def generate_excel(self, report_data: Dict[str, Dict[str, pd.DataFrame]], output_path: Path):
-        wb = Workbook()
-        ws = wb.active
-        
-        week_headers = {
-            'week6': ("06", "02.02"), 'week5': ("05", "26.01"), 'week4': ("04", "19.01"),
-            'week3': ("03", "12.01"), 'week2': ("02", "05.01"), 'week1': ("01", "29.12")
-        }
-        for week_key, col_letter in WEEK_COLUMNS.items():
+        wb = self.new_workbook()
+        logger.info(f"Processing {len(report_data)} files")
+        for file_name, section_data in report_data.items():
+            self._render_section(wb.active, file_name, section_data)
+        self._save_workbook(wb, output_path)
+    
+    def skeleton(self) -> WorkbookSkeleton:
+        cells = {}
+        week_headers = {f'week{i}': (f"{i:02d}", label) for i, label in enumerate(self.week_labels, 1)}
+        for week_key, col_letter in self.week_columns.items():
             if week_key in week_headers:
                 week_display, date = week_headers[week_key]
-                ws[f'{col_letter}1'] = f"Week {week_display}\n{date}"
+                cells[f'{col_letter}1'] = f"Week {week_display}\n{date}"
+        return WorkbookSkeleton(self.name, cells)
+    
+    def expected_layout(self, report_data: Dict[str, Dict[str, pd.DataFrame]]) -> WorksheetLayout:
+        """One section per rendered input; each template block holds a value in every week column.
         
-        logger.info(f"Processing {len(report_data)} files")
+        A section only owns the rows up to the next section's start, as in
+        the master workbook; blocks beyond them are overwritten by the next
+        section.
+        """
+        starts = sorted(SECTION_START_ROWS.values())
+        sections = []
         for file_name, section_data in report_data.items():
-            logger.info(f"File: {file_name}")
-            if "inactive7" in file_name.lower():
-                self._populate_section(ws, section_data, "inactive7", "Inactive 7 [SPORT] ⚽️")
-            elif "inactive14" in file_name.lower():
-                self._populate_section(ws, section_data, "inactive14", "Inactive 14 [SPORT] ⚽️")
-            elif "inactive22" in file_name.lower():
-                self._populate_section(ws, section_data, "inactive22", "Inactive 22 [SPORT] ⚽️")
-            elif "inactive31" in file_name.lower():
-                self._populate_section(ws, section_data, "inactive31", "Inactive 31+ [SPORT] ⚽️")
-        
-        wb.save(output_path)
-        logger.info(f"Excel saved: {output_path}")
-        
-        if self.existing_excel and self.replace_week:
-            self._replace_week(output_path, self.existing_excel, self.replace_week)
+            section = self._section_for(file_name)
+            templates = self._templates_with_data(section_data)
+            if section is None or not templates:
+                continue
+            section_key, campaign_name = section
+            start_row = SECTION_START_ROWS[section_key]
+            end_row = start_row + 8 * len(templates) - 1
+            next_starts = [row for row in starts if row > start_row]
+            if next_starts:
+                end_row = min(end_row, next_starts[0] - 1)
+            sections.append(ExcelSection(
+                name=campaign_name,
+                start_row=start_row,
+                end_row=end_row,
+                columns=dict(self.week_columns),
+            ))
+        return WorksheetLayout(name=self.sheet_title, sections=sections)
     
-    def _populate_section(self, ws, section_data: Dict, section_key: str, campaign_name: str):
-        current_row = 3 if section_key == "inactive7" else \
-                     11 if section_key == "inactive14" else \
-                     27 if section_key == "inactive22" else 43
-        
+    def expected_cells(self, report_data: Dict[str, Dict[str, pd.DataFrame]]) -> Dict[Tuple[int, int], Any]:
+        """Labels and weekly values of every rendered section; a later section overwrites overflowing blocks."""
+        cells = {}
+        for file_name, section_data in report_data.items():
+            cells.update(self._section_cells(file_name, section_data))
+        return cells
+    
+    def _render_section(self, ws, file_name: str, section_data: Dict):
+        logger.info(f"File: {file_name}")
+        self._write_cells(ws, self._section_cells(file_name, section_data))
+    
+    def _section_cells(self, file_name: str, section_data: Dict) -> Dict[Tuple[int, int], Any]:
+        """Cells of the section one input file belongs to (none if it belongs to no section)."""
+        section = self._section_for(file_name)
+        return {} if section is None else self._populate_section(section_data, *section)
+    
+    @staticmethod
+    def _section_for(file_name: str) -> Optional[Tuple[str, str]]:
+        """(section key, campaign name) of the section an input file belongs to."""
+        if "inactive7" in file_name.lower():
+            return "inactive7", "Inactive 7 [SPORT] ⚽️"
+        elif "inactive14" in file_name.lower():
+            return "inactive14", "Inactive 14 [SPORT] ⚽️"
+        elif "inactive22" in file_name.lower():
+            return "inactive22", "Inactive 22 [SPORT] ⚽️"
+        elif "inactive31" in file_name.lower():
+            return "inactive31", "Inactive 31+ [SPORT] ⚽️"
+        return None
+    
+    @staticmethod
+    def _templates_with_data(section_data: Dict) -> List[str]:
+        """Timing categories with sends in any week, in day order; each gets an 8-row block."""
         templates_with_data = []
         for timing_category in section_data.keys():
             has_data = any(not df.empty and df['sent'].iloc[0] > 0 
@@ -146,34 +178,49 @@ class AWOLPlugin(BaseReportPlugin):
                 templates_with_data.append(timing_category)
         
         templates_with_data.sort(key=lambda x: int(x.replace('d', '')))
+        return templates_with_data
+    
+    def _save_workbook(self, wb: Workbook, output_path: Path):
+        wb.save(output_path)
+        logger.info(f"Excel saved: {output_path}")
+        
+        if self.existing_excel and self.replace_week:
+            self._replace_week(output_path, self.existing_excel, self.replace_week)
+    
+    def _populate_section(self, section_data: Dict, section_key: str, campaign_name: str) -> Dict[Tuple[int, int], Any]:
+        cells = {}
+        week_columns = self.week_column_indexes
+        current_row = SECTION_START_ROWS[section_key]
         
-        for timing_category in templates_with_data:
+        for timing_category in self._templates_with_data(section_data):
             template_name = {v: k for k, v in AWOL_MAPPINGS.items()}.get(timing_category, timing_category)
             
-            ws[f'B{current_row}'] = campaign_name.replace(" [SPORT] ⚽️", "").lower()
-            ws[f'C{current_row}'] = " All Mail"
-            ws[f'D{current_row}'] = template_name
+            cells[(current_row, 2)] = campaign_name.replace(" [SPORT] ⚽️", "").lower()
+            cells[(current_row, 3)] = " All Mail"
+            cells[(current_row, 4)] = template_name
             
             timing_data = section_data[timing_category]
             # 8 metrics: sent, delivered, opened, clicked, unsubscribed, %delivered, %open, %click
             metrics = ["sent", "delivered", "opened", "clicked", "unsubscribed", "pct_delivered", "pct_open", "pct_click"]
             
+            week_values = {week_key: self._row_values(timing_data.get(week_key)) for week_key in week_columns}
+            
             for i, metric in enumerate(metrics):
                 row = current_row + i
                 
-                for week_key, col_letter in WEEK_COLUMNS.items():
-                    if week_key in timing_data and not timing_data[week_key].empty:
-                        df = timing_data[week_key]
-                        if metric in df.columns:
-                            ws[f'{col_letter}{row}'] = df[metric].iloc[0]
-                    else:
-                        ws[f'{col_letter}{row}'] = 0
+                for week_key, column in week_columns.items():
+                    values = week_values[week_key]
+                    if not values:
+                        cells[(row, column)] = 0
+                    elif metric in values:
+                        cells[(row, column)] = values[metric]
             
             current_row += 8
+        return cells
     
-    def _replace_week(self, generated_path: Path, existing_path: Path, week_number: str):
-        source_col = WEEK_MAPPINGS['source'][week_number]
-        target_col = WEEK_MAPPINGS['target'][week_number]
+    def _replace_week(self, generated_path: Path, existing_path: Path, week_number: str, output_path: Path = None) -> Path:
+        source_col = self.week_mappings['source'][week_number]
+        target_col = self.week_mappings['target'][week_number]
         
         generated_wb = load_workbook(generated_path, data_only=False)
         existing_wb = load_workbook(existing_path, data_only=False)
@@ -217,9 +264,10 @@ class AWOLPlugin(BaseReportPlugin):
                         existing_ws[f'{target_col}{target_row}'].value = value
                         copied += 1
         
-        output_path = existing_path.parent / f"updated_{existing_path.name}"
+        output_path = output_path or existing_path.parent / f"updated_{existing_path.name}"
         existing_wb.save(output_path)
         logger.info(f"Updated Excel saved: {output_path} ({copied} values)")
+        return output_path
     
     def _copy_formatting(self, ws, source_col: str, target_col: str):
         for row in range(1, ws.max_row + 1):
@@ -257,13 +305,14 @@ class AWOLPlugin(BaseReportPlugin):
         
         return None
     
-    def execute(self, input_paths: List[Path], output_path: Path, existing_excel: Path = None, replace_week: str = None):
+    def execute(self, input_paths: List[Path], output_path: Path, existing_excel: Path = None, replace_week: str = None,
+                workers: int = None, max_memory: int = None, chunksize: int = None):
         self.existing_excel = existing_excel
         self.replace_week = replace_week
         
         for path in input_paths:
             self.validate_input(path)
         
-        data_files = self.process_csv(input_paths)
-        report_data = self.transform_data(data_files)
+        aggregates = self.aggregate_inputs(input_paths, workers, max_memory, chunksize)
+        report_data = self.transform_aggregates(aggregates)
         self.generate_excel(report_data, output_path)
@@ -2,127 +2,73 @@
 
 import pandas as pd
 from pathlib import Path
-from typing import Dict, List
+from typing import Any, Dict, List, Optional, Tuple
 import logging
 from openpyxl import Workbook, load_workbook
 from openpyxl.utils import get_column_letter
 import copy
 
-from ..base import BaseReportPlugin, register_plugin
+from ..base import BaseReportPlugin, WeekReplacementMixin, register_plugin
+from ...domain.models import ExcelSection, WorksheetLayout
+from ...domain.services import WeeklyAggregate
+from ...infrastructure.config import load_report_spec
+from ...infrastructure.excel import WorkbookSkeleton
 
 logger = logging.getLogger(__name__)
 
-# Template mappings
-RETENTION_MAPPINGS = {"Day 3": "3d", "Day 4": "4d", "Day 6": "6d", "Day 8": "8d", "Day 10": "10d"}
-CASINOSPORT_MAPPINGS = {
-    "[S] 10 min sport basic wp": "10min",
-    "[S] 1h sport basic wp": "1h",
-    "[S] 1d 2 BLOCKS (basic wp + highroller)": "1d",
-    "[S] 3d casino 1st dep total wp": "4d",
-    "[S] 5d casino 1st dep": "6d",
-    "[S] 7d 2 BLOCKS SPORT + CAS": "8d",
-    "[S] 10d A: freebet + 100fs": "10d",
-    "[S] 10d b: 150%sport + 100fs": "10d",
-    "[S] 12d A: freebet + 100fs": "12d",
-    "[S] 12d b: 150%sport + 100fs": "12d",
-}
+SPEC = load_report_spec("casino-ret")
 
-WEEKLY_BOUNDARIES = [
-    ("2025-12-29", "2026-01-04"),  # Week 1
-    ("2026-01-05", "2026-01-11"),  # Week 2
-    ("2026-01-12", "2026-01-18"),  # Week 3
-    ("2026-01-19", "2026-01-25"),  # Week 4
-    ("2026-01-26", "2026-02-01"),  # Week 5
-    ("2026-02-02", "2026-02-08"),  # Week 6
-]
-
-METRICS = ["sent", "delivered", "opened", "clicked", "converted", "unsubscribed"]
-WEEK_COLUMNS = {'week1': 'J', 'week2': 'I', 'week3': 'H', 'week4': 'G', 'week5': 'F', 'week6': 'E'}
-TIMING_BLOCKS = {
-    "10min": {"casino_rows": [3, 8]},
-    "1h": {"casino_rows": [9, 14]},
-    "1d": {"casino_rows": [15, 20]},
-    "3d": {"casino_rows": [21, 26], "section_1_rows": [93, 98], "section_2_rows": [141, 146]},
-    "4d": {"casino_rows": [27, 32], "section_1_rows": [99, 104], "section_2_rows": [147, 152]},
-    "6d": {"casino_rows": [33, 38], "section_1_rows": [105, 110], "section_2_rows": [153, 158]},
-    "8d": {"casino_rows": [39, 44], "section_1_rows": [111, 116], "section_2_rows": [159, 164]},
-    "10d": {"casino_rows": [45, 50], "section_1_rows": [117, 122], "section_2_rows": [165, 170]},
-    "12d": {"casino_rows": [51, 56]},
-}
+# Template mappings
+RETENTION_MAPPINGS = SPEC.template_groups["retention"]
+CASINOSPORT_MAPPINGS = SPEC.template_groups["casinosport"]
 
-WEEK_MAPPINGS = {
-    'source': {'01': 'J', '02': 'I', '03': 'H', '04': 'G', '05': 'F', '06': 'E'},
-    'target': {'01': 'BF', '02': 'BE', '03': 'BD', '04': 'BC', '05': 'BB', '06': 'BA'}
-}
+TIMING_BLOCKS = SPEC.timing_blocks
 
 SHEET_MAPPINGS = {
-    'casino-ret': 'WP Chains Sport'
+    'casino-ret': SPEC.target_sheet
 }
 
-TEMPLATE_MAPPINGS = {
-    "10min": "10 min",
-    "1h": "1h",
-    "1d": "1d",
-    "3d": "3d",
-    "4d": "4d",
-    "6d": "6d",
-    "8d": "8d",
-    "10d": "10d",
-    "12d": "12d"
-}
+TEMPLATE_MAPPINGS = SPEC.target_labels
 
 
 @register_plugin
-class CasinoRetPlugin(BaseReportPlugin):
+class CasinoRetPlugin(WeekReplacementMixin, BaseReportPlugin):
     """Casino-Ret report plugin."""
     
     name = "casino-ret"
     supports_multiple_files = True
+    spec = SPEC
+    input_patterns = SPEC.input_patterns
     
     def __init__(self):
         self.existing_excel = None
         self.replace_week = None
     
+    def get_template_names(self) -> List[str]:
+        """Template names claimed by the casino+sport and retention mappings."""
+        return list(CASINOSPORT_MAPPINGS) + list(RETENTION_MAPPINGS)
+    
     def process_csv(self, csv_paths: List[Path]) -> Dict[str, pd.DataFrame]:
         """Read multiple CSV files."""
         data_files = {}
         for path in csv_paths:
-            df = pd.read_csv(path)
-            df['datetime'] = pd.to_datetime(df['timestamp'], unit='s')
+            df = self.read_input(path)
             data_files[path.name] = df
             logger.info(f"Loaded {path.name}: {len(df)} rows")
         return data_files
     
     def transform_data(self, data_files: Dict[str, pd.DataFrame]) -> Dict[str, Dict[str, pd.DataFrame]]:
         """Transform data for WP-Chains-2 structure."""
+        aggregates = {file_name: self.aggregate_data(data) for file_name, data in data_files.items()}
+        return self.transform_aggregates(aggregates)
+    
+    def transform_aggregates(self, aggregates: Dict[str, WeeklyAggregate]) -> Dict[str, Dict[str, pd.DataFrame]]:
+        """Transform per-file weekly aggregates into timing category blocks."""
         report_data = {}
         
-        for file_name, data in data_files.items():
-            # Determine mapping based on campaign name
-            if not data.empty and 'campaign_name' in data.columns:
-                campaign_name = data['campaign_name'].iloc[0]
-                if 'casino+sport' in campaign_name.lower() or 'a/b' in campaign_name.lower():
-                    mappings = CASINOSPORT_MAPPINGS
-                else:
-                    mappings = RETENTION_MAPPINGS
-            else:
-                # Fallback to filename detection
-                if "casinosport" in file_name.lower() or "ab" in file_name.lower():
-                    mappings = CASINOSPORT_MAPPINGS
-                else:
-                    mappings = RETENTION_MAPPINGS
-            
-            # Filter templates
-            filtered = data[data['template_name'].isin(mappings.keys())]
-            
-            # Aggregate by weeks
-            weekly_data = {}
-            for i, (start_date, end_date) in enumerate(WEEKLY_BOUNDARIES, 1):
-                start = pd.to_datetime(start_date + ' 00:00:00')
-                end = pd.to_datetime(end_date + ' 23:59:59')
-                week_mask = (filtered['datetime'] >= start) & (filtered['datetime'] <= end)
-                week_df = filtered[week_mask].groupby('template_name')[METRICS].sum().reset_index()
-                weekly_data[f'week{i}'] = week_df
+        for file_name, aggregate in aggregates.items():
+            mappings = self._select_mappings(file_name, aggregate.campaign_name)
+            weekly_data = aggregate.week_frames(len(self.weekly_boundaries))
             
             # Group by timing category
             file_report = {}
@@ -141,6 +87,16 @@ class CasinoRetPlugin(BaseReportPlugin):
         
         return report_data
     
+    def _select_mappings(self, file_name: str, campaign_name: str = None) -> Dict[str, str]:
+        """Determine template mapping based on campaign name, falling back to file name."""
+        if campaign_name is not None:
+            if 'casino+sport' in campaign_name.lower() or 'a/b' in campaign_name.lower():
+                return CASINOSPORT_MAPPINGS
+            return RETENTION_MAPPINGS
+        if "casinosport" in file_name.lower() or "ab" in file_name.lower():
+            return CASINOSPORT_MAPPINGS
+        return RETENTION_MAPPINGS
+    
     def _calculate_percentages(self, data: pd.DataFrame) -> pd.DataFrame:
         """Calculate percentage metrics."""
         result = data.copy()
@@ -160,47 +116,102 @@ class CasinoRetPlugin(BaseReportPlugin):
     
     def generate_excel(self, report_data: Dict[str, Dict[str, pd.DataFrame]], output_path: Path):
         """Generate Excel file."""
-        wb = Workbook()
-        ws = wb.active
+        wb = self.new_workbook()
+        for file_name, section_data in report_data.items():
+            self._render_section(wb.active, file_name, section_data)
+        self._save_workbook(wb, output_path)
+    
+    def skeleton(self) -> WorkbookSkeleton:
+        """Week and section headers."""
+        cells = {}
         
         # Headers
-        week_headers = {
-            'week6': ("06", "02.02"), 'week5': ("05", "26.01"), 'week4': ("04", "19.01"),
-            'week3': ("03", "12.01"), 'week2': ("02", "05.01"), 'week1': ("01", "29.12")
-        }
-        for week_key, col_letter in WEEK_COLUMNS.items():
+        week_headers = {f'week{i}': (f"{i:02d}", label) for i, label in enumerate(self.week_labels, 1)}
+        for week_key, col_letter in self.week_columns.items():
             if week_key in week_headers:
                 week_display, date = week_headers[week_key]
-                ws[f'{col_letter}1'] = f"Week {week_display}\n{date}"
+                cells[f'{col_letter}1'] = f"Week {week_display}\n{date}"
         
         # Section headers
-        ws['A3'] = "Signed up"
-        ws['A75'] = "deposits_quantity is 1"
-        ws['A123'] = "deposits_quantity is 2"
-        
-        # Populate sections
+        cells['A3'] = "Signed up"
+        cells['A75'] = "deposits_quantity is 1"
+        cells['A123'] = "deposits_quantity is 2"
+        return WorkbookSkeleton(self.name, cells)
+    
+    def expected_layout(self, report_data: Dict[str, Dict[str, pd.DataFrame]]) -> WorksheetLayout:
+        """One section per rendered input; its timing blocks hold a value in every week column."""
+        sections = {}
         for file_name, section_data in report_data.items():
-            # Detect section by checking first campaign in data
-            if section_data:
-                # Get first timing category to check campaign type
-                first_timing = next(iter(section_data.values()), {})
-                if first_timing:
-                    first_week = next(iter(first_timing.values()), pd.DataFrame())
-                    if not first_week.empty and 'template_name' in first_week.columns:
-                        template = first_week['template_name'].iloc[0]
-                        # Check if it's a casino template
-                        if any(casino_key in str(template) for casino_key in ['[S]', 'sport', 'casino', 'FS']):
-                            self._populate_section(ws, section_data, 3, "casino+sport A/B Reg_No_Dep", "casino")
-                            continue
-            
-            # Fallback to filename detection
-            if "casinosport" in file_name.lower() or "ab" in file_name.lower():
-                self._populate_section(ws, section_data, 3, "casino+sport A/B Reg_No_Dep", "casino")
-            elif "ret" in file_name.lower() and "1" in file_name:
-                self._populate_section(ws, section_data, 75, "Ret 1 dep [SPORT] ⚽️", "retention")
-            elif "ret" in file_name.lower() and "2" in file_name:
-                self._populate_section(ws, section_data, 123, "Ret 2 dep [SPORT] ⚽️", "retention")
+            target = self._section_target(file_name, section_data)
+            if target is None:
+                continue
+            start_row, campaign_name, section_type = target
+            blocks = [self._block_rows(block_info, start_row, section_type)
+                      for timing_category, block_info in TIMING_BLOCKS.items() if timing_category in section_data]
+            blocks = [rows for rows in blocks if rows]
+            if blocks:
+                sections[start_row] = ExcelSection(
+                    name=campaign_name,
+                    start_row=min(start for start, _ in blocks),
+                    end_row=max(end for _, end in blocks),
+                    columns=dict(self.week_columns),
+                )
+        return WorksheetLayout(name=self.sheet_title, sections=list(sections.values()))
+    
+    def expected_cells(self, report_data: Dict[str, Dict[str, pd.DataFrame]]) -> Dict[Tuple[int, int], Any]:
+        """Labels and weekly values of every rendered section, in render order."""
+        cells = {}
+        for file_name, section_data in report_data.items():
+            cells.update(self._section_cells(file_name, section_data))
+        return cells
+    
+    def _render_section(self, ws, file_name: str, section_data: Dict):
+        """Populate the section one input file belongs to."""
+        self._write_cells(ws, self._section_cells(file_name, section_data))
+    
+    def _section_cells(self, file_name: str, section_data: Dict) -> Dict[Tuple[int, int], Any]:
+        """Cells of the section one input file belongs to (none if it belongs to no section)."""
+        target = self._section_target(file_name, section_data)
+        return {} if target is None else self._populate_section(section_data, *target)
+    
+    def _section_target(self, file_name: str, section_data: Dict) -> Optional[Tuple[int, str, str]]:
+        """(start row, campaign name, section type) of the section an input file belongs to."""
+        # Detect section by checking first campaign in data
+        if section_data:
+            # Get first timing category to check campaign type
+            first_timing = next(iter(section_data.values()), {})
+            if first_timing:
+                first_week = next(iter(first_timing.values()), pd.DataFrame())
+                if not first_week.empty and 'template_name' in first_week.columns:
+                    template = first_week['template_name'].iloc[0]
+                    # Check if it's a casino template
+                    if any(casino_key in str(template) for casino_key in ['[S]', 'sport', 'casino', 'FS']):
+                        return 3, "casino+sport A/B Reg_No_Dep", "casino"
         
+        # Fallback to filename detection
+        if "casinosport" in file_name.lower() or "ab" in file_name.lower():
+            return 3, "casino+sport A/B Reg_No_Dep", "casino"
+        elif "ret" in file_name.lower() and "1" in file_name:
+            return 75, "Ret 1 dep [SPORT] ⚽️", "retention"
+        elif "ret" in file_name.lower() and "2" in file_name:
+            return 123, "Ret 2 dep [SPORT] ⚽️", "retention"
+        return None
+    
+    @staticmethod
+    def _block_rows(block_info: Dict, start_row: int, section_type: str) -> Optional[Tuple[int, int]]:
+        """First and last row of a timing block in a section (None if the section has no such block)."""
+        if section_type == "casino":
+            if "casino_rows" not in block_info:
+                return None
+            block_start, block_end = block_info["casino_rows"]
+        elif start_row == 75:
+            block_start, block_end = block_info["section_1_rows"]
+        else:
+            block_start, block_end = block_info["section_2_rows"]
+        return block_start, block_end
+    
+    def _save_workbook(self, wb: Workbook, output_path: Path):
+        """Save the workbook and apply any requested week replacement."""
         wb.save(output_path)
         logger.info(f"Excel saved: {output_path}")
         
@@ -208,9 +219,11 @@ class CasinoRetPlugin(BaseReportPlugin):
         if self.existing_excel and self.replace_week:
             self._replace_week(output_path, self.existing_excel, self.replace_week)
     
-    def _populate_section(self, ws, section_data: Dict, start_row: int, campaign_name: str, section_type: str = "retention"):
-        """Populate casino or retention section."""
-        ws[f'B{start_row}'] = campaign_name
+    def _populate_section(self, section_data: Dict, start_row: int, campaign_name: str,
+                          section_type: str = "retention") -> Dict[Tuple[int, int], Any]:
+        """Cells of a casino or retention section."""
+        cells = {(start_row, 2): campaign_name}
+        week_columns = self.week_column_indexes
         
         for timing_category, block_info in TIMING_BLOCKS.items():
             # Skip if timing category not in section data
@@ -218,37 +231,33 @@ class CasinoRetPlugin(BaseReportPlugin):
                 continue
             
             # Get correct row range based on section type
-            if section_type == "casino":
-                if "casino_rows" not in block_info:
-                    continue
-                block_start, block_end = block_info["casino_rows"]
-            elif start_row == 75:
-                block_start, block_end = block_info["section_1_rows"]
-            else:
-                block_start, block_end = block_info["section_2_rows"]
+            block_rows = self._block_rows(block_info, start_row, section_type)
+            if block_rows is None:
+                continue
+            block_start, block_end = block_rows
+            
+            cells[(block_start, 3)] = timing_category
             
-            ws[f'C{block_start}'] = timing_category
+            timing_data = section_data[timing_category]
+            metrics = ["sent", "delivered", "opened", "clicked", "unsubscribed", "pct_delivered"]
+            week_values = {week_key: self._row_values(timing_data.get(week_key)) for week_key in week_columns}
             
-            if timing_category in section_data:
-                timing_data = section_data[timing_category]
-                metrics = ["sent", "delivered", "opened", "clicked", "unsubscribed", "pct_delivered"]
+            for i, metric in enumerate(metrics):
+                row = block_start + i
+                cells[(row, 4)] = metric.replace('_', ' ').title()
                 
-                for i, metric in enumerate(metrics):
-                    row = block_start + i
-                    ws[f'D{row}'] = metric.replace('_', ' ').title()
-                    
-                    for week_key, col_letter in WEEK_COLUMNS.items():
-                        if week_key in timing_data and not timing_data[week_key].empty:
-                            df = timing_data[week_key]
-                            if metric in df.columns:
-                                ws[f'{col_letter}{row}'] = df[metric].iloc[0]
-                        else:
-                            ws[f'{col_letter}{row}'] = 0
+                for week_key, column in week_columns.items():
+                    values = week_values[week_key]
+                    if not values:
+                        cells[(row, column)] = 0
+                    elif metric in values:
+                        cells[(row, column)] = values[metric]
+        return cells
     
-    def _replace_week(self, generated_path: Path, existing_path: Path, week_number: str):
+    def _replace_week(self, generated_path: Path, existing_path: Path, week_number: str, output_path: Path = None) -> Path:
         """Replace week data in existing Excel."""
-        source_col = WEEK_MAPPINGS['source'][week_number]
-        target_col = WEEK_MAPPINGS['target'][week_number]
+        source_col = self.week_mappings['source'][week_number]
+        target_col = self.week_mappings['target'][week_number]
         
         generated_wb = load_workbook(generated_path, data_only=True)
         existing_wb = load_workbook(existing_path, data_only=False)
@@ -297,9 +306,10 @@ class CasinoRetPlugin(BaseReportPlugin):
                             copied += 1
                             logger.info(f"Copied {current_campaign}/{current_template}/{metric}: {value} to row {target_row}")
         
-        output_path = existing_path.parent / f"updated_{existing_path.name}"
+        output_path = output_path or existing_path.parent / f"updated_{existing_path.name}"
         existing_wb.save(output_path)
         logger.info(f"Updated Excel saved: {output_path} ({copied} values)")
+        return output_path
     
     def _copy_formatting(self, ws, source_col: str, target_col: str):
         """Copy column formatting."""
@@ -353,7 +363,8 @@ class CasinoRetPlugin(BaseReportPlugin):
         
         return None
     
-    def execute(self, input_paths: List[Path], output_path: Path, existing_excel: Path = None, replace_week: str = None):
+    def execute(self, input_paths: List[Path], output_path: Path, existing_excel: Path = None, replace_week: str = None,
+                workers: int = None, max_memory: int = None, chunksize: int = None):
         """Execute with optional week replacement."""
         self.existing_excel = existing_excel
         self.replace_week = replace_week
@@ -361,6 +372,6 @@ class CasinoRetPlugin(BaseReportPlugin):
         for path in input_paths:
             self.validate_input(path)
         
-        data_files = self.process_csv(input_paths)
-        report_data = self.transform_data(data_files)
+        aggregates = self.aggregate_inputs(input_paths, workers, max_memory, chunksize)
+        report_data = self.transform_aggregates(aggregates)
         self.generate_excel(report_data, output_path)
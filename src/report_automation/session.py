@@ -0,0 +1,309 @@
+"""In-process report session: parse and aggregate once, render many outputs."""
+
+import shutil
+import tempfile
+from pathlib import Path
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Tuple, Union
+import logging
+
+import numpy as np
+import pandas as pd
+
+from .domain.services import WeeklyAggregate
+from .infrastructure.cache import TransformMemo
+from .infrastructure.export import write_tidy
+from .plugins import get_plugin, list_plugins
+from .plugins.base import BaseReportPlugin, ModulePluginLoader, get_plugin_loader
+
+
+logger = logging.getLogger(__name__)
+
+class ReportSession:
+    """Holds loaded inputs and computed aggregates for one report type.
+    
+    Each stage is computed on first use and cached: parsed input frames,
+    per-file weekly aggregates, the plugin's report data, and one workbook
+    rendered into a private temp directory, which new outputs and week
+    replacements are copied from. Call ``invalidate`` when inputs change
+    and ``reload_plugin`` after editing the plugin or its report YAML;
+    cached inputs and aggregates survive a reload unless the plugin's
+    ``transform_fingerprint`` changed.
+    
+    With a ``memo``, report data of inputs whose aggregates are not in
+    memory is reused from (and stored in) the ``TransformMemo`` shared with
+    ``generate`` and ``batch``, so a session over already-reported inputs
+    skips parsing and aggregation altogether.
+    
+    Example::
+    
+        with ReportSession("casino-ret", paths) as session:
+            session.render_new(Path("out/report.xlsx"))
+            session.replace_into(Path("master_a.xlsx"), ["05", "06"])
+            session.replace_into(Path("master_b.xlsx"), ["06"])
+            session.export("csv", Path("out/report.csv"))
+    """
+    
+    def __init__(self, report_type: str, input_paths: Iterable[Path], workers: Optional[int] = None,
+                 memo: Optional[TransformMemo] = None):
+        """Initialize session for a report type and its input files."""
+        plugin_class = get_plugin(report_type)
+        if not plugin_class:
+            raise ValueError(f"Report type '{report_type}' not found. Available: {', '.join(list_plugins())}")
+        
+        self.report_type = report_type
+        self.plugin: BaseReportPlugin = plugin_class()
+        self.workers = workers
+        self.memo = memo
+        self.input_paths: List[Path] = []
+        
+        self._inputs: Optional[Dict[str, pd.DataFrame]] = None
+        self._aggregates: Optional[Dict[str, WeeklyAggregate]] = None
+        self._report_data: Optional[Dict[str, Any]] = None
+        self._rendered_path: Optional[Path] = None
+        self._work_dir: Optional[Path] = None
+        
+        self.set_inputs(input_paths)
+    
+    def __enter__(self) -> "ReportSession":
+        return self
+    
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+    
+    def set_inputs(self, input_paths: Iterable[Path]) -> None:
+        """Replace the session inputs, dropping everything derived from the old ones."""
+        input_paths = [Path(path) for path in input_paths]
+        for path in input_paths:
+            self.plugin.validate_input(path)
+        if not self.plugin.supports_multiple_files and len(input_paths) > 1:
+            raise ValueError(f"{self.report_type} supports a single input file")
+        self.input_paths = input_paths
+        self.invalidate(inputs=True)
+    
+    def reload_plugin(self, loader: Optional[ModulePluginLoader] = None) -> bool:
+        """Re-import the plugin and keep whatever caches it did not invalidate.
+        
+        Returns True when the cached aggregates were kept.
+        """
+        loader = loader or get_plugin_loader()
+        return self.use_plugin(loader.reload_plugin(self.report_type))
+    
+    def use_plugin(self, plugin_class: type) -> bool:
+        """Switch to a (reloaded) plugin class, comparing fingerprints to decide what to drop."""
+        plugin = plugin_class()
+        inputs_changed = plugin.input_fingerprint() != self.plugin.input_fingerprint()
+        aggregates_changed = plugin.transform_fingerprint() != self.plugin.transform_fingerprint()
+        self.plugin = plugin
+        
+        if aggregates_changed:
+            self.invalidate(inputs=inputs_changed)
+        else:
+            self._report_data = None
+            self._rendered_path = None
+        logger.info(f"Session switched to reloaded {self.report_type} plugin "
+                    f"({'recomputing' if aggregates_changed else 'keeping'} aggregates)")
+        return not aggregates_changed
+    
+    def invalidate(self, inputs: bool = False) -> None:
+        """Drop cached aggregates and renders; with ``inputs`` also drop parsed frames."""
+        if inputs:
+            self._inputs = None
+        self._aggregates = None
+        self._report_data = None
+        self._rendered_path = None
+    
+    @property
+    def inputs(self) -> Dict[str, pd.DataFrame]:
+        """Parsed input frames keyed by file name (loaded on first access)."""
+        if self._inputs is None:
+            self._inputs = {path.name: self.plugin.read_input(path) for path in self.input_paths}
+            logger.info(f"Session loaded {len(self._inputs)} input file(s)")
+        return self._inputs
+    
+    @property
+    def aggregates(self) -> Dict[str, WeeklyAggregate]:
+        """Per-file weekly aggregates (computed on first access)."""
+        if self._aggregates is None:
+            if self._inputs is None and self.workers and self.workers > 1:
+                self._aggregates = self.plugin.aggregate_inputs(self.input_paths, self.workers)
+            else:
+                self._aggregates = {name: self.plugin.aggregate_data(data)
+                                    for name, data in self.inputs.items()}
+        return self._aggregates
+    
+    @property
+    def report_data(self) -> Dict[str, Any]:
+        """Plugin report structure built from the aggregates (or the memo, if they are not loaded)."""
+        if self._report_data is None:
+            if self._aggregates is None and self.memo is not None:
+                self._report_data = self.plugin.transform_inputs(self.input_paths, self.workers, memo=self.memo)
+            else:
+                self._report_data = self.plugin.transform_aggregates(self.aggregates)
+        return self._report_data
+    
+    def render_new(self, output_path: Path) -> Path:
+        """Render the report as a new workbook."""
+        output_path = Path(output_path)
+        output_path.parent.mkdir(parents=True, exist_ok=True)
+        shutil.copyfile(self._render(), output_path)
+        logger.info(f"Session rendered {self.report_type} report: {output_path}")
+        return output_path
+    
+    def replace_into(self, existing_excel: Path, weeks: Union[str, Iterable[str]],
+                     output_path: Optional[Path] = None) -> Path:
+        """Replace weeks of an existing master workbook; returns the updated file."""
+        weeks = [weeks] if isinstance(weeks, str) else list(weeks)
+        return self.plugin.replace_weeks(self._render(), Path(existing_excel), weeks, output_path)
+    
+    def export(self, fmt: str, output_path: Path) -> Path:
+        """Write the report data as tidy rows (see ``BaseReportPlugin.tidy_report_data``) in ``fmt``."""
+        return write_tidy(self.plugin.tidy_report_data(self.report_data), Path(output_path), fmt)
+    
+    def close(self) -> None:
+        """Remove temporary render files."""
+        if self._work_dir is not None:
+            shutil.rmtree(self._work_dir, ignore_errors=True)
+            self._work_dir = None
+        self._rendered_path = None
+    
+    def _render(self) -> Path:
+        """Render report data once into the session's temp directory; outputs are copies of this file."""
+        if self._rendered_path is None:
+            if self.plugin.supports_week_replacement:
+                self.plugin.existing_excel = None
+                self.plugin.replace_week = None
+            output_path = self._temp_dir() / f"{self.report_type}.xlsx"
+            self.plugin.generate_excel(self.report_data, output_path)
+            self._rendered_path = output_path
+        return self._rendered_path
+    
+    def _temp_dir(self) -> Path:
+        if self._work_dir is None:
+            self._work_dir = Path(tempfile.mkdtemp(prefix="report-session-"))
+        return self._work_dir
+
+
+class MultiReportSession:
+    """Builds several report types from one scan of shared inputs.
+    
+    Each input file is parsed once. A row is routed to each report whose
+    template mapping claims its template (reports without a mapping take
+    every template) and whose ``input_patterns`` claim its campaign, so a
+    combined export splits into the sections single-report runs over
+    per-campaign files would see (see ``BaseReportPlugin.input_section``).
+    A file holding one campaign falls back to its own name, as in a
+    single-report run.
+    
+    Example::
+    
+        with MultiReportSession(["a-b-report", "casino-ret", "awol"], [Path("combined.csv")]) as session:
+            session.render_all({"a-b-report": Path("out/ab.xlsx"), "casino-ret": Path("out/cr.xlsx"),
+                                "awol": Path("out/awol.xlsx")})
+    """
+    
+    def __init__(self, report_types: Iterable[str], input_paths: Iterable[Path]):
+        """Initialize session for several report types over the same input files."""
+        self.plugins: Dict[str, BaseReportPlugin] = {}
+        for report_type in report_types:
+            plugin_class = get_plugin(report_type)
+            if not plugin_class:
+                raise ValueError(f"Report type '{report_type}' not found. Available: {', '.join(list_plugins())}")
+            self.plugins[report_type] = plugin_class()
+        if not self.plugins:
+            raise ValueError("No report types given")
+        
+        fingerprints = {plugin.input_fingerprint() for plugin in self.plugins.values()}
+        if len(fingerprints) > 1:
+            raise ValueError(f"Report types {', '.join(self.plugins)} parse inputs differently; run them separately")
+        
+        self.input_paths = [Path(path) for path in input_paths]
+        for path in self.input_paths:
+            next(iter(self.plugins.values())).validate_input(path)
+        self._aggregates: Optional[Dict[str, Dict[str, WeeklyAggregate]]] = None
+    
+    def __enter__(self) -> "MultiReportSession":
+        return self
+    
+    def __exit__(self, *exc_info) -> None:
+        self._aggregates = None
+    
+    @property
+    def aggregates(self) -> Dict[str, Dict[str, WeeklyAggregate]]:
+        """Per-section weekly aggregates of every report type (one scan on first access).
+        
+        Sections are ordered by the input pattern that claimed them, the
+        order single-report runs are given their files in.
+        """
+        if self._aggregates is None:
+            reader = next(iter(self.plugins.values()))
+            sections: Dict[str, Dict[str, Tuple[int, List[WeeklyAggregate]]]] = {name: {} for name in self.plugins}
+            for path in self.input_paths:
+                data = reader.read_input(path)
+                logger.info(f"Session loaded {path.name}: {len(data)} rows")
+                for report_type, index, section, rows in self._route(path, data):
+                    aggregate = self.plugins[report_type].aggregate_data(rows)
+                    sections[report_type].setdefault(section, (index, []))[1].append(aggregate)
+                del data
+            self._aggregates = {
+                report_type: {section: WeeklyAggregate.combine(parts) for section, (_, parts)
+                              in sorted(report_sections.items(), key=lambda item: item[1][0])}
+                for report_type, report_sections in sections.items()
+            }
+        return self._aggregates
+    
+    def render_all(self, output_paths: Dict[str, Path]) -> Dict[str, Path]:
+        """Render every report type to its output path; returns the written files.
+        
+        Every report's data is built before anything is written; a report
+        that claims no rows, or whose layout has no section to render them
+        into, raises ``ValueError`` instead of producing a headers-only file.
+        """
+        report_data = {}
+        for report_type, plugin in self.plugins.items():
+            aggregates = self.aggregates[report_type]
+            if not aggregates:
+                raise ValueError(f"No rows of the inputs are claimed by {report_type}")
+            report_data[report_type] = plugin.transform_aggregates(aggregates)
+            layout = plugin.expected_layout(report_data[report_type])
+            if layout is not None and not layout.sections:
+                raise ValueError(f"{report_type} renders no sections from the inputs "
+                                 f"(claimed sections: {', '.join(aggregates)})")
+        
+        written = {}
+        for report_type, plugin in self.plugins.items():
+            output_path = Path(output_paths[report_type])
+            output_path.parent.mkdir(parents=True, exist_ok=True)
+            plugin.generate_from_report_data(report_data[report_type], output_path)
+            written[report_type] = output_path
+            logger.info(f"Session rendered {report_type} report: {output_path}")
+        return written
+    
+    def _route(self, path: Path, data: pd.DataFrame) -> Iterator[Tuple[str, int, str, pd.DataFrame]]:
+        """Yield ``(report_type, pattern index, section, rows)`` for every section claiming some rows."""
+        codes, templates = pd.factorize(data['template_name'])
+        if 'campaign_name' in data.columns:
+            campaign_codes, campaigns = pd.factorize(data['campaign_name'], use_na_sentinel=False)
+        else:
+            campaign_codes, campaigns = np.zeros(len(data), dtype=np.intp), [None]
+        
+        for report_type, plugin in self.plugins.items():
+            claimed = plugin.get_template_names()
+            if claimed:
+                claimed_codes = templates.get_indexer(pd.Index(claimed).unique())
+                template_mask = np.isin(codes, claimed_codes[claimed_codes >= 0])
+            else:
+                template_mask = np.ones(len(data), dtype=bool)
+            if not template_mask.any():
+                continue
+            
+            for code, campaign in enumerate(campaigns):
+                campaign = None if pd.isna(campaign) else str(campaign)
+                target = plugin.input_section(path.name, campaign) if campaign is not None else None
+                if target is None and len(campaigns) == 1:
+                    target = plugin.input_section(path.name)
+                if target is None:
+                    logger.debug(f"{report_type} claims no section for campaign {campaign!r} of {path.name}")
+                    continue
+                mask = template_mask & (campaign_codes == code)
+                if mask.any():
+                    yield (report_type, *target, data[mask])
@@ -0,0 +1,173 @@
+"""Watch mode: regenerate reports as exports land in a directory."""
+
+import fnmatch
+import hashlib
+import time
+from pathlib import Path
+from typing import Dict, Iterable, List, Optional, Tuple
+import logging
+
+from .batch import render_job
+from .domain.models import ReportJob
+from .domain.services import WeeklyAggregate
+from .infrastructure.aggregates.partial import FILE_SUFFIX
+from .infrastructure.csv import TailAggregator
+from .plugins import get_plugin, list_plugins
+from .plugins.base import BaseReportPlugin, ModulePluginLoader, get_plugin_loader
+
+
+logger = logging.getLogger(__name__)
+
+
+class DirectoryWatcher:
+    """Polls a directory for CSV files that were added or changed.
+    
+    Changes are reported once the directory has been quiet for ``debounce``
+    seconds, so a burst of writes (or one slow copy) yields one batch.
+    """
+    
+    def __init__(self, directory: Path, debounce: float = 5.0):
+        """Initialize watcher; files already present count as seen."""
+        self.directory = Path(directory).resolve()
+        self.debounce = debounce
+        self._seen = self.scan()
+        self._pending: Dict[Path, float] = {}
+    
+    def scan(self) -> Dict[Path, Tuple[int, int]]:
+        """Current ``(mtime_ns, size)`` of every CSV file in the directory."""
+        stamps = {}
+        for path in self.directory.iterdir():
+            if path.suffix.lower() == ".csv" and path.is_file():
+                stat = path.stat()
+                stamps[path] = (stat.st_mtime_ns, stat.st_size)
+        return stamps
+    
+    def poll(self, now: Optional[float] = None) -> List[Path]:
+        """Return the files changed in the last burst once it has settled."""
+        now = time.monotonic() if now is None else now
+        snapshot = self.scan()
+        for path, stamp in snapshot.items():
+            if self._seen.get(path) != stamp:
+                self._pending[path] = now
+        for path in list(self._pending):
+            if path not in snapshot:
+                del self._pending[path]
+        self._seen = snapshot
+        
+        if not self._pending or now - max(self._pending.values()) < self.debounce:
+            return []
+        changed = sorted(self._pending)
+        self._pending.clear()
+        return changed
+
+
+class JobRunner:
+    """Routes changed files to the report jobs using them and regenerates those outputs.
+    
+    Every job keeps a ``TailAggregator``, so a rerun only parses rows
+    appended since the job last ran; replaced or rewritten files are re-read.
+    With a ``state_dir`` each job's watermarks are saved there (one file per
+    job and watched directory) and survive restarts.
+    """
+    
+    def __init__(self, directory: Path, jobs: Iterable[ReportJob],
+                 plugin_loader: Optional[ModulePluginLoader] = None,
+                 state_dir: Optional[Path] = None):
+        """Initialize runner for the jobs fed from ``directory``."""
+        self.directory = Path(directory).resolve()
+        self.jobs = list(jobs)
+        self.plugin_loader = plugin_loader or get_plugin_loader()
+        self.state_dir = Path(state_dir) if state_dir else None
+        self._tails: Dict[str, TailAggregator] = {}
+        
+        for job in self.jobs:
+            if get_plugin(job.report_type) is None:
+                raise ValueError(f"Job '{job.name}': report type '{job.report_type}' not found")
+            self.plugin_loader.track(job.report_type)
+    
+    def input_patterns(self, job: ReportJob) -> List[str]:
+        """Filename globs of a job, falling back to its report's conventions."""
+        return job.input_patterns or list(get_plugin(job.report_type).input_patterns)
+    
+    def resolve_inputs(self, job: ReportJob) -> List[Path]:
+        """Newest file in the directory for each of the job's input patterns."""
+        files = [path for path in self.directory.iterdir() if path.is_file()]
+        inputs = []
+        for pattern in self.input_patterns(job):
+            matches = [path for path in files if fnmatch.fnmatch(path.name.lower(), pattern.lower())]
+            if matches:
+                newest = max(matches, key=lambda path: (path.stat().st_mtime_ns, path.name))
+                if newest not in inputs:
+                    inputs.append(newest)
+        return inputs
+    
+    def affected_jobs(self, changed: Iterable[Path]) -> List[ReportJob]:
+        """Jobs whose current inputs include any of the changed files."""
+        changed = {Path(path) for path in changed}
+        return [job for job in self.jobs if changed.intersection(self.resolve_inputs(job))]
+    
+    def run(self, changed: Iterable[Path]) -> List[ReportJob]:
+        """Reload edited plugins and rerun the jobs affected by ``changed``."""
+        reloaded = self.plugin_loader.reload_changed()
+        jobs = self.affected_jobs(changed)
+        jobs += [job for job in self.jobs if job.report_type in reloaded and job not in jobs]
+        return self._run_jobs(jobs)
+    
+    def run_all(self) -> List[ReportJob]:
+        """Run every job against the files currently in the directory."""
+        return self._run_jobs(self.jobs)
+    
+    def run_job(self, job: ReportJob) -> Optional[Path]:
+        """Regenerate (or week-replace) one job's output; returns it, or None if it has no inputs."""
+        plugin: BaseReportPlugin = get_plugin(job.report_type)()
+        inputs = self.resolve_inputs(job)
+        if not inputs:
+            logger.warning(f"Job '{job.name}': no input files match {self.input_patterns(job)}")
+            return None
+        if not plugin.supports_multiple_files:
+            inputs = inputs[:1]
+        
+        aggregates = self._ingest(job, plugin, inputs)
+        output_path = render_job(job, plugin, aggregates)
+        logger.info(f"Job '{job.name}' updated {output_path} from {[path.name for path in inputs]}")
+        return output_path
+    
+    def _ingest(self, job: ReportJob, plugin: BaseReportPlugin, inputs: List[Path]) -> Dict[str, WeeklyAggregate]:
+        """Fold new rows of each input into the job's aggregates."""
+        boundaries = [tuple(boundary) for boundary in plugin.weekly_boundaries]
+        tail = self._tails.get(job.name)
+        if tail is None or tail.boundaries != boundaries:
+            state_path = None
+            if self.state_dir:
+                directory_key = hashlib.sha256(str(self.directory).encode()).hexdigest()[:12]
+                state_path = self.state_dir / f"{job.name}-{directory_key}{FILE_SUFFIX}"
+            tail = self._tails[job.name] = TailAggregator(boundaries, state_path=state_path,
+                                                          report_type=job.report_type)
+        for path in tail.paths():
+            if path not in inputs:
+                tail.forget(path)
+        return {path.name: tail.update(path) for path in inputs}
+    
+    def _run_jobs(self, jobs: List[ReportJob]) -> List[ReportJob]:
+        completed = []
+        for job in jobs:
+            try:
+                if self.run_job(job) is not None:
+                    completed.append(job)
+            except Exception as e:
+                logger.error(f"Job '{job.name}' failed: {e}")
+        return completed
+
+
+def default_jobs(output_dir: Path) -> List[ReportJob]:
+    """One job per report type with filename conventions, writing ``<output_dir>/<type>.xlsx``."""
+    jobs = []
+    for report_type in list_plugins():
+        plugin_class = get_plugin(report_type)
+        if plugin_class is not None and plugin_class.input_patterns:
+            jobs.append(ReportJob(
+                name=report_type,
+                report_type=report_type,
+                output=str(Path(output_dir) / f"{report_type}.xlsx"),
+            ))
+    return jobs
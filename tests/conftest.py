@@ -0,0 +1,130 @@
+"""Shared fixtures: small synthetic campaign exports shaped like the real ones."""
+
+import csv
+import random
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Dict, List
+
+import pytest
+
+
+COLUMNS = ["timestamp", "timestamp_RFC3339", "template_id", "template_name", "campaign_name",
+           "sent", "delivered", "opened", "clicked", "converted", "bounced", "unsubscribed"]
+
+AB_TEMPLATES = ["[S] 10 min sport basic wp", "[S] 1h sport basic wp", "[S] 1d 2 BLOCKS (basic wp + highroller)",
+                "[S] 3d casino 1st dep total wp", "[S] 7d 2 BLOCKS SPORT + CAS", "[S] other template"]
+RET_TEMPLATES = ["Day 3", "Day 4", "Day 6", "Day 8", "Day 10", "Day 99"]
+AWOL_TEMPLATES = ["Day 1", "Day 3", "Day 5", "Day 10", "Day 15", "Other"]
+
+# File name -> (campaign name, templates) of every export
+EXPORTS = {
+    "test_ab_metrics.csv": ("casino+sport A/B Reg_No_Dep", AB_TEMPLATES),
+    "test_ret1_metrics.csv": ("Ret 1 dep [SPORT]", RET_TEMPLATES),
+    "test_ret2_metrics.csv": ("Ret 2 dep [SPORT]", RET_TEMPLATES),
+    "test_inactive7j19-31.csv": ("AWOL inactive7j19-31", AWOL_TEMPLATES),
+    "test_inactive14j12-31.csv": ("AWOL inactive14j12-31", AWOL_TEMPLATES),
+    "test_inactive22j5-31.csv": ("AWOL inactive22j5-31", AWOL_TEMPLATES),
+    "test_inactive31jx-31.csv": ("AWOL inactive31jx-31", AWOL_TEMPLATES),
+}
+
+# Covers the six weeks up to 2026-02-08 of the bundled report calendars, plus rows outside them
+START = datetime(2025, 12, 20, tzinfo=timezone.utc).timestamp()
+END = datetime(2026, 2, 12, tzinfo=timezone.utc).timestamp()
+
+
+def export_rows(campaign: str, templates: List[str], count: int, seed: int) -> List[List]:
+    """Random but reproducible export rows of one campaign."""
+    rng = random.Random(seed)
+    rows = []
+    for _ in range(count):
+        timestamp = int(rng.uniform(START, END))
+        sent = rng.randint(0, 500)
+        delivered = rng.randint(0, sent)
+        opened = rng.randint(0, delivered)
+        clicked = rng.randint(0, opened)
+        template = rng.choice(templates)
+        rows.append([timestamp, datetime.fromtimestamp(timestamp, timezone.utc).isoformat(),
+                     1000 + templates.index(template), template, campaign, sent, delivered, opened, clicked,
+                     rng.randint(0, clicked), sent - delivered, rng.randint(0, 3)])
+    return rows
+
+
+def write_export(path: Path, rows: List[List]) -> Path:
+    with open(path, "w", newline="") as f:
+        writer = csv.writer(f)
+        writer.writerow(COLUMNS)
+        writer.writerows(rows)
+    return path
+
+
+@pytest.fixture(scope="session")
+def exports(tmp_path_factory) -> Dict[str, Path]:
+    """One export per campaign, keyed by file name."""
+    directory = tmp_path_factory.mktemp("exports")
+    return {name: write_export(directory / name, export_rows(campaign, templates, 300, seed))
+            for seed, (name, (campaign, templates)) in enumerate(EXPORTS.items())}
+
+
+@pytest.fixture(scope="session")
+def combined_export(exports, tmp_path_factory) -> Path:
+    """Every campaign's rows in one shuffled export, as the platform's "all campaigns" download."""
+    rows = []
+    for seed, (name, (campaign, templates)) in enumerate(EXPORTS.items()):
+        rows += export_rows(campaign, templates, 300, seed)
+    random.Random(0).shuffle(rows)
+    return write_export(tmp_path_factory.mktemp("combined") / "combined.csv", rows)
+
+
+@pytest.fixture
+def report_inputs(exports) -> Dict[str, List[Path]]:
+    """Input files of each bundled report type, in the order a single run is given them."""
+    return {
+        "a-b-report": [exports["test_ab_metrics.csv"]],
+        "casino-ret": [exports[name] for name in ("test_ret1_metrics.csv", "test_ret2_metrics.csv",
+                                                  "test_ab_metrics.csv")],
+        "awol": [exports[name] for name in ("test_inactive7j19-31.csv", "test_inactive14j12-31.csv",
+                                            "test_inactive22j5-31.csv", "test_inactive31jx-31.csv")],
+    }
+
+
+@pytest.fixture(autouse=True)
+def cache_dir(tmp_path, monkeypatch) -> Path:
+    """Keep on-disk caches of every test in its own directory."""
+    directory = tmp_path / "cache"
+    monkeypatch.setenv("REPORT_AUTOMATION_CACHE_DIR", str(directory))
+    return directory
+
+
+@pytest.fixture
+def registry(monkeypatch):
+    """A fresh global plugin registry, so discovered plugins do not leak into other tests."""
+    from report_automation.plugins.base import registry as registry_module
+    
+    fresh = registry_module.PluginRegistry()
+    monkeypatch.setattr(registry_module, "_registry", fresh)
+    return fresh
+
+
+def sheet_values(path: Path) -> Dict[str, object]:
+    """Non-empty cell values of a workbook's active sheet by coordinate."""
+    from openpyxl import load_workbook
+    
+    wb = load_workbook(path, read_only=True)
+    try:
+        return {cell.coordinate: cell.value for row in wb.active.iter_rows() for cell in row
+                if getattr(cell, "value", None) is not None}
+    finally:
+        wb.close()
+
+
+def serial_output(report_type: str, paths: List[Path], output_path: Path) -> Path:
+    """Workbook of a plain in-process run, without read-ahead."""
+    from report_automation.plugins import get_plugin
+    
+    plugin = get_plugin(report_type)()
+    plugin.read_ahead_files = 0
+    report_data = plugin.transform_aggregates({path.name: plugin.aggregate_data(plugin.read_input(path))
+                                               for path in paths})
+    plugin.generate_from_report_data(report_data, output_path)
+    return output_path
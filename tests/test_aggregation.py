@@ -0,0 +1,85 @@
+"""Serial, sharded and spilled aggregation all produce the same weekly sums."""
+
+import pandas as pd
+import pytest
+
+from conftest import RET_TEMPLATES, export_rows, write_export
+from report_automation.domain.services import WeeklyAggregate
+from report_automation.infrastructure.aggregates import SpillingAggregator
+from report_automation.infrastructure.csv.shared import SharedFrame
+from report_automation.infrastructure.csv.sharded import ShardedCSVReader
+from report_automation.plugins import get_plugin
+
+
+@pytest.fixture(scope="module")
+def large_export(tmp_path_factory):
+    """An export several read chunks long."""
+    path = tmp_path_factory.mktemp("large") / "test_ret1_metrics.csv"
+    return write_export(path, export_rows("Ret 1 dep [SPORT]", RET_TEMPLATES, 5000, 7))
+
+
+def assert_same_sums(actual: WeeklyAggregate, expected: WeeklyAggregate):
+    pd.testing.assert_frame_equal(actual.sums.sort_index(), expected.sums.sort_index(), check_dtype=False)
+
+
+def test_sharded_equals_serial(large_export):
+    plugin = get_plugin("casino-ret")()
+    serial = plugin.aggregate_inputs([large_export])[large_export.name]
+    
+    reader = ShardedCSVReader(workers=3, min_shard_bytes=1)
+    _, shards = reader.plan_shards(large_export)
+    assert len(shards) == 3
+    sharded = reader.aggregate(large_export, plugin.weekly_boundaries)
+    
+    assert_same_sums(sharded, serial)
+    assert sharded.row_count == serial.row_count > 0
+    assert sharded.campaign_name == serial.campaign_name
+
+
+def test_spilled_equals_serial(large_export):
+    plugin = get_plugin("casino-ret")()
+    serial = plugin.aggregate_inputs([large_export])[large_export.name]
+    spilled = plugin.aggregate_inputs([large_export], max_memory=1, chunksize=1000)[large_export.name]
+    assert_same_sums(spilled, serial)
+
+
+def test_spilling_aggregator_spills_and_sums(large_export, tmp_path):
+    plugin = get_plugin("casino-ret")()
+    data = plugin.read_input(large_export)
+    chunks = [WeeklyAggregate.from_frame(data.iloc[i:i + 500], plugin.weekly_boundaries)
+              for i in range(0, len(data), 500)]
+    
+    with SpillingAggregator(max_memory=1, partitions=4, spill_dir=tmp_path) as aggregator:
+        for chunk in chunks:
+            aggregator.add(chunk)
+        result = aggregator.result()
+        assert aggregator.spill_count > 0
+    
+    assert_same_sums(result, WeeklyAggregate.combine(chunks))
+    assert not list(tmp_path.iterdir())
+
+
+@pytest.mark.parametrize("options", [{"workers": 2}, {"max_memory": 1, "chunksize": 1000}])
+def test_report_data_does_not_depend_on_reader(report_inputs, options):
+    plugin = get_plugin("casino-ret")()
+    paths = report_inputs["casino-ret"]
+    serial = plugin.transform_inputs(paths)
+    other = plugin.transform_inputs(paths, **options)
+    
+    assert serial.keys() == other.keys()
+    for section, blocks in serial.items():
+        for block, weeks in blocks.items():
+            for week, frame in weeks.items():
+                pd.testing.assert_frame_equal(other[section][block][week], frame, check_dtype=False)
+
+
+def test_shared_frame_aggregates_like_the_parsed_frame(exports):
+    plugin = get_plugin("casino-ret")()
+    data = plugin.read_input(exports["test_ret1_metrics.csv"])
+    expected = plugin.aggregate_data(data)
+    
+    with SharedFrame.create(data) as shared:
+        frame = shared.frame
+        assert isinstance(frame["template_name"].dtype, pd.CategoricalDtype)
+        frame["template_name"] = frame["template_name"].cat.add_categories(["unused"])
+        pd.testing.assert_frame_equal(plugin.aggregate_data(frame).sums, expected.sums)
@@ -0,0 +1,172 @@
+"""Batch runs and read-ahead parsing against plain serial runs."""
+
+import shutil
+import threading
+from pathlib import Path
+
+import pytest
+import yaml
+from click.testing import CliRunner
+
+from conftest import serial_output, sheet_values
+from report_automation.batch import BatchRunner
+from report_automation.cli.main import cli
+from report_automation.domain.models import ReportJob
+from report_automation.infrastructure.cache import ResultCache
+from report_automation.infrastructure.csv import read_ahead
+
+
+def batch_jobs(report_inputs, directory: Path):
+    return [ReportJob(name=report_type, report_type=report_type, output=str(directory / f"{report_type}.xlsx"),
+                      inputs=[str(path) for path in paths])
+            for report_type, paths in report_inputs.items()]
+
+
+def test_read_ahead_yields_files_in_order(tmp_path):
+    paths = [tmp_path / f"{i}.csv" for i in range(5)]
+    threads = set()
+    
+    def read(path):
+        threads.add(threading.current_thread().name)
+        return path.stem
+    
+    assert list(read_ahead(paths, read, depth=2)) == [(path, path.stem) for path in paths]
+    assert threads == {"report-read-ahead"}
+
+
+def test_read_ahead_raises_at_failing_file(tmp_path):
+    paths = [tmp_path / f"{i}.csv" for i in range(4)]
+    
+    def read(path):
+        if path.stem == "2":
+            raise OSError(f"cannot read {path.name}")
+        return path.stem
+    
+    seen = []
+    with pytest.raises(OSError, match="cannot read 2.csv"):
+        for _, data in read_ahead(paths, read):
+            seen.append(data)
+    assert seen == ["0", "1"]
+
+
+@pytest.mark.parametrize("workers", [1, 3])
+def test_batch_matches_serial(report_inputs, tmp_path, workers):
+    jobs = batch_jobs(report_inputs, tmp_path / "batch")
+    errors = BatchRunner(jobs, workers=workers).run()
+    assert errors == {job.name: None for job in jobs}
+    
+    for job in jobs:
+        serial = serial_output(job.report_type, report_inputs[job.report_type], tmp_path / f"{job.name}.xlsx")
+        assert sheet_values(Path(job.output)) == sheet_values(serial)
+
+
+def test_batch_cache_hit_restores_outputs(report_inputs, tmp_path, monkeypatch):
+    cache = ResultCache(tmp_path / "results")
+    jobs = batch_jobs(report_inputs, tmp_path / "batch")
+    assert BatchRunner(jobs, workers=1, cache=cache).run() == {job.name: None for job in jobs}
+    expected = {job.name: sheet_values(Path(job.output)) for job in jobs}
+    for job in jobs:
+        Path(job.output).unlink()
+    
+    def no_parsing(*args):
+        raise AssertionError("cached jobs must not parse their inputs")
+    
+    monkeypatch.setattr(BatchRunner, "_share_inputs", no_parsing)
+    runner = BatchRunner(jobs, workers=1, cache=cache)
+    assert runner.run() == {job.name: None for job in jobs}
+    assert sorted(runner.cached) == sorted(job.name for job in jobs)
+    assert {job.name: sheet_values(Path(job.output)) for job in jobs} == expected
+
+
+def test_batch_recomputes_changed_inputs_and_forced_runs(exports, tmp_path):
+    cache = ResultCache(tmp_path / "results")
+    export = str(shutil.copy(exports["test_ab_metrics.csv"], tmp_path / "test_ab_metrics.csv"))
+    jobs = [ReportJob(name="ab", report_type="a-b-report", output=str(tmp_path / "ab.xlsx"), inputs=[export])]
+    BatchRunner(jobs, cache=cache).run()
+    
+    runner = BatchRunner(jobs, cache=cache, force=True)
+    runner.run()
+    assert runner.cached == []
+    
+    with open(export) as f:
+        lines = f.readlines()
+    with open(export, "w") as f:
+        f.writelines(lines[:-1])
+    runner = BatchRunner(jobs, cache=cache)
+    runner.run()
+    assert runner.cached == []
+
+
+def test_result_cache_evicts_least_recently_used(tmp_path):
+    cache = ResultCache(tmp_path / "results", max_bytes=250)
+    output = tmp_path / "out.xlsx"
+    for key in ("a", "b", "c"):
+        output.write_bytes(key.encode() * 100)
+        cache.store(key, {"output": output})
+    
+    assert not cache.restore("a", {"output": output})
+    assert cache.restore("c", {"output": output})
+    assert output.read_bytes() == b"c" * 100
+
+
+def test_generate_restores_cached_report(report_inputs, tmp_path):
+    inputs = ",".join(str(path) for path in report_inputs["casino-ret"])
+    output = tmp_path / "casino.xlsx"
+    args = ["generate", inputs, str(output), "-t", "casino-ret", "--cache-dir", str(tmp_path / "cache")]
+    
+    first = CliRunner().invoke(cli, args)
+    assert first.exit_code == 0, first.output
+    assert "(cached)" not in first.output
+    expected = sheet_values(output)
+    output.unlink()
+    
+    second = CliRunner().invoke(cli, args)
+    assert second.exit_code == 0, second.output
+    assert "(cached)" in second.output
+    assert sheet_values(output) == expected
+
+
+def write_jobs(path: Path, jobs, **settings) -> Path:
+    path.write_text(yaml.safe_dump({"jobs": [job.model_dump(exclude_defaults=True) for job in jobs], **settings}))
+    return path
+
+
+def test_cli_batch_runs_and_caches_jobs(report_inputs, tmp_path):
+    jobs = batch_jobs(report_inputs, tmp_path / "batch")
+    jobs_file = write_jobs(tmp_path / "jobs.yaml", jobs, workers=2)
+    
+    result = CliRunner().invoke(cli, ["batch", str(jobs_file), "--cache-dir", str(tmp_path / "cache")])
+    assert result.exit_code == 0, result.output
+    for job in jobs:
+        assert f"✅ {job.name}: {job.output}\n" in result.output
+    
+    result = CliRunner().invoke(cli, ["batch", str(jobs_file), "--cache-dir", str(tmp_path / "cache"),
+                                      "--no-validate"])
+    assert result.exit_code == 0, result.output
+    assert all(f"✅ {job.name}: {job.output} (cached)" in result.output for job in jobs)
+
+
+def test_cli_batch_reports_failed_jobs(report_inputs, tmp_path):
+    jobs = batch_jobs(report_inputs, tmp_path / "batch")
+    (tmp_path / "master.xlsx").write_text("not a workbook")
+    jobs[2] = jobs[2].model_copy(update={"existing_excel": str(tmp_path / "master.xlsx"), "replace_weeks": ["05"]})
+    result = CliRunner().invoke(cli, ["batch", str(write_jobs(tmp_path / "jobs.yaml", jobs))])
+    
+    assert result.exit_code == 1
+    assert f"✅ {jobs[0].name}: {jobs[0].output}" in result.output
+    assert f"❌ {jobs[2].name}: " in result.output
+    
+    missing = ReportJob(name="missing", report_type="awol", output=str(tmp_path / "awol.xlsx"),
+                        inputs=[str(tmp_path / "missing.csv")])
+    result = CliRunner().invoke(cli, ["batch", str(write_jobs(tmp_path / "jobs.yaml", [missing]))])
+    assert f"❌ Error: Job 'missing': input not found: {tmp_path / 'missing.csv'}" in result.output
+
+
+def test_cli_batch_rejects_empty_and_invalid_job_files(tmp_path):
+    (tmp_path / "empty.yaml").write_text("jobs: []\n")
+    assert "❌ No report jobs to run" in CliRunner().invoke(cli, ["batch", str(tmp_path / "empty.yaml")]).output
+    
+    (tmp_path / "invalid.yaml").write_text("jobs:\n  - name: ab\n    report_type: a-b-report\n    output: ab.xlsx\n")
+    result = CliRunner().invoke(cli, ["batch", str(tmp_path / "invalid.yaml")])
+    assert result.exit_code == 1
+    assert "Job 'ab' has no inputs" in result.output
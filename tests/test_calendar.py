@@ -0,0 +1,78 @@
+"""Week calendars against the week tables the plugins used to hard-code."""
+
+from datetime import date, timedelta
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from report_automation.domain.models import CalendarRule
+from report_automation.domain.services import WeekCalendar
+from report_automation.infrastructure.config import loader
+from report_automation.plugins import get_plugin
+
+
+# Week boundaries the casino-ret and awol plugins shipped with; a-b-report used the first five
+HARD_CODED_WEEKS = [
+    ("2025-12-29", "2026-01-04"),
+    ("2026-01-05", "2026-01-11"),
+    ("2026-01-12", "2026-01-18"),
+    ("2026-01-19", "2026-01-25"),
+    ("2026-01-26", "2026-02-01"),
+    ("2026-02-02", "2026-02-08"),
+]
+
+
+def range_scan_week(timestamp: pd.Timestamp, boundaries) -> int:
+    """Week number the way the plugins used to find it: the first range holding the timestamp."""
+    for week, (start, end) in enumerate(boundaries, 1):
+        if pd.Timestamp(start) <= timestamp <= pd.Timestamp(end + " 23:59:59"):
+            return week
+    return 0
+
+
+@pytest.mark.parametrize("report_type, weeks", [("casino-ret", 6), ("awol", 6), ("a-b-report", 5)])
+def test_spec_weeks_match_hard_coded_boundaries(report_type, weeks):
+    assert get_plugin(report_type)().weekly_boundaries == HARD_CODED_WEEKS[:weeks]
+
+
+def test_week_index_matches_range_scan():
+    calendar = WeekCalendar.rolling(date(2026, 2, 8), 6)
+    assert calendar.boundaries == HARD_CODED_WEEKS
+    
+    timestamps = [pd.Timestamp("2025-12-28 23:59:59"), pd.Timestamp("2026-02-09 00:00:00")]
+    for start, end in HARD_CODED_WEEKS:
+        timestamps += [pd.Timestamp(start), pd.Timestamp(end + " 12:00"), pd.Timestamp(end + " 23:59:59")]
+    rng = np.random.default_rng(0)
+    timestamps += list(pd.Timestamp("2025-12-20") + pd.to_timedelta(rng.integers(0, 60 * 86400, 500), unit="s"))
+    
+    expected = [range_scan_week(ts, HARD_CODED_WEEKS) for ts in timestamps]
+    assert calendar.week_index(pd.DatetimeIndex(timestamps)).tolist() == expected
+
+
+def test_week_index_ignores_missing_timestamps():
+    calendar = WeekCalendar.rolling(date(2026, 2, 8), 6)
+    index = calendar.week_index(pd.DatetimeIndex([pd.NaT, pd.Timestamp("2026-01-05")]))
+    assert index.tolist() == [0, 2]
+
+
+def test_plugin_follows_refreshed_relative_calendar(monkeypatch):
+    class Today(date):
+        current = date(2026, 2, 8)
+        
+        @classmethod
+        def today(cls):
+            return cls.current
+    
+    monkeypatch.setattr(loader, "date", Today)
+    plugin = get_plugin("casino-ret")()
+    rule = CalendarRule(rule="rolling", end="today", weeks=6)
+    spec = loader.CompiledReportSpec(plugin.spec.spec.model_copy(update={"calendar": rule}), "relative")
+    monkeypatch.setattr(plugin, "spec", spec, raising=False)
+    assert plugin.weekly_boundaries == HARD_CODED_WEEKS
+    assert plugin.week_labels[0] == "29.12"
+    
+    Today.current = date(2026, 2, 8) + timedelta(weeks=1)
+    assert plugin.weekly_boundaries == HARD_CODED_WEEKS[1:] + [("2026-02-09", "2026-02-15")]
+    assert plugin.week_labels[-1] == "09.02"
+    assert plugin.skeleton().cells["J1"] == "Week 01\n05.01"
@@ -0,0 +1,86 @@
+"""Columnar CampaignBatch against the per-row CampaignData models."""
+
+import pandas as pd
+import pytest
+
+from conftest import COLUMNS, AB_TEMPLATES, export_rows, write_export
+from report_automation.domain.models import CampaignBatch
+from report_automation.infrastructure.csv.processor import CSVProcessor
+
+
+@pytest.fixture
+def export_with_invalid_rows(tmp_path):
+    """An export whose second row opens more mails than were delivered."""
+    rows = export_rows("casino+sport A/B Reg_No_Dep", AB_TEMPLATES, 20, 3)
+    rows[1][COLUMNS.index("opened")] = rows[1][COLUMNS.index("delivered")] + 1
+    return write_export(tmp_path / "ab.csv", rows)
+
+
+def test_batch_matches_row_models(export_with_invalid_rows):
+    processor = CSVProcessor()
+    records = processor.read_csv(export_with_invalid_rows)
+    batch = processor.read_batch(export_with_invalid_rows)
+    
+    assert len(batch) == len(records) == 19
+    assert batch.to_records() == records
+    assert list(batch) == records
+    assert CampaignBatch.from_records(records).frame.equals(batch.frame)
+    assert processor.validate_data(batch) == processor.validate_data(records)
+
+
+def test_invalid_rows_are_named(export_with_invalid_rows):
+    frame = pd.read_csv(export_with_invalid_rows)
+    batch = CampaignBatch.from_frame(frame, drop_invalid=True)
+    assert len(batch) == len(frame) - 1
+    
+    with pytest.raises(ValueError, match="opened cannot be greater than delivered in 1 rows \\(first row 1\\)"):
+        CampaignBatch.from_frame(frame)
+    with pytest.raises(ValueError, match="sent must be >= 0"):
+        CampaignBatch.from_frame(frame.assign(sent=-1, delivered=0, opened=0))
+    with pytest.raises(ValueError, match="Missing batch columns: \\['sent'\\]"):
+        CampaignBatch(frame.drop(columns=["sent"]))
+    with pytest.raises(ValueError, match="clicked contains missing values"):
+        CampaignBatch(frame.assign(clicked=None), validate=False)
+
+
+def test_take_concat_and_columns(exports):
+    batch = CSVProcessor().read_batch(exports["test_ab_metrics.csv"])
+    first, rest = batch.take(range(100)), batch.take(range(100, len(batch)))
+    combined = CampaignBatch.concat([first, rest])
+    
+    assert combined.frame.equals(batch.frame)
+    assert len(CampaignBatch.concat([])) == 0
+    assert (batch.column("sent") >= batch.column("delivered")).all()
+    assert batch.nbytes > 0
+    assert repr(first) == "CampaignBatch(rows=100)"
+    with pytest.raises(KeyError, match="Unknown batch column"):
+        batch.column("revenue")
+
+
+def test_processor_summaries_accept_batches(exports):
+    processor = CSVProcessor()
+    records = processor.read_csv(exports["test_ret1_metrics.csv"])
+    batch = processor.read_batch(exports["test_ret1_metrics.csv"])
+    
+    assert processor.get_date_range(batch) == processor.get_date_range(records)
+    assert processor.get_template_summary(batch) == processor.get_template_summary(records)
+    assert processor.get_date_range(batch.take([])) == (None, None)
+    assert not processor.validate_data(batch.take([]))
+    
+    clicked_more = batch.frame.assign(clicked=batch.frame["opened"] + 1)
+    assert not processor.validate_data(CampaignBatch(clicked_more, validate=False))
+
+
+def test_read_batch_rejects_unusable_exports(tmp_path):
+    processor = CSVProcessor()
+    with pytest.raises(FileNotFoundError, match="CSV file not found"):
+        processor.read_batch(tmp_path / "missing.csv")
+    
+    path = write_export(tmp_path / "ab.csv", export_rows("casino+sport A/B Reg_No_Dep", AB_TEMPLATES, 5, 4))
+    frame = pd.read_csv(path)
+    frame.drop(columns=["sent"]).to_csv(tmp_path / "no_sent.csv", index=False)
+    with pytest.raises(ValueError, match="Missing required columns: \\['sent'\\]"):
+        processor.read_batch(tmp_path / "no_sent.csv")
+    frame.assign(timestamp="yesterday").to_csv(tmp_path / "bad_time.csv", index=False)
+    with pytest.raises(ValueError, match="Invalid timestamp format"):
+        processor.read_batch(tmp_path / "bad_time.csv")
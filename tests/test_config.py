@@ -0,0 +1,118 @@
+"""Compiled report specs: YAML loading and the memory and disk caches."""
+
+import shutil
+
+import pytest
+import yaml
+
+from report_automation.config import REPORTS_DIR
+from report_automation.infrastructure.config import YAMLConfigLoader
+
+
+@pytest.fixture
+def config_dir(tmp_path):
+    """An editable copy of the packaged report specs."""
+    directory = tmp_path / "reports"
+    shutil.copytree(REPORTS_DIR, directory)
+    return directory
+
+
+def write_spec(config_dir, name, **changes):
+    """A copy of the awol spec under another name, with top-level keys replaced (None removes)."""
+    spec = yaml.safe_load((config_dir / "awol.yaml").read_text())
+    spec.update(name=name, **changes)
+    (config_dir / f"{name}.yml").write_text(yaml.safe_dump({k: v for k, v in spec.items() if v is not None}))
+
+
+def test_disk_cache_skips_yaml_parsing(config_dir, tmp_path, monkeypatch):
+    compiled = YAMLConfigLoader(config_dir, cache_dir=tmp_path).load_compiled("awol")
+    assert len(list((tmp_path / "config").glob("awol-*.pickle"))) == 1
+    
+    def fail(*args, **kwargs):
+        raise AssertionError("YAML parsed despite a cached compiled spec")
+    
+    monkeypatch.setattr(yaml, "safe_load", fail)
+    cached = YAMLConfigLoader(config_dir, cache_dir=tmp_path).load_compiled("awol")
+    assert cached is not compiled
+    assert cached.weekly_boundaries == compiled.weekly_boundaries
+    assert cached.week_mappings == compiled.week_mappings
+
+
+def test_memory_cache_follows_file_edits(config_dir, tmp_path):
+    loader = YAMLConfigLoader(config_dir, cache_dir=tmp_path)
+    compiled = loader.load_compiled("awol")
+    assert loader.load_compiled("awol") is compiled
+    
+    path = config_dir / "awol.yaml"
+    path.write_text(path.read_text().replace('end: "2026-02-08"', 'end: "2026-02-15"'))
+    edited = loader.load_compiled("awol")
+    assert edited.source_hash != compiled.source_hash
+    assert edited.weekly_boundaries[-1] == ("2026-02-09", "2026-02-15")
+    
+    loader.clear_cache()
+    assert loader.load_compiled("awol").weekly_boundaries == edited.weekly_boundaries
+
+
+def test_unreadable_or_disabled_disk_cache(config_dir, tmp_path):
+    expected = YAMLConfigLoader(config_dir, cache_dir=tmp_path).load_compiled("awol").weekly_boundaries
+    for path in (tmp_path / "config").glob("*.pickle"):
+        path.write_bytes(b"not a pickle")
+    assert YAMLConfigLoader(config_dir, cache_dir=tmp_path).load_compiled("awol").weekly_boundaries == expected
+    
+    uncached = YAMLConfigLoader(config_dir, cache_dir=tmp_path / "uncached", use_disk_cache=False)
+    assert uncached.load_compiled("awol").weekly_boundaries == expected
+    assert not (tmp_path / "uncached").exists()
+
+
+def test_explicit_weekly_boundaries(config_dir, tmp_path):
+    boundaries = [
+        {"week_number": 2, "start_date": "2026-01-12", "end_date": "2026-01-18", "label": "12.01"},
+        {"week_number": 1, "start_date": "2026-01-05", "end_date": "2026-01-11", "label": "05.01"},
+    ]
+    write_spec(config_dir, "manual", calendar=None, weekly_boundaries=boundaries,
+               column_mappings=[{"metric": "sent", "column_letter": "E"}])
+    loader = YAMLConfigLoader(config_dir, cache_dir=tmp_path)
+    compiled = loader.load_compiled("manual")
+    
+    assert "manual" in loader.get_available_reports()
+    assert compiled.weekly_boundaries == [("2026-01-05", "2026-01-11"), ("2026-01-12", "2026-01-18")]
+    assert compiled.week_labels == ["05.01", "12.01"]
+    assert compiled.week_columns == {"week1": "K", "week2": "J"}
+    assert compiled.column("sent") == "E" and compiled.column("opened") is None
+    assert list(compiled.week_index(["2026-01-04", "2026-01-11 23:59:59", "2026-01-12", "2026-01-19"])) == [0, 1, 2, 0]
+
+
+def test_invalid_specs_are_rejected(config_dir, tmp_path):
+    loader = YAMLConfigLoader(config_dir, cache_dir=tmp_path)
+    
+    with pytest.raises(FileNotFoundError, match="No configuration for report type 'nope'"):
+        loader.load_compiled("nope")
+    assert loader.validate_config(loader.load_from_file(config_dir / "awol.yaml"))
+    assert not loader.validate_config({"name": "incomplete"})
+    
+    (config_dir / "list.yaml").write_text("- awol\n")
+    with pytest.raises(ValueError, match="Configuration root must be a mapping"):
+        loader.load_from_file(config_dir / "list.yaml")
+    
+    write_spec(config_dir, "narrow", week_columns={"first": "C", "step": -1})
+    with pytest.raises(ValueError, match="Week 4 column rule starting at C runs past column A"):
+        loader.load_compiled("narrow")
+
+
+@pytest.mark.parametrize("changes, message", [
+    ({"time_periods": ["1w"]}, "Invalid time period format: 1w"),
+    ({"calendar": {"rule": "monthly", "weeks": 4}}, "rule must be one of"),
+    ({"calendar": {"rule": "rolling", "weeks": 4}}, "rolling calendar requires 'end'"),
+    ({"calendar": {"rule": "custom", "weeks": 4}}, "custom calendar requires 'start'"),
+    ({"calendar": {"rule": "iso", "weeks": 4}}, "iso calendar requires 'year'"),
+    ({"calendar": {"rule": "rolling", "end": "today", "weeks": 4, "week_start": "someday"}}, "week_start must be"),
+    ({"week_columns": {"first": "k"}}, "Column letter must be uppercase alphabetic"),
+    ({"column_mappings": [{"metric": "sent", "column_letter": "E1"}]}, "Column letter must be uppercase alphabetic"),
+    ({"calendar": None, "weekly_boundaries": [{"week_number": 1, "start_date": "05.01.2026",
+                                               "end_date": "2026-01-11", "label": "05.01"}]},
+     "Date must be in YYYY-MM-DD format"),
+])
+def test_invalid_spec_fields(config_dir, tmp_path, changes, message):
+    write_spec(config_dir, "invalid", **changes)
+    with pytest.raises(ValueError, match=message):
+        YAMLConfigLoader(config_dir, cache_dir=tmp_path).load_compiled("invalid")
@@ -0,0 +1,91 @@
+"""Workbook diff: changed, unchanged and missed cells per campaign/template block."""
+
+import json
+
+import pytest
+from click.testing import CliRunner
+from openpyxl import Workbook
+
+from report_automation.cli.main import cli
+from report_automation.infrastructure.excel.diff import WorkbookDiffer
+
+
+# Rows of (campaign, template, metric, week value); campaign and template carry down
+OLD_ROWS = [
+    ("camp a", "T1", "Sent", 10),
+    (None, None, "Opened", 5),
+    (None, "T2", "Sent", 7),
+    (None, None, "Opened", None),
+    ("camp b", None, "Sent", 1),
+]
+NEW_VALUES = [11, 5, None, None, 1]
+
+
+def write_sheet(path, values):
+    wb = Workbook()
+    ws = wb.active
+    ws.title = "awol"
+    for row, ((campaign, template, metric, _), value) in enumerate(zip(OLD_ROWS, values), start=2):
+        ws.cell(row, 2, campaign)
+        ws.cell(row, 4, template)
+        ws.cell(row, 5, metric)
+        ws.cell(row, 6, value)
+    wb.save(path)
+    return path
+
+
+@pytest.fixture
+def workbooks(tmp_path):
+    old = write_sheet(tmp_path / "old.xlsx", [value for *_, value in OLD_ROWS])
+    new = write_sheet(tmp_path / "new.xlsx", NEW_VALUES)
+    return old, new
+
+
+def block_counts(result):
+    return {block.name: (block.changed, block.unchanged, block.missed) for block in result.blocks}
+
+
+def test_changed_unchanged_and_emptied_cells(workbooks):
+    result = WorkbookDiffer(columns="F").diff(*workbooks)
+    
+    assert (result.cells, result.changed, result.unchanged, result.missed) == (4, 1, 2, 1)
+    assert block_counts(result) == {"camp a / T1": (1, 1, 0), "camp a / T2": (0, 0, 1), "camp b": (0, 1, 0)}
+    assert [(cell.coordinate, cell.status) for cell in result.samples] == [("F2", "changed"), ("F4", "missed")]
+    assert not result.is_clean
+
+
+def test_label_column_compares_empty_data_cells(workbooks):
+    result = WorkbookDiffer(columns="F", label_column="E").diff(*workbooks)
+    assert block_counts(result)["camp a / T2"] == (0, 1, 1)
+    assert result.cells == 5
+
+
+def test_expect_change_misses_unchanged_cells(workbooks):
+    result = WorkbookDiffer(columns="F", label_column="E", expect_change=True).diff(*workbooks)
+    
+    assert block_counts(result) == {"camp a / T1": (1, 0, 1), "camp a / T2": (0, 0, 2), "camp b": (0, 0, 1)}
+    assert not result.is_clean
+
+
+def test_identical_workbooks_are_clean(workbooks):
+    old, _ = workbooks
+    result = WorkbookDiffer(rows=(2, 3)).diff(old, old)
+    assert result.is_clean
+    assert result.changed == result.missed == 0
+    assert [block.last_row for block in result.blocks] == [3]
+
+
+def test_unknown_sheet_is_rejected(workbooks):
+    with pytest.raises(ValueError, match="Sheet 'casino' not found in old workbook"):
+        WorkbookDiffer().diff(*workbooks, sheets=["casino"])
+
+
+def test_cli_reports_missed_blocks(workbooks, tmp_path):
+    json_path = tmp_path / "diff.json"
+    result = CliRunner().invoke(cli, ["diff", *map(str, workbooks), "--columns", "F", "--json", str(json_path)])
+    
+    assert result.exit_code == 0, result.output
+    assert "Changed: 1  Unchanged: 2  Missed: 1" in result.output
+    assert "camp a / T2: 0 changed, 0 unchanged, 1 missed" in result.output
+    assert "❌ Missed cells found" in result.output
+    assert json.loads(json_path.read_text())["missed"] == 1
@@ -0,0 +1,90 @@
+"""Lazy plugin discovery from built-ins, plugin directories and the plugin path."""
+
+import sys
+
+import pytest
+from click.testing import CliRunner
+
+from report_automation.cli.main import cli
+from report_automation.plugins.base.discovery import PluginSpec, builtin_specs, scan_plugin_directory
+from report_automation.plugins.base.registry import PLUGIN_PATH_ENV
+
+
+PLUGIN_SOURCE = '''
+from report_automation.plugins.base import register_plugin
+from report_automation.plugins.implementations.ab_report import ABReportPlugin
+
+
+@register_plugin
+class EchoPlugin(ABReportPlugin):
+    name = "echo-ab"
+
+
+class Helper:
+    name = "not-a-plugin"
+'''
+
+
+@pytest.fixture
+def plugin_dir(tmp_path):
+    directory = tmp_path / "plugins"
+    directory.mkdir()
+    (directory / "echo.py").write_text(PLUGIN_SOURCE)
+    (directory / "_private.py").write_text(PLUGIN_SOURCE.replace("echo-ab", "private-ab"))
+    (directory / "broken.py").write_text("class Broken(:\n")
+    yield directory
+    sys.modules.pop("report_automation_plugins.echo", None)
+
+
+def test_scan_finds_plugins_without_importing(plugin_dir):
+    specs = scan_plugin_directory(plugin_dir)
+    
+    assert [(spec.name, spec.target, spec.source) for spec in specs] == [
+        ("echo-ab", "report_automation_plugins.echo:EchoPlugin", "directory")]
+    assert specs[0].path == plugin_dir / "echo.py"
+    assert "report_automation_plugins.echo" not in sys.modules
+    assert scan_plugin_directory(plugin_dir / "missing") == []
+
+
+def test_registry_imports_on_first_use(plugin_dir, registry):
+    registry.discover_plugins(plugin_dir)
+    assert registry.list_plugins() == ["a-b-report", "casino-ret", "awol", "echo-ab"]
+    assert "report_automation_plugins.echo" not in sys.modules
+    
+    plugin_class = registry.get("echo-ab")
+    assert plugin_class.__name__ == "EchoPlugin"
+    assert registry.get("echo-ab") is plugin_class
+    assert registry.get("missing") is None
+
+
+def test_plugin_path_environment(plugin_dir, registry, monkeypatch):
+    monkeypatch.setenv(PLUGIN_PATH_ENV, str(plugin_dir))
+    assert registry.has_plugin("echo-ab")
+    assert registry.get_spec("echo-ab").path == plugin_dir / "echo.py"
+
+
+def test_later_specs_override_earlier_ones(registry):
+    ab_target = builtin_specs()[0].target
+    registry.register_spec(PluginSpec("custom", ab_target, "builtin"))
+    assert registry.get("custom").name == "a-b-report"
+    
+    awol_target = ab_target.replace("ab_report:ABReportPlugin", "awol:AWOLPlugin")
+    registry.register_spec(PluginSpec("custom", awol_target, "entry_point"))
+    assert registry.get("custom").name == "awol"
+
+
+def test_bad_targets_are_rejected(registry):
+    registry.register_spec(PluginSpec("missing-class", "report_automation.plugins:Nope", "entry_point"))
+    registry.register_spec(PluginSpec("not-a-plugin", "report_automation.plugins.base:PluginRegistry", "entry_point"))
+    
+    with pytest.raises(ImportError, match="has no plugin class Nope"):
+        registry.get("missing-class")
+    with pytest.raises(TypeError, match="is not a BaseReportPlugin"):
+        registry.get("not-a-plugin")
+
+
+def test_cli_lists_plugin_dir_reports(plugin_dir, registry):
+    result = CliRunner().invoke(cli, ["--plugin-dir", str(plugin_dir), "list-reports"])
+    assert result.exit_code == 0, result.output
+    assert "  • echo-ab" in result.output
+    assert "  • a-b-report" in result.output
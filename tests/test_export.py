@@ -0,0 +1,73 @@
+"""Tests for tidy exports of report results."""
+
+import importlib.util
+
+import pandas as pd
+import pytest
+from click.testing import CliRunner
+
+from report_automation.cli.main import cli
+from report_automation.infrastructure.export import TIDY_COLUMNS, check_export_format, write_tidy
+from report_automation.session import ReportSession
+
+
+def test_session_export_matches_plugin_tidy_rows(report_inputs, tmp_path):
+    with ReportSession("casino-ret", report_inputs["casino-ret"]) as session:
+        path = session.export("csv", tmp_path / "report.csv")
+        expected = session.plugin.tidy_report_data(session.report_data)
+    
+    exported = pd.read_csv(path)
+    assert list(exported.columns) == TIDY_COLUMNS
+    assert set(exported["report"]) == {"casino-ret"}
+    assert set(exported["section"]) == {p.name for p in report_inputs["casino-ret"]}
+    assert len(exported) == len(expected)
+    assert exported["value"].sum() == pytest.approx(expected["value"].sum())
+
+
+def test_single_section_report_has_empty_section(report_inputs, tmp_path):
+    with ReportSession("a-b-report", report_inputs["a-b-report"]) as session:
+        path = session.export("jsonl", tmp_path / "report.jsonl")
+    
+    exported = pd.read_json(path, lines=True)
+    assert list(exported.columns) == TIDY_COLUMNS
+    assert exported["section"].isna().all()
+    assert {"sent", "delivered", "pct_delivered"} <= set(exported["metric"])
+    assert exported["value"].dtype == float
+
+
+def test_unknown_format_is_rejected(tmp_path):
+    with pytest.raises(ValueError, match="Unknown export format"):
+        write_tidy(pd.DataFrame(columns=TIDY_COLUMNS), tmp_path / "report.json", "json")
+
+
+@pytest.mark.skipif(importlib.util.find_spec("pyarrow") is not None, reason="pyarrow is installed")
+def test_arrow_formats_need_pyarrow():
+    with pytest.raises(ImportError, match="pyarrow"):
+        check_export_format("parquet")
+
+
+def test_cli_writes_tidy_rows(report_inputs, tmp_path):
+    inputs = ",".join(str(path) for path in report_inputs["awol"])
+    result = CliRunner().invoke(cli, ["generate", inputs, str(tmp_path / "awol.csv"), "-t", "awol", "--format", "csv"])
+    assert result.exit_code == 0, result.output
+    assert not (tmp_path / "awol.xlsx").exists()
+    tidy = pd.read_csv(tmp_path / "awol.csv")
+    assert list(tidy.columns) == TIDY_COLUMNS
+    
+    result = CliRunner().invoke(cli, ["generate", inputs, str(tmp_path / "awol.xlsx"), "-t", "awol",
+                                      "--also-export", "csv", "--also-export", "jsonl"])
+    assert result.exit_code == 0, result.output
+    assert f"✅ Exported jsonl: {tmp_path / 'awol.jsonl'}" in result.output
+    assert (tmp_path / "awol.xlsx").exists()
+    assert pd.read_csv(tmp_path / "awol.csv").equals(tidy)
+    assert len(pd.read_json(tmp_path / "awol.jsonl", lines=True)) == len(tidy)
+
+
+def test_cli_tidy_formats_cannot_replace_weeks(report_inputs, tmp_path):
+    master = tmp_path / "master.xlsx"
+    master.write_bytes(b"")
+    result = CliRunner().invoke(cli, ["generate", str(report_inputs["awol"][0]), str(tmp_path / "awol.csv"),
+                                      "-t", "awol", "--format", "csv", "--existing-excel", str(master),
+                                      "--replace-week", "05"])
+    assert "❌ --existing-excel and --replace-week need --format xlsx" in result.output
+    assert not (tmp_path / "awol.csv").exists()
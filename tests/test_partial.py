@@ -0,0 +1,117 @@
+"""Partial-aggregate files: save/load round trip and merging halves of an export."""
+
+import json
+
+import numpy as np
+import pandas as pd
+import pytest
+from click.testing import CliRunner
+
+from conftest import EXPORTS, export_rows, sheet_values, write_export
+from report_automation.cli.main import cli
+from report_automation.infrastructure.aggregates import (PartialAggregate, merge_partials, read_partial,
+                                                          write_partial)
+from report_automation.plugins import get_plugin
+
+
+@pytest.fixture
+def split_exports(tmp_path):
+    """casino-ret inputs cut in two halves of rows, each half under the original file names."""
+    halves = {"first": tmp_path / "first", "second": tmp_path / "second", "whole": tmp_path / "whole"}
+    for directory in halves.values():
+        directory.mkdir()
+    for seed, (name, (campaign, templates)) in enumerate(EXPORTS.items()):
+        if name not in ("test_ret1_metrics.csv", "test_ret2_metrics.csv"):
+            continue
+        rows = export_rows(campaign, templates, 300, seed)
+        write_export(halves["first"] / name, rows[:120])
+        write_export(halves["second"] / name, rows[120:])
+        write_export(halves["whole"] / name, rows)
+    return {key: sorted(directory.iterdir()) for key, directory in halves.items()}
+
+
+def assert_same_sections(actual: PartialAggregate, expected: PartialAggregate):
+    assert list(actual.sections) == list(expected.sections)
+    for name, aggregate in expected.sections.items():
+        pd.testing.assert_frame_equal(actual.sections[name].sums.sort_index(), aggregate.sums.sort_index(),
+                                      check_dtype=False)
+        assert actual.sections[name].campaign_name == aggregate.campaign_name
+
+
+def test_round_trip(report_inputs, tmp_path):
+    plugin = get_plugin("casino-ret")()
+    partial = PartialAggregate("casino-ret", plugin.weekly_boundaries,
+                               plugin.aggregate_inputs(report_inputs["casino-ret"]), {"host": "a"})
+    loaded = read_partial(write_partial(tmp_path / "casino.rpa.npz", partial))
+    
+    assert loaded.report_type == "casino-ret"
+    assert loaded.weekly_boundaries == partial.weekly_boundaries
+    assert loaded.metadata == {"host": "a"}
+    assert loaded.row_count == partial.row_count > 0
+    assert_same_sections(loaded, partial)
+
+
+def test_merged_halves_equal_whole_export(split_exports, tmp_path):
+    plugin = get_plugin("casino-ret")()
+    paths = []
+    for half in ("first", "second"):
+        partial = PartialAggregate("casino-ret", plugin.weekly_boundaries,
+                                   plugin.aggregate_inputs(split_exports[half]))
+        paths.append(write_partial(tmp_path / f"{half}.rpa.npz", partial))
+    whole = PartialAggregate("casino-ret", plugin.weekly_boundaries,
+                             plugin.aggregate_inputs(split_exports["whole"]))
+    
+    merged = merge_partials(read_partial(path) for path in paths)
+    assert_same_sections(merged, whole)
+    assert merged.row_count == whole.row_count
+
+
+def test_merge_rejects_mismatched_partials(report_inputs):
+    plugin = get_plugin("casino-ret")()
+    sections = plugin.aggregate_inputs(report_inputs["casino-ret"][:1])
+    partial = PartialAggregate("casino-ret", plugin.weekly_boundaries, sections)
+    
+    with pytest.raises(ValueError, match="Cannot merge 'awol'"):
+        merge_partials([partial, PartialAggregate("awol", plugin.weekly_boundaries, sections)])
+    with pytest.raises(ValueError, match="different weekly boundaries"):
+        merge_partials([partial, PartialAggregate("casino-ret", plugin.weekly_boundaries[1:], sections)])
+    with pytest.raises(ValueError, match="No partial aggregates"):
+        merge_partials([])
+
+
+def test_newer_format_version_is_rejected(report_inputs, tmp_path):
+    plugin = get_plugin("casino-ret")()
+    path = write_partial(tmp_path / "casino.rpa.npz",
+                         PartialAggregate("casino-ret", plugin.weekly_boundaries,
+                                          plugin.aggregate_inputs(report_inputs["casino-ret"][:1])))
+    with np.load(path) as archive:
+        arrays = dict(archive)
+    header = json.loads(str(arrays["header"]))
+    header["version"] += 1
+    arrays["header"] = np.array(json.dumps(header))
+    with open(path, "wb") as f:
+        np.savez_compressed(f, **arrays)
+    
+    with pytest.raises(ValueError, match="format version"):
+        read_partial(path)
+
+
+def test_cli_merge_matches_generate(split_exports, tmp_path):
+    runner = CliRunner()
+    partials = []
+    for half in ("first", "second"):
+        partials.append(tmp_path / f"{half}.rpa.npz")
+        inputs = ",".join(str(path) for path in split_exports[half])
+        result = runner.invoke(cli, ["aggregate", inputs, str(partials[-1]), "-t", "casino-ret"])
+        assert result.exit_code == 0, result.output
+    
+    merged_excel = tmp_path / "merged.xlsx"
+    result = runner.invoke(cli, ["merge", *map(str, partials), str(merged_excel)])
+    assert result.exit_code == 0, result.output
+    
+    whole_excel = tmp_path / "whole.xlsx"
+    inputs = ",".join(str(path) for path in split_exports["whole"])
+    result = runner.invoke(cli, ["generate", inputs, str(whole_excel), "-t", "casino-ret"])
+    assert result.exit_code == 0, result.output
+    
+    assert sheet_values(merged_excel) == sheet_values(whole_excel)
@@ -0,0 +1,68 @@
+"""Tests for execution planning."""
+
+import math
+
+from click.testing import CliRunner
+
+from report_automation.cli.main import cli
+from report_automation.plugins import get_plugin
+from report_automation.plugins.base import ExecutionPlanner
+from report_automation.plugins.base.planner import CHUNKED, IN_MEMORY
+
+
+def test_row_bytes_measure_the_parsed_input_columns(exports):
+    plugin = get_plugin("casino-ret")()
+    path = exports["test_ab_metrics.csv"]
+    
+    profile = ExecutionPlanner().profile(plugin, path)
+    
+    parsed = plugin.read_input(path)
+    assert set(parsed.columns) == set(plugin.input_columns) | {"timestamp"}
+    assert profile.row_bytes == math.ceil(parsed.memory_usage(index=False, deep=True).sum() / len(parsed))
+    assert profile.rows == len(parsed)
+
+
+def test_claimed_share_is_reported_but_every_row_is_counted(exports):
+    plugin = get_plugin("a-b-report")()
+    path = exports["test_ab_metrics.csv"]
+    profile = ExecutionPlanner().profile(plugin, path)
+    
+    assert 0 < profile.claimed_share < 1
+    assert profile.memory == profile.rows * profile.row_bytes
+    plan = ExecutionPlanner(available_memory=1024 ** 3, cpus=1).plan(plugin, [path])
+    assert any(f"{profile.claimed_share:.0%} of rows claimed" in line for line in plan.describe())
+
+
+def test_plan_modes(exports):
+    plugin = get_plugin("a-b-report")()
+    path = exports["test_ab_metrics.csv"]
+    
+    assert ExecutionPlanner(available_memory=1024 ** 3, cpus=1).plan(plugin, [path]).mode == IN_MEMORY
+    plan = ExecutionPlanner(available_memory=1024, cpus=1).plan(plugin, [path])
+    assert plan.mode == CHUNKED
+    assert plan.chunksize >= 1_000
+    assert any("exceed" in line for line in plan.describe())
+
+
+def test_cli_explain_prints_the_plan_without_generating(exports, tmp_path):
+    path = exports["test_ab_metrics.csv"]
+    output = tmp_path / "ab.xlsx"
+    result = CliRunner().invoke(cli, ["generate", str(path), str(output), "--max-memory", "1K", "--explain"])
+    
+    assert result.exit_code == 0, result.output
+    assert f"Mode: {CHUNKED}" in result.output
+    assert "Memory budget: " in result.output
+    assert f"  {path.name}: " in result.output
+    assert not output.exists()
+    
+    result = CliRunner().invoke(cli, ["generate", str(path), str(output), "--state", str(tmp_path / "state"),
+                                      "--explain"])
+    assert "Mode: incremental (--state)" in result.output
+    assert not output.exists()
+
+
+def test_cli_rejects_invalid_memory_budget(exports, tmp_path):
+    result = CliRunner().invoke(cli, ["generate", str(exports["test_ab_metrics.csv"]), str(tmp_path / "ab.xlsx"),
+                                      "--max-memory", "lots", "--explain"])
+    assert result.exit_code == 2
+    assert "Invalid size 'lots'; use e.g. 512M or 2G" in result.output
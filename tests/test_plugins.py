@@ -0,0 +1,79 @@
+"""Tests for the plugin base classes."""
+
+import pytest
+from click.testing import CliRunner
+
+from conftest import serial_output, sheet_values
+from report_automation.cli.main import cli
+from report_automation.plugins import get_plugin
+from report_automation.plugins.base import BaseReportPlugin, WeekReplacementMixin
+
+
+def test_transform_aggregates_is_required():
+    class Incomplete(BaseReportPlugin):
+        name = "incomplete"
+        supports_multiple_files = False
+        
+        def process_csv(self, csv_path):
+            pass
+        
+        def transform_data(self, data):
+            pass
+        
+        def generate_excel(self, report_data, output_path):
+            pass
+    
+    with pytest.raises(TypeError, match="transform_aggregates"):
+        Incomplete()
+
+
+def test_week_replacement_comes_from_the_mixin():
+    assert not get_plugin("a-b-report")().supports_week_replacement
+    for report_type in ("casino-ret", "awol"):
+        plugin = get_plugin(report_type)()
+        assert isinstance(plugin, WeekReplacementMixin)
+        assert plugin.supports_week_replacement
+
+
+def test_plugins_without_the_mixin_reject_week_replacement(report_inputs, tmp_path):
+    plugin = get_plugin("a-b-report")()
+    report_data = plugin.transform_inputs(report_inputs["a-b-report"])
+    
+    with pytest.raises(ValueError, match="does not support week replacement"):
+        plugin.generate_from_report_data(report_data, tmp_path / "ab.xlsx", tmp_path / "master.xlsx", "05")
+    with pytest.raises(ValueError, match="does not support week replacement"):
+        plugin.replace_weeks(tmp_path / "ab.xlsx", tmp_path / "master.xlsx", ["05"])
+
+
+def copied_cells(plugin, generated, updated, week):
+    """(target value, generated source value) of every cell written into a week's master column."""
+    source, target = plugin.week_mappings["source"][week], plugin.week_mappings["target"][week]
+    return [(value, generated.get(f"{source}{coordinate[len(target):]}"))
+            for coordinate, value in updated.items()
+            if coordinate.startswith(target) and coordinate[len(target):].isdigit()]
+
+
+@pytest.mark.parametrize("report_type", ["casino-ret", "awol"])
+def test_replace_weeks_copies_generated_columns(report_type, report_inputs, tmp_path):
+    master = serial_output(report_type, report_inputs[report_type], tmp_path / "master.xlsx")
+    plugin = get_plugin(report_type)()
+    
+    updated = plugin.replace_weeks(master, master, ["05", "02"])
+    assert updated == tmp_path / "updated_master.xlsx"
+    generated, values = sheet_values(master), sheet_values(updated)
+    for week in ("05", "02"):
+        cells = copied_cells(plugin, generated, values, week)
+        assert cells and all(value == source for value, source in cells)
+        assert not copied_cells(plugin, generated, generated, week)
+
+
+def test_cli_replaces_a_week_in_the_master(report_inputs, tmp_path):
+    master = serial_output("casino-ret", report_inputs["casino-ret"], tmp_path / "master.xlsx")
+    inputs = ",".join(str(path) for path in report_inputs["casino-ret"])
+    result = CliRunner().invoke(cli, ["generate", inputs, str(tmp_path / "out.xlsx"), "-t", "casino-ret",
+                                      "--existing-excel", str(master), "--replace-week", "03"])
+    assert result.exit_code == 0, result.output
+    
+    cells = copied_cells(get_plugin("casino-ret")(), sheet_values(master),
+                         sheet_values(tmp_path / "updated_master.xlsx"), "03")
+    assert cells and all(value == source for value, source in cells)
@@ -0,0 +1,63 @@
+"""ArrayProcessedData views and the simple report written from either data form."""
+
+import numpy as np
+import pytest
+
+from conftest import sheet_values
+from report_automation.domain.models import ArrayProcessedData, ProcessedData
+from report_automation.infrastructure.excel import StreamingExcelValidator
+from report_automation.infrastructure.excel.generator import SimpleExcelGenerator
+
+
+@pytest.fixture
+def array_data():
+    weekly = np.arange(2 * 3 * 2).reshape(2, 3, 2)
+    percentages = np.array([[50.0, np.nan], [12.5, 0.0]])
+    return ArrayProcessedData("a-b-report", ["10m", "1h"], ["week1", "week2", "week3"], ["sent", "delivered"],
+                              weekly, percentage_metrics=["% Delivered", "% Open"], percentages=percentages,
+                              metadata={"row_count": 7})
+
+
+def test_views_match_processed_data(array_data):
+    processed = array_data.to_processed_data()
+    
+    assert processed.weekly_data["1h"]["week2"] == {"sent": 8, "delivered": 9}
+    assert processed.totals == {"10m": {"sent": 6, "delivered": 9}, "1h": {"sent": 24, "delivered": 27}}
+    assert processed.percentages == {"10m": {"% Delivered": 50.0}, "1h": {"% Delivered": 12.5, "% Open": 0.0}}
+    assert dict(array_data.totals["1h"]) == processed.totals["1h"]
+    assert "% Open" not in array_data.percentages["10m"]
+    assert len(array_data.percentages["10m"]) == 1
+    with pytest.raises(KeyError):
+        array_data.percentages["10m"]["% Open"]
+    assert processed.metadata == {"row_count": 7}
+
+
+def test_round_trip_through_processed_data(array_data):
+    restored = ArrayProcessedData.from_processed_data(array_data.to_processed_data())
+    np.testing.assert_array_equal(restored.weekly, array_data.weekly)
+    np.testing.assert_array_equal(restored.totals_array, array_data.totals_array)
+    np.testing.assert_array_equal(restored.percentages_array, array_data.percentages_array)
+    assert restored.time_periods == array_data.time_periods
+
+
+def test_rejects_bad_arrays():
+    with pytest.raises(ValueError, match="weekly must have shape \\(1, 1, 1\\)"):
+        ArrayProcessedData("x", ["1d"], ["week1"], ["sent"], np.zeros((1, 2, 1)))
+    with pytest.raises(ValueError, match="weekly must contain integer values"):
+        ArrayProcessedData("x", ["1d"], ["week1"], ["sent"], np.full((1, 1, 1), 0.5))
+    with pytest.raises(ValueError, match="metrics labels must be unique"):
+        ArrayProcessedData("x", ["1d"], ["week1"], ["sent", "sent"], np.zeros((1, 1, 2)))
+    with pytest.raises(ValueError, match="Periods not listed in time_periods"):
+        ArrayProcessedData.from_processed_data(ProcessedData(
+            report_type="x", time_periods=["1d"], weekly_data={"3d": {}}, totals={}, percentages={}))
+
+
+def test_simple_report_is_the_same_from_arrays_and_dicts(array_data, tmp_path):
+    generator = SimpleExcelGenerator()
+    generator.create_simple_report(array_data, tmp_path / "arrays.xlsx")
+    generator.create_simple_report(array_data.to_processed_data(), tmp_path / "dicts.xlsx")
+    
+    values = sheet_values(tmp_path / "arrays.xlsx")
+    assert values == sheet_values(tmp_path / "dicts.xlsx")
+    assert values["B1"] == "10M" and values["C2"] == 24
+    assert StreamingExcelValidator().validate_data(tmp_path / "arrays.xlsx", array_data)
@@ -0,0 +1,36 @@
+"""CSVProcessor partitioning against the brand and period filters it replaces."""
+
+import numpy as np
+import pytest
+
+from report_automation.infrastructure.csv.processor import CSVProcessor
+
+
+@pytest.mark.parametrize("reader", ["read_csv", "read_batch"])
+def test_partition_matches_filters(exports, reader):
+    processor = CSVProcessor()
+    data = getattr(processor, reader)(exports["test_ab_metrics.csv"])
+    partitions = processor.partition(data)
+    
+    assert set(partitions) == {(brand, period) for brand in processor.brand_patterns
+                               for period in processor.period_patterns}
+    for (brand, period), indices in partitions.items():
+        filtered = processor.filter_by_time_period(processor.filter_by_brand(data, brand), period)
+        partition = processor.take(data, indices)
+        assert len(partition) == len(filtered)
+        if reader == "read_batch":
+            assert partition.frame.equals(filtered.frame)
+        else:
+            assert partition == filtered
+    assert any(len(indices) for indices in partitions.values())
+
+
+def test_partition_keeps_unknown_brand_empty(exports):
+    processor = CSVProcessor()
+    data = processor.read_batch(exports["test_ab_metrics.csv"])
+    partitions = processor.partition(data, brands=["Casino A", "Poker"], periods=["1h"])
+    
+    assert len(partitions[("Poker", "1h")]) == 0
+    indices = partitions[("Casino A", "1h")]
+    assert np.all(np.diff(indices) > 0)
+    assert len(indices) == len(processor.filter_by_time_period(processor.filter_by_brand(data, "Casino A"), "1h"))
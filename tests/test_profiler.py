@@ -0,0 +1,81 @@
+"""Tests for single-pass export profiling."""
+
+import json
+from datetime import datetime
+
+import pytest
+from click.testing import CliRunner
+
+from report_automation.cli.main import cli
+from report_automation.infrastructure.csv import DatasetProfiler
+
+from conftest import COLUMNS, write_export
+
+
+ROW = ["1770803575", "2026-02-11T09:52:55+00:00", 1000, "Day 3", "Ret 1 dep [SPORT]", 10, 5, 2, 1, 0, 5, 0]
+
+
+@pytest.fixture
+def messy_export(tmp_path):
+    later = ["1770803576"] + ROW[1:]
+    blank = [""] + ROW[1:]
+    rows = [ROW, ROW, blank, ROW, later, later, ["2026-02-01T10:00:00Z"] + ROW[1:3] + ["Day 4"] + ROW[4:]]
+    return write_export(tmp_path / "messy.csv", rows)
+
+
+def test_blank_timestamp_keeps_epoch_seconds(messy_export):
+    profile = DatasetProfiler(chunksize=3).profile(messy_export)
+    
+    assert profile.invalid_timestamps == 1
+    assert profile.min_timestamp == datetime(2026, 2, 1, 10, 0)
+    assert profile.max_timestamp == datetime(2026, 2, 11, 9, 52, 56)
+
+
+@pytest.mark.parametrize("chunksize", [1, 2, 4, 100])
+def test_duplicate_count_does_not_depend_on_chunksize(messy_export, chunksize):
+    profile = DatasetProfiler(chunksize=chunksize).profile(messy_export)
+    
+    assert profile.duplicate_rows == 3
+    assert profile.duplicate_samples == [1, 3, 5]
+
+
+def test_plugin_export_without_bounced(tmp_path):
+    columns = [c for c in COLUMNS if c != "bounced"]
+    path = tmp_path / "no_bounced.csv"
+    path.write_text(",".join(columns) + "\n" + ",".join(str(v) for i, v in enumerate(ROW) if i != 10) + "\n")
+    
+    profile = DatasetProfiler().profile(path)
+    
+    assert "bounced" not in profile.metric_totals
+    assert profile.metric_totals["sent"] == 10
+    assert profile.is_clean
+
+
+def test_unmapped_templates_are_an_issue(exports):
+    path = exports["test_ret1_metrics.csv"]
+    
+    profile = DatasetProfiler().profile(path, known_templates=["Day 3", "Day 4", "Day 6", "Day 8", "Day 10"])
+    
+    assert set(profile.unmapped_templates) == {"Day 99"}
+    assert not profile.is_clean
+
+
+def test_cli_profile_reports_issues(messy_export, exports, tmp_path):
+    inputs = f"{messy_export},{exports['test_ret1_metrics.csv']}"
+    json_path = tmp_path / "profile.json"
+    result = CliRunner().invoke(cli, ["profile", inputs, "-t", "casino-ret", "--chunksize", "2",
+                                      "--json", str(json_path)])
+    
+    assert result.exit_code == 0, result.output
+    assert "Invalid timestamps: 1" in result.output
+    assert "⚠️  Duplicate rows: 3 (e.g. rows 1, 3, 5)" in result.output
+    assert "⚠️  Unmapped templates for casino-ret:\n  • Day 99:" in result.output
+    assert "❌ Data issues found" in result.output
+    assert json.loads(json_path.read_text())["duplicate_rows"] == 3
+
+
+def test_cli_profile_rejects_missing_inputs(messy_export, tmp_path):
+    result = CliRunner().invoke(cli, ["profile", f"{messy_export},{tmp_path / 'missing.csv'}"])
+    assert f"❌ File not found: {tmp_path / 'missing.csv'}" in result.output
+    result = CliRunner().invoke(cli, ["profile", str(messy_export), "-t", "nope"])
+    assert "❌ Report type 'nope' not found" in result.output
@@ -0,0 +1,90 @@
+"""Hot reloading of edited plugins and fingerprint-aware session reloads."""
+
+import sys
+
+import pytest
+
+from report_automation.plugins.base import ModulePluginLoader
+from report_automation.session import ReportSession
+
+
+MODULE_NAME = "report_automation_plugins.echo"
+
+
+def write_plugin(path, version, boundaries=None):
+    """An a-b-report variant; ``boundaries`` overrides the spec's weeks."""
+    source = [
+        "from report_automation.plugins.base import register_plugin",
+        "from report_automation.plugins.implementations.ab_report import ABReportPlugin",
+        f"VERSION = {version}",
+        "@register_plugin",
+        "class EchoPlugin(ABReportPlugin):",
+        "    name = 'echo-ab'",
+    ]
+    if boundaries is not None:
+        source.append(f"    weekly_boundaries = {boundaries!r}")
+    path.write_text("\n".join(source) + "\n")
+
+
+@pytest.fixture
+def plugin_file(tmp_path):
+    directory = tmp_path / "plugins"
+    directory.mkdir()
+    write_plugin(directory / "echo.py", 1)
+    yield directory / "echo.py"
+    sys.modules.pop(MODULE_NAME, None)
+
+
+@pytest.fixture
+def loader(plugin_file, registry):
+    loader = ModulePluginLoader(registry)
+    assert [plugin.name for plugin in loader.load_plugins_from_directory(plugin_file.parent)] == ["echo-ab"]
+    return loader
+
+
+def test_edited_plugins_are_reloaded(plugin_file, loader, registry):
+    original = registry.get("echo-ab")
+    assert loader.changed_plugins() == []
+    
+    write_plugin(plugin_file, 22)
+    assert loader.changed_plugins() == ["echo-ab"]
+    assert loader.reload_changed() == ["echo-ab"]
+    
+    reloaded = registry.get("echo-ab")
+    assert reloaded is not original
+    assert sys.modules[reloaded.__module__].VERSION == 22
+    assert loader.changed_plugins() == []
+
+
+def test_failed_reload_keeps_the_loaded_plugin(plugin_file, loader, registry):
+    original = registry.get("echo-ab")
+    plugin_file.write_text("raise RuntimeError('half-saved')\n")
+    
+    assert loader.reload_changed() == []
+    assert registry.get("echo-ab") is original
+
+
+def test_unknown_plugins_and_files_without_plugins(loader, tmp_path):
+    with pytest.raises(ValueError, match="Plugin 'missing' not found"):
+        loader.reload_plugin("missing")
+    with pytest.raises(ValueError, match="Plugin 'missing' not found"):
+        loader.track("missing")
+    (tmp_path / "empty.py").write_text("VALUE = 1\n")
+    with pytest.raises(ImportError, match="No plugin class found"):
+        loader.load_plugin(tmp_path / "empty.py")
+
+
+def test_session_keeps_aggregates_until_the_weeks_change(plugin_file, loader, report_inputs, tmp_path):
+    with ReportSession("echo-ab", report_inputs["a-b-report"]) as session:
+        aggregates = session.aggregates
+        session.render_new(tmp_path / "first.xlsx")
+        
+        write_plugin(plugin_file, 2)
+        assert session.reload_plugin(loader)
+        assert session.aggregates is aggregates
+        assert session.render_new(tmp_path / "second.xlsx").exists()
+        
+        write_plugin(plugin_file, 3, [("2026-01-05", "2026-01-11")])
+        assert not session.reload_plugin(loader)
+        assert session.aggregates is not aggregates
+        assert len(session.plugin.weekly_boundaries) == 1
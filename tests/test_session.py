@@ -0,0 +1,154 @@
+"""Tests for in-process report sessions."""
+
+import shutil
+from pathlib import Path
+
+import pytest
+from click.testing import CliRunner
+
+from report_automation.cli.main import cli
+from report_automation.infrastructure.cache import TransformMemo
+from report_automation.plugins import get_plugin
+from report_automation.session import MultiReportSession, ReportSession
+
+from conftest import EXPORTS, export_rows, serial_output, sheet_values
+
+
+REPORT_TYPES = ["a-b-report", "casino-ret", "awol"]
+
+
+def render_single(report_type, input_paths, output_path):
+    plugin = get_plugin(report_type)()
+    plugin.generate_from_report_data(plugin.transform_inputs(input_paths), output_path)
+    return sheet_values(output_path)
+
+
+def test_combined_export_matches_single_runs(combined_export, report_inputs, tmp_path):
+    outputs = {t: tmp_path / f"multi_{t}.xlsx" for t in REPORT_TYPES}
+    with MultiReportSession(REPORT_TYPES, [combined_export]) as session:
+        session.render_all(outputs)
+    
+    for report_type in REPORT_TYPES:
+        expected = render_single(report_type, report_inputs[report_type], tmp_path / f"single_{report_type}.xlsx")
+        assert sheet_values(outputs[report_type]) == expected, report_type
+
+
+def test_combined_export_sections_follow_plugin_detection(combined_export):
+    with MultiReportSession(REPORT_TYPES, [combined_export]) as session:
+        aggregates = session.aggregates
+    
+    assert list(aggregates["awol"]) == ["awolinactive7j1931.csv", "awolinactive14j1231.csv",
+                                        "awolinactive22j531.csv", "awolinactive31jx31.csv"]
+    assert list(aggregates["casino-ret"]) == ["ret1depsport.csv", "ret2depsport.csv",
+                                              "casinosportabregnodep.csv"]
+    # AWOL's "Day 3"/"Day 10" rows share retention template names but not a campaign
+    assert [a.campaign_name for a in aggregates["casino-ret"].values()] == [
+        "Ret 1 dep [SPORT]", "Ret 2 dep [SPORT]", "casino+sport A/B Reg_No_Dep"]
+
+
+def test_separate_files_keep_their_names(report_inputs, tmp_path):
+    with MultiReportSession(["awol"], report_inputs["awol"]) as session:
+        assert list(session.aggregates["awol"]) == [path.name for path in report_inputs["awol"]]
+
+
+def test_render_all_fails_when_a_report_claims_nothing(exports, tmp_path):
+    outputs = {t: tmp_path / f"{t}.xlsx" for t in ["casino-ret", "awol"]}
+    with MultiReportSession(outputs, [exports["test_inactive7j19-31.csv"]]) as session:
+        with pytest.raises(ValueError, match="casino-ret"):
+            session.render_all(outputs)
+    assert not any(path.exists() for path in outputs.values())
+
+
+def test_memoized_report_data_skips_aggregation(report_inputs, tmp_path, monkeypatch):
+    memo = TransformMemo(tmp_path / "transforms")
+    with ReportSession("awol", report_inputs["awol"], memo=memo) as session:
+        expected = session.plugin.tidy_report_data(session.report_data)
+    
+    def fail(*args, **kwargs):
+        raise AssertionError("inputs were aggregated again")
+    
+    with ReportSession("awol", report_inputs["awol"], memo=memo) as session:
+        monkeypatch.setattr(session.plugin, "aggregate_inputs", fail)
+        assert session.plugin.tidy_report_data(session.report_data).equals(expected)
+        assert session._inputs is None
+
+
+@pytest.fixture
+def masters(report_inputs, tmp_path):
+    """Two casino-ret master workbooks to replace weeks into."""
+    master = serial_output("casino-ret", report_inputs["casino-ret"], tmp_path / "master_a.xlsx")
+    return master, Path(shutil.copy(master, tmp_path / "master_b.xlsx"))
+
+
+def replaced_fresh(report_inputs, master, weeks, output_path):
+    """``replace_weeks`` into ``master`` from a report rendered outside any session."""
+    plugin = get_plugin("casino-ret")()
+    generated = serial_output("casino-ret", report_inputs["casino-ret"], output_path.with_name("fresh.xlsx"))
+    return plugin.replace_weeks(generated, master, weeks, output_path)
+
+
+def test_replace_into_several_masters(report_inputs, masters, tmp_path):
+    with ReportSession("casino-ret", report_inputs["casino-ret"]) as session:
+        session.render_new(tmp_path / "report.xlsx")
+        updated_a = session.replace_into(masters[0], ["05", "06"], tmp_path / "updated_a.xlsx")
+        updated_b = session.replace_into(masters[1], "02")
+    
+    assert updated_b == tmp_path / "updated_master_b.xlsx"
+    assert sheet_values(updated_a) == sheet_values(
+        replaced_fresh(report_inputs, masters[0], ["05", "06"], tmp_path / "expected_a.xlsx"))
+    assert sheet_values(updated_b) == sheet_values(
+        replaced_fresh(report_inputs, masters[1], ["02"], tmp_path / "expected_b.xlsx"))
+
+
+def test_outputs_handed_out_are_never_read_back(report_inputs, masters, tmp_path):
+    with ReportSession("casino-ret", report_inputs["casino-ret"]) as session:
+        first = session.render_new(tmp_path / "first.xlsx")
+        expected = sheet_values(first)
+        first.unlink()
+        assert sheet_values(session.render_new(tmp_path / "second.xlsx")) == expected
+        
+        (tmp_path / "second.xlsx").write_text("edited by the user")
+        updated = session.replace_into(masters[0], ["05"], tmp_path / "updated.xlsx")
+    assert sheet_values(updated) == sheet_values(
+        replaced_fresh(report_inputs, masters[0], ["05"], tmp_path / "expected.xlsx"))
+
+
+def test_changed_inputs_are_recomputed(report_inputs, tmp_path):
+    paths = [Path(shutil.copy(path, tmp_path / path.name)) for path in report_inputs["awol"]]
+    with ReportSession("awol", paths[:2]) as session:
+        session.render_new(tmp_path / "two.xlsx")
+        
+        session.set_inputs(paths)
+        assert sheet_values(session.render_new(tmp_path / "all.xlsx")) == sheet_values(
+            serial_output("awol", paths, tmp_path / "serial_all.xlsx"))
+        
+        campaign, templates = EXPORTS[paths[0].name]
+        with open(paths[0], "a") as f:
+            f.writelines(",".join(f'"{v}"' if isinstance(v, str) else str(v) for v in row) + "\n"
+                         for row in export_rows(campaign, templates, 30, seed=7))
+        session.invalidate(inputs=True)
+        assert sheet_values(session.render_new(tmp_path / "grown.xlsx")) == sheet_values(
+            serial_output("awol", paths, tmp_path / "serial_grown.xlsx"))
+
+
+def test_cli_generates_every_report_from_one_export(combined_export, report_inputs, tmp_path):
+    result = CliRunner().invoke(cli, ["generate", str(combined_export), str(tmp_path / "out.xlsx"),
+                                      "-t", "awol, a-b-report"])
+    assert result.exit_code == 0, result.output
+    
+    for report_type in ("awol", "a-b-report"):
+        output = tmp_path / f"out_{report_type}.xlsx"
+        assert f"✅ {report_type} report generated: {output}" in result.output
+        expected = render_single(report_type, report_inputs[report_type], tmp_path / f"single_{report_type}.xlsx")
+        assert sheet_values(output) == expected
+
+
+@pytest.mark.parametrize("options, message", [
+    (["-t", "awol,nope"], "❌ Report type 'nope' not found"),
+    (["-t", "awol,casino-ret", "--workers", "2"], "❌ Multiple report types cannot be combined"),
+    (["-t", "awol,casino-ret", "--format", "csv"], "❌ --format and --also-export cannot be combined"),
+])
+def test_cli_rejects_unsupported_multi_report_runs(combined_export, tmp_path, options, message):
+    result = CliRunner().invoke(cli, ["generate", str(combined_export), str(tmp_path / "out.xlsx"), *options])
+    assert message in result.output
+    assert not list(tmp_path.glob("out*"))
@@ -0,0 +1,100 @@
+"""Tests for incremental ingestion of growing exports."""
+
+import os
+import shutil
+from pathlib import Path
+
+from click.testing import CliRunner
+
+from report_automation.cli.main import cli
+from report_automation.domain.services import WeeklyAggregate
+from report_automation.infrastructure.csv import TailAggregator
+from report_automation.plugins import get_plugin
+
+from conftest import COLUMNS, export_rows, serial_output, sheet_values, write_export
+
+
+BOUNDARIES = get_plugin("casino-ret")().weekly_boundaries
+
+
+def full_aggregate(path):
+    plugin = get_plugin("casino-ret")()
+    return plugin.aggregate_data(plugin.read_input(path))
+
+
+def assert_same(aggregate: WeeklyAggregate, expected: WeeklyAggregate):
+    columns = expected.sums.columns
+    assert aggregate.sums[columns].sort_index().equals(expected.sums.sort_index())
+
+
+def age(path, seconds=60):
+    stat = os.stat(path)
+    os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns - int(seconds * 1e9)))
+
+
+def test_appended_rows_are_folded_in(tmp_path):
+    rows = export_rows("Ret 1 dep [SPORT]", ["Day 3", "Day 4"], 400, seed=1)
+    path = write_export(tmp_path / "ret1.csv", rows[:250])
+    tail = TailAggregator(BOUNDARIES, state_path=tmp_path / "state.rpa.npz")
+    tail.update(path)
+    
+    with open(path, "a") as f:
+        f.writelines(",".join(str(v) for v in row) + "\n" for row in rows[250:])
+    resumed = TailAggregator(BOUNDARIES, state_path=tmp_path / "state.rpa.npz")
+    
+    assert_same(resumed.update(path), full_aggregate(path))
+    assert resumed.watermark(path).offset == os.path.getsize(path)
+
+
+def test_finished_export_without_trailing_newline(tmp_path):
+    rows = export_rows("Ret 1 dep [SPORT]", ["Day 3", "Day 4"], 50, seed=2)
+    path = tmp_path / "ret1.csv"
+    path.write_text("\n".join(",".join(str(v) for v in row) for row in [COLUMNS] + rows))
+    age(path)
+    
+    tail = TailAggregator(BOUNDARIES)
+    aggregate = tail.update(path)
+    
+    assert_same(aggregate, full_aggregate(path))
+    # The unterminated row is not part of the watermark, so it is read again if it grows
+    assert tail.watermark(path).offset < os.path.getsize(path)
+    assert_same(tail.update(path), full_aggregate(path))
+
+
+def test_row_being_written_waits(tmp_path):
+    rows = export_rows("Ret 1 dep [SPORT]", ["Day 3"], 20, seed=3)
+    path = write_export(tmp_path / "ret1.csv", rows[:19])
+    with open(path, "a") as f:
+        f.write(",".join(str(v) for v in rows[19])[:-4])
+    
+    tail = TailAggregator(BOUNDARIES)
+    partial = tail.update(path)
+    assert int(partial.sums["row_count"].sum()) <= 19
+    
+    with open(path, "a") as f:
+        f.write(",".join(str(v) for v in rows[19])[-4:] + "\n")
+    assert_same(tail.update(path), full_aggregate(path))
+
+
+def test_rewritten_file_is_read_again(tmp_path):
+    path = write_export(tmp_path / "ret1.csv", export_rows("Ret 1 dep [SPORT]", ["Day 3"], 30, seed=4))
+    tail = TailAggregator(BOUNDARIES)
+    tail.update(path)
+    
+    write_export(path, export_rows("Ret 1 dep [SPORT]", ["Day 4"], 40, seed=5))
+    assert_same(tail.update(path), full_aggregate(path))
+
+
+def test_cli_state_regenerates_from_appended_rows(report_inputs, tmp_path):
+    paths = [Path(shutil.copy(path, tmp_path / path.name)) for path in report_inputs["casino-ret"]]
+    args = ["generate", ",".join(map(str, paths)), str(tmp_path / "ret.xlsx"), "-t", "casino-ret",
+            "--state", str(tmp_path / "state")]
+    assert CliRunner().invoke(cli, args).exit_code == 0
+    
+    with open(paths[0], "a") as f:
+        f.writelines(",".join(str(v) for v in row) + "\n"
+                     for row in export_rows("Ret 1 dep [SPORT]", ["Day 3", "Day 4"], 40, seed=6))
+    result = CliRunner().invoke(cli, args)
+    assert result.exit_code == 0, result.output
+    assert sheet_values(tmp_path / "ret.xlsx") == sheet_values(serial_output("casino-ret", paths,
+                                                                             tmp_path / "serial.xlsx"))
@@ -0,0 +1,96 @@
+"""Vectorized CampaignDataTransformer against a row-by-row reference."""
+
+import pandas as pd
+import pytest
+from click.testing import CliRunner
+
+from conftest import sheet_values
+from report_automation.cli.main import cli
+from report_automation.domain.models import MetricCalculation
+from report_automation.domain.services import CampaignDataTransformer
+from report_automation.infrastructure.config import CachedConfigManager
+from report_automation.infrastructure.csv.processor import CSVProcessor
+
+
+METRICS = ["sent", "delivered", "opened", "clicked", "converted"]
+
+
+@pytest.fixture
+def config():
+    return CachedConfigManager().get_config("a-b-report")
+
+
+@pytest.fixture
+def records(exports):
+    return CSVProcessor().read_csv(exports["test_ab_metrics.csv"])
+
+
+def reference_weekly(records, config):
+    """Period -> week -> metric sums, one row at a time."""
+    result = {}
+    for record in records:
+        period = config.template_mappings.get(record.template_name)
+        for week, (start, end) in enumerate(config.weekly_boundaries, 1):
+            if pd.Timestamp(start) <= pd.Timestamp(record.timestamp) <= pd.Timestamp(end + " 23:59:59"):
+                if period in config.time_periods:
+                    cell = result.setdefault(period, {}).setdefault(f"week{week}", dict.fromkeys(METRICS, 0))
+                    for metric in METRICS:
+                        cell[metric] += getattr(record, metric)
+                break
+    return result
+
+
+def test_transform_matches_row_by_row_sums(records, config):
+    data = CampaignDataTransformer(config).transform_to_arrays(records)
+    expected = reference_weekly(records, config)
+    
+    for period in config.time_periods:
+        for week in data.weeks:
+            expected_week = expected.get(period, {}).get(week, dict.fromkeys(METRICS, 0))
+            assert dict(data.weekly_data[period][week]) == expected_week
+        totals = data.totals[period]
+        assert dict(totals) == {m: sum(week[m] for week in expected.get(period, {}).values()) for m in METRICS}
+        if totals["sent"]:
+            assert data.percentages[period]["% Delivered"] == round(totals["delivered"] * 100 / totals["sent"], 2)
+    assert data.metadata["row_count"] == len(records)
+    assert data.metadata["matched_rows"] < len(records)
+
+
+def test_batches_and_records_transform_alike(records, config, exports):
+    transformer = CampaignDataTransformer(config)
+    batch = CSVProcessor().read_batch(exports["test_ab_metrics.csv"])
+    expected = transformer.transform_for_report(records, "a-b-report")
+    assert transformer.transform_for_report(batch, "a-b-report") == expected
+
+
+def test_aggregate_by_weeks_and_percentages(records, config):
+    transformer = CampaignDataTransformer(config)
+    weekly = transformer.aggregate_by_weeks(records, config.weekly_boundaries)
+    # Every template counts, mapped to a period or not
+    config = config.model_copy(update={"template_mappings": {r.template_name: "10m" for r in records}})
+    assert weekly == reference_weekly(records, config)["10m"]
+    percentages = transformer.calculate_percentages({"a": {"sent": 200, "delivered": 50, "opened": 5,
+                                                           "clicked": 1, "converted": 0}, "b": {}})
+    assert percentages["a"] == {"% Delivered": 25.0, "% Open": 10.0, "% Click": 2.0, "% CR": 0.0}
+    assert percentages["b"] == {"% Delivered": 0.0, "% Open": 0.0, "% Click": 0.0, "% CR": 0.0}
+
+
+def test_unsupported_calculations_are_rejected(config):
+    with pytest.raises(ValueError, match="Unknown base metrics"):
+        CampaignDataTransformer(config, MetricCalculation(base_metrics=["revenue"], percentage_metrics=[]))
+    with pytest.raises(ValueError, match="Unknown percentage metric"):
+        CampaignDataTransformer(config, MetricCalculation(percentage_metrics=["% Bounce"]))
+    with pytest.raises(ValueError, match="% Open requires base metrics \\['opened'\\]"):
+        CampaignDataTransformer(config, MetricCalculation(base_metrics=["sent", "delivered"],
+                                                          percentage_metrics=["% Open"]))
+
+
+def test_cli_simple_report(exports, records, config, tmp_path):
+    output = tmp_path / "simple.xlsx"
+    result = CliRunner().invoke(cli, ["generate", str(exports["test_ab_metrics.csv"]), str(output), "--simple"])
+    assert result.exit_code == 0, result.output
+    
+    data = CampaignDataTransformer(config).transform_to_arrays(records)
+    values = sheet_values(output)
+    assert values["B1"] == config.time_periods[0].upper()
+    assert values["B2"] == data.totals[config.time_periods[0]]["sent"]
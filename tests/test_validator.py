@@ -0,0 +1,79 @@
+"""Tests for streaming validation of generated workbooks."""
+
+import pytest
+from openpyxl import load_workbook
+
+from report_automation.domain.models.validation import DATA, FORMATTING, STRUCTURE
+from report_automation.plugins import get_plugin
+
+
+@pytest.fixture(params=["a-b-report", "casino-ret", "awol"])
+def rendered(request, report_inputs, tmp_path):
+    plugin = get_plugin(request.param)()
+    report_data = plugin.transform_inputs(report_inputs[request.param])
+    path = tmp_path / f"{request.param}.xlsx"
+    plugin.generate_from_report_data(report_data, path)
+    return plugin, report_data, path
+
+
+def corrupt(path, cells):
+    wb = load_workbook(path)
+    for (row, column), value in cells.items():
+        wb.active.cell(row=row, column=column).value = value
+    wb.save(path)
+
+
+def test_rendered_report_is_valid(rendered):
+    plugin, report_data, path = rendered
+    
+    validation = plugin.validate_output(path, report_data)
+    
+    assert validation.is_valid, validation.summary()
+    assert validation.cells_checked >= len(plugin.expected_cells(report_data))
+
+
+def test_wrong_metric_cell_is_flagged(rendered):
+    plugin, report_data, path = rendered
+    cell, value = next((cell, value) for cell, value in plugin.expected_cells(report_data).items()
+                       if isinstance(value, (int, float)) and value > 0)
+    corrupt(path, {cell: value + 1})
+    
+    validation = plugin.validate_output(path, report_data)
+    
+    assert validation.issue_count == 1
+    assert validation.issues[0].check == DATA
+
+
+def test_blanked_metric_cell_is_flagged(rendered):
+    plugin, report_data, path = rendered
+    cell = next(cell for cell, value in plugin.expected_cells(report_data).items() if isinstance(value, float))
+    corrupt(path, {cell: None})
+    
+    validation = plugin.validate_output(path, report_data)
+    
+    assert not validation.is_valid
+    assert "found None" in validation.summary()
+
+
+def test_skeleton_label_is_checked(rendered):
+    plugin, report_data, path = rendered
+    coordinate, label = next(iter(plugin.skeleton().cells.items()))
+    wb = load_workbook(path)
+    wb.active[coordinate] = f"{label} (edited)"
+    wb.save(path)
+    
+    validation = plugin.validate_output(path, report_data)
+    
+    assert {issue.check for issue in validation.issues} <= {FORMATTING, DATA}
+    assert any(issue.coordinate == coordinate for issue in validation.issues)
+
+
+def test_missing_sheet(rendered):
+    plugin, report_data, path = rendered
+    wb = load_workbook(path)
+    wb.active.title = "Renamed"
+    wb.save(path)
+    
+    validation = plugin.validate_output(path, report_data)
+    
+    assert [issue.check for issue in validation.issues] == [STRUCTURE]
@@ -0,0 +1,105 @@
+"""Watch mode: debounced change detection and incremental regeneration."""
+
+import shutil
+from pathlib import Path
+
+import pytest
+from click.testing import CliRunner
+
+from conftest import EXPORTS, export_rows, serial_output, sheet_values
+from report_automation.cli.main import cli
+from report_automation.domain.models import ReportJob
+from report_automation.watch import DirectoryWatcher, JobRunner, default_jobs
+
+
+@pytest.fixture
+def inbox(exports, tmp_path):
+    """A watched directory holding every export."""
+    directory = tmp_path / "inbox"
+    directory.mkdir()
+    for path in exports.values():
+        shutil.copy(path, directory / path.name)
+    return directory
+
+
+def append_rows(path: Path, count: int, seed: int) -> None:
+    campaign, templates = EXPORTS[path.name]
+    with open(path, "a") as f:
+        for row in export_rows(campaign, templates, count, seed):
+            f.write(",".join(f'"{value}"' if isinstance(value, str) else str(value) for value in row) + "\n")
+
+
+def inputs_of(directory: Path, report_inputs, report_type: str):
+    return [directory / path.name for path in report_inputs[report_type]]
+
+
+def test_watcher_reports_settled_changes(tmp_path):
+    (tmp_path / "old.csv").write_text("a\n")
+    watcher = DirectoryWatcher(tmp_path, debounce=5)
+    assert watcher.poll(now=0) == []
+    
+    (tmp_path / "new.csv").write_text("a\n")
+    (tmp_path / "gone.csv").write_text("a\n")
+    (tmp_path / "notes.txt").write_text("a\n")
+    assert watcher.poll(now=10) == []
+    (tmp_path / "gone.csv").unlink()
+    assert watcher.poll(now=14) == []
+    assert watcher.poll(now=16) == [(tmp_path / "new.csv").resolve()]
+    assert watcher.poll(now=30) == []
+
+
+def test_default_jobs_cover_every_report(tmp_path):
+    jobs = default_jobs(tmp_path)
+    assert {job.report_type for job in jobs} == {"a-b-report", "casino-ret", "awol"}
+    assert all(Path(job.output).parent == tmp_path for job in jobs)
+
+
+def test_run_all_matches_serial_runs(inbox, report_inputs, tmp_path):
+    runner = JobRunner(inbox, default_jobs(tmp_path / "out"))
+    assert len(runner.run_all()) == 3
+    
+    for job in runner.jobs:
+        serial = serial_output(job.report_type, inputs_of(inbox, report_inputs, job.report_type),
+                               tmp_path / f"{job.name}.xlsx")
+        assert sheet_values(Path(job.output)) == sheet_values(serial)
+
+
+def test_appended_rows_rerun_affected_jobs(inbox, report_inputs, tmp_path):
+    state_dir = tmp_path / "state"
+    runner = JobRunner(inbox, default_jobs(tmp_path / "out"), state_dir=state_dir)
+    runner.run_all()
+    
+    changed = inbox / "test_inactive7j19-31.csv"
+    append_rows(changed, 50, 99)
+    assert [job.name for job in runner.run([changed])] == ["awol"]
+    expected = sheet_values(serial_output("awol", inputs_of(inbox, report_inputs, "awol"), tmp_path / "awol.xlsx"))
+    assert sheet_values(tmp_path / "out" / "awol.xlsx") == expected
+    
+    # A restarted runner resumes from the saved watermarks
+    assert list(state_dir.iterdir())
+    restarted = JobRunner(inbox, [job for job in default_jobs(tmp_path / "again") if job.name == "awol"],
+                          state_dir=state_dir)
+    restarted.run_all()
+    assert sheet_values(tmp_path / "again" / "awol.xlsx") == expected
+
+
+def test_job_without_inputs_is_skipped(tmp_path):
+    job = ReportJob(name="ab", report_type="a-b-report", output=str(tmp_path / "ab.xlsx"),
+                    input_patterns=["*missing*.csv"])
+    assert JobRunner(tmp_path, [job]).run_all() == []
+    assert not (tmp_path / "ab.xlsx").exists()
+
+
+def test_unknown_report_type_is_rejected(tmp_path):
+    with pytest.raises(ValueError, match="report type 'nope' not found"):
+        JobRunner(tmp_path, [ReportJob(name="x", report_type="nope", output=str(tmp_path / "x.xlsx"))])
+
+
+def test_cli_watch_once(inbox, tmp_path):
+    jobs_file = tmp_path / "jobs.yaml"
+    jobs_file.write_text(f"jobs:\n  - name: ab\n    report_type: a-b-report\n    output: {tmp_path / 'ab.xlsx'}\n")
+    result = CliRunner().invoke(cli, ["watch", str(inbox), "--jobs", str(jobs_file), "--once",
+                                      "--state-dir", str(tmp_path / "state")])
+    assert result.exit_code == 0, result.output
+    assert f"✅ ab: {tmp_path / 'ab.xlsx'}" in result.output
+    assert (tmp_path / "ab.xlsx").exists()